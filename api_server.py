@@ -11,12 +11,16 @@ def main():
     print(f"Starting SOGON API server on {config.host}:{config.port}")
     print(f"Debug mode: {config.debug}")
     print(f"Access the API documentation at: http://{config.host}:{config.port}/docs")
-    
+    if config.workers > 1 and config.job_store != "redis":
+        print("Warning: multiple workers without SOGON_JOB_STORE=redis will not share job state")
+
+    # uvicorn picks uvloop and httptools automatically when installed (uvicorn[standard])
     uvicorn.run(
         "sogon.api.main:app",
         host=config.host,
         port=config.port,
         reload=config.debug,
+        workers=config.workers,
         log_level=config.log_level.lower()
     )
 
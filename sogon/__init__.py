@@ -3,13 +3,6 @@ SOGON Package
 Package for extracting subtitles from YouTube videos or local audio files
 """
 
-# New architecture (Phase 1 & Phase 2)
-from .services import (
-    AudioServiceImpl,
-    TranscriptionServiceImpl,
-    YouTubeServiceImpl,
-    FileServiceImpl
-)
 from .config import get_settings
 
 __version__ = "1.0.0"
@@ -20,3 +13,18 @@ __all__ = [
     "FileServiceImpl",
     "get_settings",
 ]
+
+# New architecture (Phase 1 & Phase 2) service implementations, resolved lazily
+_SERVICE_EXPORTS = {
+    "AudioServiceImpl",
+    "TranscriptionServiceImpl",
+    "YouTubeServiceImpl",
+    "FileServiceImpl",
+}
+
+
+def __getattr__(name):
+    if name in _SERVICE_EXPORTS:
+        from . import services
+        return getattr(services, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -16,9 +16,32 @@ class APIConfig:
         self.port: int = int(os.getenv("API_PORT", "8000"))
         self.debug: bool = os.getenv("API_DEBUG", "false").lower() == "true"
         self.log_level: str = os.getenv("API_LOG_LEVEL", "INFO")
+        self.workers: int = int(os.getenv("API_WORKERS", "1"))
         
         # SOGON specific settings
         self.base_output_dir: str = os.getenv("SOGON_OUTPUT_DIR", "./result")
+
+        # Job state storage ("file" or "redis")
+        self.job_store: str = os.getenv("SOGON_JOB_STORE", "file").lower()
+        self.redis_url: str = os.getenv("SOGON_REDIS_URL", "redis://localhost:6379/0")
+
+        # Job queue ("memory" or "redis") and whether the API runs its own worker
+        self.queue_backend: str = os.getenv("SOGON_QUEUE_BACKEND", "memory").lower()
+        self.run_worker: bool = os.getenv("SOGON_API_RUN_WORKER", "true").lower() == "true"
+        # Stable per-worker name so a restarted worker requeues the Redis jobs it held
+        self.worker_id: Optional[str] = os.getenv("SOGON_WORKER_ID") or None
+
+        # Finished jobs (and their uploads) are evicted after this many hours; 0 disables
+        self.job_ttl_hours: float = float(os.getenv("SOGON_JOB_TTL_HOURS", "168"))
+        self.job_sweep_interval_seconds: int = int(os.getenv("SOGON_JOB_SWEEP_INTERVAL", "300"))
+
+        # Threads for blocking I/O (uploads, downloads, job files)
+        default_threads = min(32, (os.cpu_count() or 4) * 2)
+        self.thread_pool_size: int = int(os.getenv("SOGON_API_THREADS", str(default_threads)))
+
+        # Internal nginx location mapped to base_output_dir; when set, downloads
+        # are handed to the proxy via X-Accel-Redirect instead of streamed by Python
+        self.accel_redirect_prefix: str = os.getenv("SOGON_ACCEL_REDIRECT_PREFIX", "")
         
     def __repr__(self) -> str:
         return f"APIConfig(host={self.host}, port={self.port}, debug={self.debug})"
@@ -1,22 +1,30 @@
 """FastAPI application for SOGON API server with async job queue"""
 
 import logging
+import os
+import shutil
+import time
 import uuid
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import List, Optional
 from pathlib import Path
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from functools import lru_cache
 import asyncio
 
+from anyio import to_thread
 from fastapi import FastAPI, HTTPException, File, UploadFile, Form, Request
-from fastapi.responses import JSONResponse, FileResponse
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, FileResponse, Response
+from pydantic import BaseModel, TypeAdapter
 
 from .config import config
 from .schemas.requests import CreateJobRequest
 from .schemas.responses import (
     JobCreatedResponse, JobStatusResponse, JobListResponse,
-    ErrorResponse
+    JobProgressInfo, JobResultResponse, JobFileInfo, ErrorResponse
 )
 from ..models.translation import SupportedLanguage
 from ..models.job import ProcessingJob, JobStatus, JobType
@@ -41,6 +49,26 @@ from ..utils.logging import setup_logging
 setup_logging(console_level=config.log_level)
 logger = logging.getLogger(__name__)
 
+# Read size for streaming uploaded files to disk (1 MiB)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _write_upload(source, file_path: Path) -> None:
+    """Copy a spooled upload to disk in fixed-size chunks (blocking).
+
+    Data goes to a ``.part`` file that is renamed into place only once the
+    copy completes, so a failed upload never leaves a truncated input behind.
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = file_path.with_suffix(file_path.suffix + ".part")
+    try:
+        with open(temp_path, "wb") as buffer:
+            shutil.copyfileobj(source, buffer, UPLOAD_CHUNK_SIZE)
+        os.replace(temp_path, file_path)
+    except Exception:
+        temp_path.unlink(missing_ok=True)
+        raise
+
 
 class HealthResponse(BaseModel):
     """Health check response model"""
@@ -66,6 +94,7 @@ class APIServiceContainer:
         self._queue: Optional[JobQueue] = None
         self._worker: Optional[JobWorker] = None
         self._worker_task: Optional[asyncio.Task] = None
+        self._sweeper_task: Optional[asyncio.Task] = None
 
     @property
     def file_repository(self) -> FileRepository:
@@ -104,7 +133,10 @@ class APIServiceContainer:
             self._youtube_service = YouTubeServiceImpl(
                 timeout=self.settings.youtube_socket_timeout,
                 retries=self.settings.youtube_retries,
-                preferred_format=self.settings.youtube_preferred_format
+                preferred_format=self.settings.youtube_preferred_format,
+                concurrent_fragments=self.settings.youtube_concurrent_fragments,
+                cache_dir=self.settings.youtube_cache_dir,
+                cache_max_size_gb=self.settings.youtube_cache_max_size_gb
             )
         return self._youtube_service
 
@@ -114,7 +146,7 @@ class APIServiceContainer:
             from ..services.file_service import FileServiceImpl
             self._file_service = FileServiceImpl(
                 file_repository=self.file_repository,
-                output_base_dir=Path(self.settings.output_base_dir)
+                output_base_dir=self.settings.output_base_dir
             )
         return self._file_service
 
@@ -144,13 +176,33 @@ class APIServiceContainer:
     @property
     def job_repository(self) -> JobRepository:
         if self._job_repository is None:
-            self._job_repository = FileBasedJobRepository()
+            if config.job_store == "redis":
+                from ..repositories.redis_job_repository import RedisJobRepository
+                # Redis expiry is a backstop for deployments where no API
+                # process runs the sweeper; it trails the sweeper by one interval
+                job_ttl_seconds = None
+                if config.job_ttl_hours > 0:
+                    job_ttl_seconds = (
+                        int(config.job_ttl_hours * 3600) + config.job_sweep_interval_seconds
+                    )
+                self._job_repository = RedisJobRepository(
+                    redis_url=config.redis_url,
+                    job_ttl_seconds=job_ttl_seconds
+                )
+            else:
+                self._job_repository = FileBasedJobRepository()
         return self._job_repository
 
     @property
     def queue(self) -> JobQueue:
         if self._queue is None:
-            self._queue = create_queue(backend="memory", max_size=150)
+            if config.queue_backend == "redis":
+                self._queue = create_queue(
+                    backend="redis", max_size=150, redis_url=config.redis_url,
+                    consumer=config.worker_id
+                )
+            else:
+                self._queue = create_queue(backend="memory", max_size=150)
         return self._queue
 
     @property
@@ -182,6 +234,72 @@ class APIServiceContainer:
                 logger.warning("Worker shutdown timed out")
             self._worker_task = None
 
+    async def sweep_expired_jobs(self) -> int:
+        """
+        Delete finished jobs older than the configured TTL.
+
+        Returns:
+            Number of jobs deleted
+        """
+        cutoff = datetime.now() - timedelta(hours=config.job_ttl_hours)
+        deleted_count = 0
+
+        for status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
+            for job in await self.job_repository.get_jobs_by_status(status):
+                if job.completed_at and job.completed_at < cutoff:
+                    if await self.job_repository.delete_job(job.id):
+                        remove_uploaded_file(job)
+                        deleted_count += 1
+
+        if deleted_count > 0:
+            logger.info(f"Swept {deleted_count} expired jobs (>{config.job_ttl_hours}h)")
+
+        return deleted_count
+
+    async def _run_sweeper(self):
+        """Periodically evict expired jobs until cancelled"""
+        while True:
+            await asyncio.sleep(config.job_sweep_interval_seconds)
+            try:
+                await self.sweep_expired_jobs()
+            except Exception as e:
+                logger.error(f"Job sweep failed: {e}")
+
+    def start_sweeper(self):
+        """Start background job sweeper (no-op when the TTL is disabled)"""
+        if self._sweeper_task is None and config.job_ttl_hours > 0:
+            self._sweeper_task = asyncio.create_task(self._run_sweeper())
+
+    async def stop_sweeper(self):
+        """Stop background job sweeper"""
+        if self._sweeper_task is not None:
+            self._sweeper_task.cancel()
+            try:
+                await self._sweeper_task
+            except asyncio.CancelledError:
+                pass
+            self._sweeper_task = None
+
+    async def close(self):
+        """Release connections held by the job repository and queue"""
+        for backend in (self._job_repository, self._queue):
+            close = getattr(backend, "close", None)
+            if close is not None:
+                await close()
+
+
+def remove_uploaded_file(job: ProcessingJob) -> None:
+    """Delete the uploaded input file of a local-file job, if any"""
+    if job.job_type != JobType.LOCAL_FILE:
+        return
+
+    try:
+        file_path = Path(job.input_path)
+        if file_path.exists() and "uploads" in str(file_path):
+            file_path.unlink()
+    except Exception as e:
+        logger.warning(f"Failed to delete uploaded file: {e}")
+
 
 # Service container for dependency injection
 services = APIServiceContainer()
@@ -192,15 +310,29 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     # Startup
     logger.info("Starting SOGON API application...")
-    await services.start_worker()
-    logger.info("Background worker started")
+
+    # Bound the thread pools used for blocking I/O: anyio's limiter covers
+    # Starlette (file responses, sync dependencies), the default executor
+    # covers asyncio.to_thread and run_in_executor
+    to_thread.current_default_thread_limiter().total_tokens = config.thread_pool_size
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=config.thread_pool_size, thread_name_prefix="sogon-io")
+    )
+    if config.run_worker:
+        await services.start_worker()
+        logger.info("Background worker started")
+    else:
+        logger.info("In-process worker disabled; jobs are processed by standalone workers")
+    services.start_sweeper()
 
     yield
 
     # Shutdown
     logger.info("Shutting down SOGON API application...")
+    await services.stop_sweeper()
     await services.stop_worker()
     logger.info("Background worker stopped")
+    await services.close()
 
 
 # FastAPI app instance
@@ -209,38 +341,92 @@ app = FastAPI(
     description="Async subtitle generator API from media URLs or local audio files",
     version="2.0.0",
     debug=config.debug,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Compress job lists and text results; small responses are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+# Validates a whole page of job list entries in a single pydantic-core call
+_JOB_STATUS_LIST_ADAPTER = TypeAdapter(List[JobStatusResponse])
+
+# Content types for downloadable result files, keyed by extension
+_RESULT_MEDIA_TYPES = {
+    ".txt": "text/plain",
+    ".srt": "application/x-subrip",
+    ".vtt": "text/vtt",
+    ".json": "application/json",
+}
+
+# Download file_type -> ProcessingJob attribute holding that result set
+_FILE_TYPE_KEYS = {
+    "original": "original_files",
+    "translated": "translated_files",
+}
+
+# Downloads under this directory can be served by the proxy (X-Accel-Redirect)
+_OUTPUT_ROOT = Path(config.base_output_dir).resolve()
+
+# Static part of the health payload, built once instead of per probe
+_HEALTH_CONFIG = {
+    "host": config.host,
+    "port": config.port,
+    "debug": config.debug,
+    "base_output_dir": config.base_output_dir,
+}
+
+# Worker/repository stats are reused for this long across health probes
+HEALTH_STATS_TTL_SECONDS = 1.0
+_health_stats_cache = {"expires_at": 0.0, "stats": None}
+
+# Second-resolution ISO timestamp, reformatted only when the second changes
+_now_iso_cache = [0, ""]
+
+
+def _now_iso() -> str:
+    """Get the current local time as a second-resolution ISO 8601 string"""
+    epoch = int(time.time())
+    if epoch != _now_iso_cache[0]:
+        _now_iso_cache[0] = epoch
+        _now_iso_cache[1] = datetime.fromtimestamp(epoch).isoformat()
+    return _now_iso_cache[1]
+
 
 def get_base_url(request: Request) -> str:
     """Extract base URL from request"""
     return f"{request.url.scheme}://{request.url.netloc}"
 
 
+@lru_cache(maxsize=32)
+def get_jobs_url(base_url: str) -> str:
+    """Get the jobs collection URL for a base URL, built once per host"""
+    return f"{base_url}/api/v1/jobs"
+
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
     logger.info("Health check requested")
 
     try:
-        # Get repository and worker stats
-        repo_stats = await services.job_repository.get_stats()
-        worker_stats = services.worker.get_stats()
-
-        return HealthResponse(
-            status="healthy",
-            timestamp=datetime.now().isoformat(),
-            version="2.0.0",
-            config={
-                "host": config.host,
-                "port": config.port,
-                "debug": config.debug,
-                "base_output_dir": config.base_output_dir,
-                "worker_status": worker_stats,
-                "repository_stats": repo_stats
+        # Refresh repository and worker stats at most once per TTL window
+        now = time.monotonic()
+        if now >= _health_stats_cache["expires_at"]:
+            _health_stats_cache["stats"] = {
+                "worker_status": services.worker.get_stats(),
+                "repository_stats": await services.job_repository.get_stats()
             }
-        )
+            _health_stats_cache["expires_at"] = now + HEALTH_STATS_TTL_SECONDS
+
+        # Plain dict response: every field is server-built, so skip model validation
+        return ORJSONResponse(content={
+            "status": "healthy",
+            "timestamp": _now_iso(),
+            "version": "2.0.0",
+            "config": {**_HEALTH_CONFIG, **_health_stats_cache["stats"]}
+        })
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         raise HTTPException(status_code=500, detail="Health check failed")
@@ -264,14 +450,14 @@ async def create_job(request: Request, job_request: CreateJobRequest):
     """
     try:
         # Generate job ID
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
 
         # Determine job type and input
         if job_request.url:
             job_type = JobType.YOUTUBE_URL
             input_path = str(job_request.url)
         else:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content=ErrorResponse(
                     error="invalid_input",
@@ -281,7 +467,7 @@ async def create_job(request: Request, job_request: CreateJobRequest):
 
         # Validate whisper_model if provided
         if job_request.whisper_model and not job_request.whisper_model.startswith("whisper"):
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content=ErrorResponse(
                     error="invalid_model",
@@ -295,7 +481,7 @@ async def create_job(request: Request, job_request: CreateJobRequest):
             try:
                 target_lang = SupportedLanguage(job_request.translation_target_language)
             except ValueError:
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=400,
                     content=ErrorResponse(
                         error="invalid_language",
@@ -318,10 +504,11 @@ async def create_job(request: Request, job_request: CreateJobRequest):
             whisper_base_url=str(job_request.whisper_base_url) if job_request.whisper_base_url else None
         )
 
-        # Save to repository
+        # Save to repository (with enqueued timestamp, so a single write covers both)
+        job.mark_enqueued()
         saved = await services.job_repository.save_job(job)
         if not saved:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content=ErrorResponse(
                     error="save_failed",
@@ -330,12 +517,11 @@ async def create_job(request: Request, job_request: CreateJobRequest):
             )
 
         # Enqueue job
-        job.mark_enqueued()
         enqueued = await services.queue.enqueue(job_id)
         if not enqueued:
             # Queue is full
             await services.job_repository.delete_job(job_id)
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=503,
                 content=ErrorResponse(
                     error="queue_full",
@@ -343,9 +529,6 @@ async def create_job(request: Request, job_request: CreateJobRequest):
                 ).model_dump()
             )
 
-        # Save enqueued timestamp
-        await services.job_repository.save_job(job)
-
         logger.info(f"Created and enqueued job {job_id} for {job_type.value}: {input_path}")
 
         # Return 202 Accepted with HATEOAS links
@@ -355,19 +538,19 @@ async def create_job(request: Request, job_request: CreateJobRequest):
             base_url=base_url,
             created_at=job.created_at
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=202,
-            content=response.model_dump(mode='json')
+            content=response.model_dump()
         )
 
     except Exception as e:
         logger.error(f"Failed to create job: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content=ErrorResponse(
                 error="internal_error",
                 detail=str(e)
-            ).model_dump(mode='json')
+            ).model_dump()
         )
 
 
@@ -400,26 +583,23 @@ async def create_job_upload(
     try:
 
         # Generate job ID
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
 
         # Save uploaded file
         upload_dir = Path(config.base_output_dir) / "uploads"
-        upload_dir.mkdir(parents=True, exist_ok=True)
-
         file_path = upload_dir / f"{job_id}_{file.filename}"
 
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        # Copy to disk in a worker thread so large uploads don't block the event loop
+        await asyncio.to_thread(_write_upload, file.file, file_path)
 
         # Parse translation target language
         target_lang = None
         if enable_translation and translation_target_language:
             try:
-                target_lang = SupportedLanguage(translation_target_language)
+                target_lang = SupportedLanguage(translation_target_language.lower())
             except ValueError:
                 file_path.unlink()  # Clean up uploaded file
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=400,
                     content=ErrorResponse(
                         error="invalid_language",
@@ -442,11 +622,12 @@ async def create_job_upload(
             whisper_base_url=whisper_base_url
         )
 
-        # Save to repository
+        # Save to repository (with enqueued timestamp, so a single write covers both)
+        job.mark_enqueued()
         saved = await services.job_repository.save_job(job)
         if not saved:
             file_path.unlink()  # Clean up uploaded file
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content=ErrorResponse(
                     error="save_failed",
@@ -455,13 +636,12 @@ async def create_job_upload(
             )
 
         # Enqueue job
-        job.mark_enqueued()
         enqueued = await services.queue.enqueue(job_id)
         if not enqueued:
             # Queue is full
             await services.job_repository.delete_job(job_id)
             file_path.unlink()  # Clean up uploaded file
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=503,
                 content=ErrorResponse(
                     error="queue_full",
@@ -469,9 +649,6 @@ async def create_job_upload(
                 ).model_dump()
             )
 
-        # Save enqueued timestamp
-        await services.job_repository.save_job(job)
-
         logger.info(f"Created and enqueued job {job_id} for uploaded file: {file.filename}")
 
         # Return 202 Accepted with HATEOAS links
@@ -481,19 +658,19 @@ async def create_job_upload(
             base_url=base_url,
             created_at=job.created_at
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=202,
-            content=response.model_dump(mode='json')
+            content=response.model_dump()
         )
 
     except Exception as e:
         logger.error(f"Failed to create upload job: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content=ErrorResponse(
                 error="internal_error",
                 detail=str(e)
-            ).model_dump(mode='json')
+            ).model_dump()
         )
 
 
@@ -510,56 +687,61 @@ async def get_job_status(request: Request, job_id: str):
     job = await services.job_repository.get_job(job_id)
 
     if not job:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content=ErrorResponse(
                 error="job_not_found",
                 detail=f"Job with ID {job_id} not found",
                 job_id=job_id
-            ).model_dump(mode='json')
+            ).model_dump()
         )
 
+    # Response models below are built from server-side job state, so they skip
+    # validation via model_construct; the response_model check still applies
+
     # Build progress info
     progress_info = None
     if job.progress is not None:
-        progress_info = {
-            "percentage": job.progress,
-            "current_step": job.status.value,
-            "message": job.current_step_description
-        }
+        progress_info = JobProgressInfo.model_construct(
+            percentage=job.progress,
+            current_step=job.status.value,
+            message=job.current_step_description
+        )
 
     # Build result info (only for completed jobs)
     result_info = None
     if job.status == JobStatus.COMPLETED and job.original_files:
-        result_info = {
-            "output_directory": job.actual_output_dir or job.output_directory,
-            "files": [],
-            "translation_performed": job.enable_translation,
-            "processing_duration_seconds": job.duration
-        }
-
-        # Add original files
-        for file_path in job.original_files.values():
-            if Path(file_path).exists():
-                result_info["files"].append({
-                    "type": "subtitle",
-                    "format": job.subtitle_format,
-                    "size_bytes": Path(file_path).stat().st_size
-                })
+        # Add original files (single stat per file; missing files are skipped)
+        files = []
+        for file_type, file_path in job.original_files.items():
+            try:
+                size_bytes = os.stat(file_path).st_size
+            except OSError:
+                continue
+            files.append(JobFileInfo.model_construct(
+                type=file_type,
+                format=Path(file_path).suffix.lstrip("."),
+                size_bytes=size_bytes
+            ))
+
+        result_info = JobResultResponse.model_construct(
+            output_directory=job.actual_output_dir or job.output_directory,
+            files=files,
+            translation_performed=job.enable_translation,
+            processing_duration_seconds=job.duration
+        )
 
     # Build HATEOAS links
-    base_url = get_base_url(request)
-    links = {
-        "self": f"{base_url}/api/v1/jobs/{job_id}"
-    }
+    job_url = get_jobs_url(get_base_url(request)) + "/" + job_id
+    links = {"self": job_url}
 
     if job.status == JobStatus.COMPLETED:
-        links["result"] = f"{base_url}/api/v1/jobs/{job_id}/result"
-        links["download"] = f"{base_url}/api/v1/jobs/{job_id}/download"
+        links["result"] = job_url + "/result"
+        links["download"] = job_url + "/download"
     elif not job.status.is_terminal:
-        links["cancel"] = f"{base_url}/api/v1/jobs/{job_id}"
+        links["cancel"] = job_url
 
-    return JobStatusResponse(
+    return JobStatusResponse.model_construct(
         job_id=job_id,
         status=job.status.value,
         progress=progress_info,
@@ -592,7 +774,7 @@ async def list_jobs(
         try:
             status_filter = JobStatus(status)
         except ValueError:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content=ErrorResponse(
                     error="invalid_status",
@@ -608,8 +790,9 @@ async def list_jobs(
     )
 
     # Convert to response format
-    base_url = get_base_url(request)
-    job_responses = []
+    jobs_url = get_jobs_url(get_base_url(request))
+    job_url_prefix = jobs_url + "/"
+    job_payloads = []
 
     for job in jobs:
         # Build progress info
@@ -622,25 +805,25 @@ async def list_jobs(
             }
 
         # Build links
-        links = {"self": f"{base_url}/api/v1/jobs/{job.id}"}
-
-        job_responses.append(
-            JobStatusResponse(
-                job_id=job.id,
-                status=job.status.value,
-                progress=progress_info,
-                created_at=job.created_at,
-                started_at=job.started_at,
-                completed_at=job.completed_at,
-                result=None,  # Don't include full result in list
-                error=job.error_message if job.status == JobStatus.FAILED else None,
-                links=links
-            )
-        )
+        links = {"self": job_url_prefix + job.id}
+
+        job_payloads.append({
+            "job_id": job.id,
+            "status": job.status.value,
+            "progress": progress_info,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "completed_at": job.completed_at,
+            "result": None,  # Don't include full result in list
+            "error": job.error_message if job.status == JobStatus.FAILED else None,
+            "links": links
+        })
+
+    job_responses = _JOB_STATUS_LIST_ADAPTER.validate_python(job_payloads)
 
     # Build pagination links
     links = {
-        "self": f"{base_url}/api/v1/jobs?limit={limit}&offset={offset}"
+        "self": f"{jobs_url}?limit={limit}&offset={offset}"
     }
 
     if status:
@@ -648,11 +831,12 @@ async def list_jobs(
 
     if offset + limit < len(job_responses):
         next_offset = offset + limit
-        links["next"] = f"{base_url}/api/v1/jobs?limit={limit}&offset={next_offset}"
+        links["next"] = f"{jobs_url}?limit={limit}&offset={next_offset}"
         if status:
             links["next"] += f"&status={status}"
 
-    return JobListResponse(
+    # Entries were validated in bulk above
+    return JobListResponse.model_construct(
         jobs=job_responses,
         total=len(job_responses),
         limit=limit,
@@ -673,13 +857,13 @@ async def delete_job(job_id: str):
     job = await services.job_repository.get_job(job_id)
 
     if not job:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content=ErrorResponse(
                 error="job_not_found",
                 detail=f"Job with ID {job_id} not found",
                 job_id=job_id
-            ).model_dump(mode='json')
+            ).model_dump()
         )
 
     # Mark as cancelled if not terminal
@@ -697,13 +881,7 @@ async def delete_job(job_id: str):
         await services.job_repository.delete_job(job_id)
 
         # Clean up uploaded file if exists
-        if job.job_type == JobType.LOCAL_FILE:
-            try:
-                file_path = Path(job.input_path)
-                if file_path.exists() and "uploads" in str(file_path):
-                    file_path.unlink()
-            except Exception as e:
-                logger.warning(f"Failed to delete uploaded file: {e}")
+        remove_uploaded_file(job)
 
         logger.info(f"Deleted job {job_id}")
         return {"message": "Job deleted successfully"}
@@ -712,6 +890,13 @@ async def delete_job(job_id: str):
 @app.get("/api/v1/jobs/{job_id}/download")
 async def download_result(job_id: str, file_type: str = "original"):
     """Download transcription result files"""
+    files_attr = _FILE_TYPE_KEYS.get(file_type)
+    if files_attr is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file_type: {file_type} (expected one of: {', '.join(_FILE_TYPE_KEYS)})"
+        )
+
     job = await services.job_repository.get_job(job_id)
 
     if not job:
@@ -720,22 +905,66 @@ async def download_result(job_id: str, file_type: str = "original"):
     if job.status != JobStatus.COMPLETED:
         raise HTTPException(status_code=400, detail="Job not completed yet")
 
-    # Get file path
-    file_path = None
-    if file_type == "original" and job.original_files:
-        # Get subtitle file
-        file_path = job.original_files.get("subtitle") or job.original_files.get("transcript")
-    elif file_type == "translated" and job.translated_files:
-        # Get translated subtitle file
-        file_path = job.translated_files[0] if job.translated_files else None
+    # Get subtitle file from the requested result set
+    files = getattr(job, files_attr) or {}
+    file_path = files.get("subtitle") or files.get("transcript")
+    if not file_path:
+        raise HTTPException(status_code=404, detail="Requested file not available")
+
+    path = Path(file_path)
+    media_type = _RESULT_MEDIA_TYPES.get(path.suffix.lower(), "application/octet-stream")
 
-    if not file_path or not Path(file_path).exists():
+    # Behind nginx, let the proxy send the file from the mapped output directory
+    if config.accel_redirect_prefix:
+        accel_response = _accel_redirect_response(path, media_type)
+        if accel_response is not None:
+            return accel_response
+
+    # Stat once here and hand the result to FileResponse so it doesn't stat again
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
         raise HTTPException(status_code=404, detail="Requested file not available")
 
     return FileResponse(
         path=file_path,
-        filename=Path(file_path).name,
-        media_type="text/plain"
+        filename=path.name,
+        media_type=media_type,
+        stat_result=stat_result
+    )
+
+
+def _accel_redirect_response(path: Path, media_type: str) -> Optional[Response]:
+    """
+    Build an X-Accel-Redirect response for a result file.
+
+    Args:
+        path: Result file path
+        media_type: Content type to report to the client
+
+    Returns:
+        Empty response carrying the redirect header, or None if the file
+        lies outside the output directory the proxy maps
+    """
+    try:
+        relative_path = path.resolve().relative_to(_OUTPUT_ROOT)
+    except ValueError:
+        return None
+
+    # Same Content-Disposition encoding as FileResponse
+    filename = quote(path.name)
+    if filename != path.name:
+        content_disposition = f"attachment; filename*=utf-8''{filename}"
+    else:
+        content_disposition = f'attachment; filename="{path.name}"'
+
+    prefix = config.accel_redirect_prefix.rstrip("/")
+    return Response(
+        media_type=media_type,
+        headers={
+            "X-Accel-Redirect": f"{prefix}/{quote(relative_path.as_posix())}",
+            "Content-Disposition": content_disposition
+        }
     )
 
 
@@ -765,7 +994,7 @@ async def root():
 @app.exception_handler(Exception)
 async def general_exception_handler(_, exc):
     logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
@@ -779,5 +1008,6 @@ if __name__ == "__main__":
         host=config.host,
         port=config.port,
         reload=config.debug,
+        workers=config.workers,
         log_level=config.log_level.lower()
     )
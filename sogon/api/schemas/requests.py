@@ -1,6 +1,6 @@
 """API request schemas using Pydantic."""
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, Field, HttpUrl, model_validator
 from typing import Optional, Literal
 
 
@@ -52,13 +52,16 @@ class CreateJobRequest(BaseModel):
         description="Custom Whisper API base URL (None = use default)"
     )
 
-    @field_validator('translation_target_language')
-    @classmethod
-    def validate_translation_language(cls, v: Optional[str], info) -> Optional[str]:
-        """Validate that translation_target_language is provided when translation is enabled."""
-        if info.data.get('enable_translation') and not v:
+    @model_validator(mode="after")
+    def validate_languages(self) -> "CreateJobRequest":
+        """Require a target language when translation is enabled and normalize language codes."""
+        if self.enable_translation and not self.translation_target_language:
             raise ValueError('translation_target_language is required when enable_translation is True')
-        return v
+        if self.translation_target_language:
+            self.translation_target_language = self.translation_target_language.lower()
+        if self.whisper_source_language:
+            self.whisper_source_language = self.whisper_source_language.lower()
+        return self
 
     class Config:
         json_schema_extra = {
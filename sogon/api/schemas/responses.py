@@ -47,14 +47,16 @@ class JobCreatedResponse(BaseModel):
         Returns:
             JobCreatedResponse instance
         """
-        return JobCreatedResponse(
+        job_url = f"{base_url}/api/v1/jobs/{job_id}"
+        # All fields are server-generated, so skip validation
+        return JobCreatedResponse.model_construct(
             job_id=job_id,
             status="pending",
             created_at=created_at,
             links={
-                "self": f"{base_url}/api/v1/jobs/{job_id}",
-                "status": f"{base_url}/api/v1/jobs/{job_id}",
-                "cancel": f"{base_url}/api/v1/jobs/{job_id}",
+                "self": job_url,
+                "status": job_url,
+                "cancel": job_url,
             }
         )
 
@@ -252,3 +254,9 @@ class ErrorResponse(BaseModel):
     detail: str = Field(..., description="Human-readable error message")
     job_id: Optional[str] = Field(None, description="Related job ID (if applicable)")
     timestamp: datetime = Field(default_factory=datetime.now, description="Error timestamp")
+
+
+# Resolve the forward reference to JobResultResponse at import time
+# instead of on the first request that validates a status response
+JobStatusResponse.model_rebuild()
+JobListResponse.model_rebuild()
@@ -5,20 +5,23 @@ Uses the new Phase 1 & Phase 2 architecture with services and dependency injecti
 """
 
 import asyncio
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 import typer
 from typing_extensions import Annotated
 
 # Import new architecture components
-from sogon.config import get_settings
+from sogon.config import Settings, get_settings, TranscriptionProvider
 from sogon.config.user_config import get_user_config_manager
 from sogon.services.interfaces import (
     AudioService, TranscriptionService,
     YouTubeService, FileService, WorkflowService, TranslationService
 )
-from sogon.services.audio_service import AudioServiceImpl
-from sogon.services.transcription_service import TranscriptionServiceImpl
 from sogon.services.workflow_service import WorkflowServiceImpl
 from sogon.repositories.interfaces import FileRepository
 from sogon.repositories.file_repository import FileRepositoryImpl
@@ -31,87 +34,154 @@ from sogon.utils.provider_factory import get_transcription_provider as get_provi
 logger = get_logger(__name__)
 
 
+
+class OutputFormat(str, Enum):
+    """Subtitle output formats accepted by --format"""
+
+    TXT = "txt"
+    SRT = "srt"
+    VTT = "vtt"
+    JSON = "json"
+
+
+class LogLevel(str, Enum):
+    """Logging levels accepted by --log-level"""
+
+    DEBUG = "DEBUG"
+    INFO = "INFO"
+    WARNING = "WARNING"
+    ERROR = "ERROR"
+
+
+_VALID_FORMATS = frozenset(output_format.value for output_format in OutputFormat)
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create an event loop, using uvloop when it is installed.
+
+    uvloop ships with uvicorn[standard] on Linux and macOS; other platforms
+    get the default loop. The global event loop policy is left untouched.
+
+    Returns:
+        New event loop
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def set_default_executor(loop: asyncio.AbstractEventLoop, max_workers: int) -> None:
+    """
+    Bound the loop's default executor (used by asyncio.to_thread and run_in_executor)
+    instead of asyncio's min(32, cpu_count + 4) threads.
+
+    Args:
+        loop: Event loop created for the CLI process
+        max_workers: Maximum number of executor threads
+    """
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sogon-io")
+    )
+
+
+def close_event_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Cancel leftover tasks, shut down async generators and the default executor,
+    then close the loop (the cleanup asyncio.run performs on exit).
+
+    Args:
+        loop: Event loop created for the CLI process
+    """
+    if loop.is_closed():
+        return
+    try:
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
 class ServiceContainer:
     """Dependency injection container for services"""
 
-    def __init__(self):
-        self.settings = get_settings()
-        self._file_repository: Optional[FileRepository] = None
-        self._audio_service: Optional[AudioService] = None
-        self._transcription_service: Optional[TranscriptionService] = None
-        self._youtube_service: Optional[YouTubeService] = None
-        self._file_service: Optional[FileService] = None
-        self._translation_service: Optional[TranslationService] = None
-        self._workflow_service: Optional[WorkflowService] = None
+    def __init__(self, settings: Optional[Settings] = None):
+        self.settings = settings if settings is not None else get_settings()
         self._transcription_provider = None
-    
-    @property
+        # None is a valid result (API providers), so track resolution separately
+        self._transcription_provider_resolved = False
+
+    # Services are created on first access and cached on the instance
+    @cached_property
     def file_repository(self) -> FileRepository:
-        if self._file_repository is None:
-            self._file_repository = FileRepositoryImpl()
-        return self._file_repository
-    
-    @property
+        return FileRepositoryImpl()
+
+    @cached_property
     def audio_service(self) -> AudioService:
-        if self._audio_service is None:
-            self._audio_service = AudioServiceImpl(
-                max_workers=self.settings.max_workers
-            )
-        return self._audio_service
-    
-    @property
+        # Resolved lazily by the package on first access
+        from sogon.services import AudioServiceImpl
+        return AudioServiceImpl(
+            max_workers=self.settings.max_workers
+        )
+
+    @cached_property
     def transcription_service(self) -> TranscriptionService:
-        if self._transcription_service is None:
-            # Use shared provider factory
-            provider = get_provider(self.settings)
-            self._transcription_service = TranscriptionServiceImpl(
-                max_workers=self.settings.max_workers,
-                provider=provider
-            )
-        return self._transcription_service
-    
-    @property
+        # Resolved lazily by the package on first access
+        from sogon.services import TranscriptionServiceImpl
+        # Share the provider instance so a preloaded model is reused
+        return TranscriptionServiceImpl(
+            max_workers=self.settings.max_workers,
+            provider=self.get_transcription_provider()
+        )
+
+    @cached_property
     def youtube_service(self) -> YouTubeService:
-        if self._youtube_service is None:
-            # Import here to avoid circular imports
-            from sogon.services.youtube_service import YouTubeServiceImpl
-            self._youtube_service = YouTubeServiceImpl(
-                timeout=self.settings.youtube_socket_timeout,
-                retries=self.settings.youtube_retries,
-                preferred_format=self.settings.youtube_preferred_format
-            )
-        return self._youtube_service
-    
-    @property
+        # Resolved lazily by the package on first access
+        from sogon.services import YouTubeServiceImpl
+        return YouTubeServiceImpl(
+            timeout=self.settings.youtube_socket_timeout,
+            retries=self.settings.youtube_retries,
+            preferred_format=self.settings.youtube_preferred_format,
+            concurrent_fragments=self.settings.youtube_concurrent_fragments,
+            cache_dir=self.settings.youtube_cache_dir,
+            cache_max_size_gb=self.settings.youtube_cache_max_size_gb
+        )
+
+    @cached_property
     def file_service(self) -> FileService:
-        if self._file_service is None:
-            # Import here to avoid circular imports
-            from sogon.services.file_service import FileServiceImpl
-            self._file_service = FileServiceImpl(
-                file_repository=self.file_repository,
-                output_base_dir=Path(self.settings.output_base_dir)
-            )
-        return self._file_service
-    
-    @property
+        # Resolved lazily by the package on first access
+        from sogon.services import FileServiceImpl
+        return FileServiceImpl(
+            file_repository=self.file_repository,
+            output_base_dir=self.settings.output_base_dir
+        )
+
+    @cached_property
     def translation_service(self) -> TranslationService:
-        if self._translation_service is None:
-            # Import here to avoid circular imports
-            from sogon.services.translation_service import TranslationServiceImpl
-            self._translation_service = TranslationServiceImpl()
-        return self._translation_service
-    
-    @property
+        # Resolved lazily by the package on first access
+        from sogon.services import TranslationServiceImpl
+        return TranslationServiceImpl()
+
+    @cached_property
     def workflow_service(self) -> WorkflowService:
-        if self._workflow_service is None:
-            self._workflow_service = WorkflowServiceImpl(
-                audio_service=self.audio_service,
-                transcription_service=self.transcription_service,
-                youtube_service=self.youtube_service,
-                file_service=self.file_service,
-                translation_service=self.translation_service
-            )
-        return self._workflow_service
+        return WorkflowServiceImpl(
+            audio_service=self.audio_service,
+            transcription_service=self.transcription_service,
+            youtube_service=self.youtube_service,
+            file_service=self.file_service,
+            translation_service=self.translation_service
+        )
 
     def get_transcription_provider(self):
         """
@@ -126,11 +196,26 @@ class ServiceContainer:
         Raises:
             ProviderNotAvailableError: When provider dependencies missing
         """
-        if self._transcription_provider is None:
+        if not self._transcription_provider_resolved:
             self._transcription_provider = get_provider(self.settings)
+            self._transcription_provider_resolved = True
         return self._transcription_provider
 
 
+@lru_cache()
+def get_container() -> ServiceContainer:
+    """
+    Get the process-wide service container.
+
+    Sub-commands run in the same process share one container, so settings
+    loading and service construction happen once.
+
+    Returns:
+        ServiceContainer: Cached container instance
+    """
+    return ServiceContainer()
+
+
 async def process_input(
     input_path: str,
     services: ServiceContainer,
@@ -138,7 +223,7 @@ async def process_input(
     keep_audio: bool = False,
     output_dir: Optional[str] = None,
     enable_translation: bool = False,
-    translation_target_language: Optional[str] = None,
+    translation_target_language: Optional[SupportedLanguage] = None,
     whisper_source_language: Optional[str] = None,
     whisper_model: Optional[str] = None,
     whisper_base_url: Optional[str] = None
@@ -153,7 +238,7 @@ async def process_input(
         keep_audio: Keep downloaded audio files
         output_dir: Custom output directory
         enable_translation: Enable translation
-        translation_target_language: Target language for translation
+        translation_target_language: Parsed target language for translation
         whisper_source_language: Source language for Whisper transcription (auto-detect if None)
         whisper_model: Whisper model to use for transcription
         whisper_base_url: Whisper API base URL for transcription
@@ -161,22 +246,31 @@ async def process_input(
     Returns:
         bool: True if processing succeeded
     """
+    preload_task = None
     try:
-        # Determine output directory
-        base_output_dir = Path(output_dir) if output_dir else Path(services.settings.output_base_dir)
-        
-        # Parse translation target language
-        target_lang = None
-        if enable_translation and translation_target_language:
-            try:
-                target_lang = SupportedLanguage(translation_target_language)
-            except ValueError:
-                logger.error(f"Unsupported translation language: {translation_target_language}")
+        settings = services.settings
+
+        # Check if input is URL or local file
+        is_url = services.youtube_service.is_valid_url(input_path)
+        if not is_url:
+            file_path = Path(input_path)
+            if not file_path.exists():
+                logger.error("File not found: %s", file_path)
                 return False
+
+        # Load local model weights while the audio is downloaded/prepared, once
+        # the input is known to be usable (awaited on success, cancelled in the
+        # finally block otherwise)
+        provider = services.get_transcription_provider()
+        preload_task = asyncio.ensure_future(provider.preload()) if provider else None
+
+        # Determine output directory
+        base_output_dir = Path(output_dir) if output_dir else settings.output_base_dir
         
-        # Check if input is URL or local file
-        if services.youtube_service.is_valid_url(input_path):
-            logger.info(f"Processing YouTube URL: {input_path}")
+        target_lang = translation_target_language if enable_translation else None
+
+        if is_url:
+            logger.info("Processing YouTube URL: %s", input_path)
             job = await services.workflow_service.process_youtube_url(
                 url=input_path,
                 output_dir=base_output_dir,
@@ -190,12 +284,7 @@ async def process_input(
             )
         else:
             # Local file processing
-            file_path = Path(input_path)
-            if not file_path.exists():
-                logger.error(f"File not found: {file_path}")
-                return False
-
-            logger.info(f"Processing local file: {file_path}")
+            logger.info("Processing local file: %s", file_path)
             job = await services.workflow_service.process_local_file(
                 file_path=file_path,
                 output_dir=base_output_dir,
@@ -209,36 +298,122 @@ async def process_input(
             )
         
         # Wait for job completion (with timeout)
-        max_wait_seconds = services.settings.max_processing_timeout_seconds
-        wait_seconds = 0
-        
-        while wait_seconds < max_wait_seconds:
-            status = await services.workflow_service.get_job_status(job.id)
-            
-            if status == JobStatus.COMPLETED:
-                logger.info("Processing completed successfully!")
-                logger.info(f"Output directory: {job.actual_output_dir}")
-                return True
-            elif status == JobStatus.FAILED:
-                logger.error(f"Processing failed: {job.error_message}")
-                return False
-            elif status == JobStatus.NOT_FOUND:
-                logger.error("Job not found")
-                return False
-            
-            # Wait and check again
-            await asyncio.sleep(2)
-            wait_seconds += 2
-        
-        logger.error("Processing timed out")
+        try:
+            status = await asyncio.wait_for(
+                services.workflow_service.wait_for_job(job.id),
+                timeout=settings.max_processing_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            logger.error("Processing timed out")
+            return False
+
+        if status == JobStatus.COMPLETED:
+            if preload_task is not None:
+                # preload() logs its own failures instead of raising
+                await preload_task
+            logger.info("Processing completed successfully!")
+            logger.info("Output directory: %s", job.actual_output_dir)
+            return True
+        elif status == JobStatus.FAILED:
+            logger.error("Processing failed: %s", job.error_message)
+            return False
+
+        logger.error("Job not found")
         return False
         
     except SogonError as e:
-        logger.error(f"SOGON error: {e}")
+        logger.error("SOGON error: %s", e)
         return False
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         return False
+    finally:
+        if preload_task is not None and not preload_task.done():
+            preload_task.cancel()
+
+
+async def process_batch(
+    inputs: List[str],
+    services: ServiceContainer,
+    concurrency: int = 4,
+    **options
+) -> List[Tuple[str, bool]]:
+    """
+    Process multiple inputs with a bounded pool of concurrent workers
+
+    A producer feeds inputs into a bounded queue that ``concurrency`` workers
+    drain, so downloads of later inputs overlap with transcription of
+    earlier ones while the queue applies backpressure.
+
+    Args:
+        inputs: YouTube URLs or local file paths
+        services: Service container with all dependencies
+        concurrency: Number of inputs processed at the same time
+        **options: Processing options passed through to process_input
+
+    Returns:
+        List of (input, success) pairs in input order
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+    results: List[Optional[bool]] = [None] * len(inputs)
+
+    async def produce():
+        for index, input_path in enumerate(inputs):
+            await queue.put((index, input_path))
+        # One sentinel per worker to shut the pool down
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def work():
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            index, input_path = item
+            results[index] = await process_input(input_path=input_path, services=services, **options)
+
+    await asyncio.gather(produce(), *(work() for _ in range(concurrency)))
+    return list(zip(inputs, results))
+
+
+def _read_batch_inputs(inputs_file: Path) -> List[str]:
+    """Read one input per line, skipping blank lines and # comments"""
+    inputs = []
+    for line in inputs_file.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            inputs.append(line)
+    return inputs
+
+
+def _validate_options(format: str, translate: bool, target_language: Optional[str]) -> Optional[SupportedLanguage]:
+    """
+    Validate output format and translation options, exiting on error
+
+    Returns:
+        Parsed target language when translation is enabled, otherwise None
+    """
+    # --format is checked by click; this catches a bad default_subtitle_format in user config
+    if format not in _VALID_FORMATS:
+        typer.echo(f"Error: Invalid format '{format}'. Choose from: {', '.join(sorted(_VALID_FORMATS))}", err=True)
+        raise typer.Exit(1)
+
+    # Validate translation options
+    if not translate:
+        return None
+
+    if not target_language:
+        typer.echo("Error: --target-language is required when --translate is enabled", err=True)
+        typer.echo("Use 'sogon list-languages' to see supported languages")
+        raise typer.Exit(1)
+
+    # Validate target language
+    try:
+        return SupportedLanguage(target_language)
+    except ValueError:
+        typer.echo(f"Error: Unsupported target language: {target_language}", err=True)
+        typer.echo("Use 'sogon list-languages' to see supported languages")
+        raise typer.Exit(1)
 
 
 app = typer.Typer(
@@ -252,6 +427,9 @@ app = typer.Typer(
   sogon run "audio.mp3" --format srt
   sogon run "video.mp4" --output-dir ./results
 
+  # Batch processing (one URL or file path per line)
+  sogon run-batch inputs.txt --concurrency 4 --format srt
+
   # Translation
   sogon run "video.mp4" --translate --target-language ko
 
@@ -266,10 +444,21 @@ app = typer.Typer(
 )
 
 
+@app.callback()
+def _bootstrap(ctx: typer.Context):
+    """SOGON - AI-powered subtitle generator from YouTube URLs or local audio files"""
+    # One event loop for the process lifetime, shared by every sub-command
+    loop = new_event_loop()
+    asyncio.set_event_loop(loop)
+    ctx.obj = loop
+    ctx.call_on_close(lambda: close_event_loop(loop))
+
+
 @app.command("run")
 def process(
+    ctx: typer.Context,
     input_path: Annotated[str, typer.Argument(help="YouTube URL or local audio/video file path")],
-    format: Annotated[Optional[str], typer.Option("--format", "-f", help="Output subtitle format (txt, srt, vtt, json)")] = None,
+    format: Annotated[Optional[OutputFormat], typer.Option("--format", "-f", help="Output subtitle format")] = None,
     output_dir: Annotated[Optional[str], typer.Option("--output-dir", "-o", help="Output directory (default: ./result)")] = None,
     keep_audio: Annotated[bool, typer.Option("--keep-audio", help="Keep downloaded audio files")] = False,
     translate: Annotated[bool, typer.Option("--translate", help="Enable translation of subtitles")] = False,
@@ -287,7 +476,7 @@ def process(
     local_temperature: Annotated[Optional[float], typer.Option("--local-temperature", help="Temperature for local model inference (0.0-1.0)")] = None,
     local_vad_filter: Annotated[bool, typer.Option("--local-vad-filter", help="Enable VAD filter for local model")] = False,
     local_max_workers: Annotated[Optional[int], typer.Option("--local-max-workers", help="Max concurrent workers for local model (1-10)")] = None,
-    log_level: Annotated[str, typer.Option("--log-level", help="Logging level")] = "INFO"
+    log_level: Annotated[LogLevel, typer.Option("--log-level", help="Logging level")] = LogLevel.INFO
 ):
     """Process video/audio file for subtitle generation"""
 
@@ -295,59 +484,43 @@ def process(
     user_config = get_user_config_manager()
     if format is None:
         format = user_config.get_effective_value("default_subtitle_format")
+    else:
+        format = format.value
+    log_level = log_level.value
+
+    target = _validate_options(format, translate, target_language)
 
-    # Validate format
-    if format not in ["txt", "srt", "vtt", "json"]:
-        typer.echo(f"Error: Invalid format '{format}'. Choose from: txt, srt, vtt, json", err=True)
-        raise typer.Exit(1)
-    
-    # Validate log level
-    if log_level not in ["DEBUG", "INFO", "WARNING", "ERROR"]:
-        typer.echo(f"Error: Invalid log level '{log_level}'. Choose from: DEBUG, INFO, WARNING, ERROR", err=True)
-        raise typer.Exit(1)
-    
     # Setup logging
     setup_logging(console_level=log_level, file_level=log_level)
     
     typer.echo("SOGON - Subtitle Generator (Refactored Architecture)")
     typer.echo("=" * 60)
     
-    # Validate translation options
-    if translate:
-        if not target_language:
-            typer.echo("Error: --target-language is required when --translate is enabled", err=True)
-            typer.echo("Use 'sogon list-languages' to see supported languages")
-            raise typer.Exit(1)
-        
-        # Validate target language
-        try:
-            SupportedLanguage(target_language)
-        except ValueError:
-            typer.echo(f"Error: Unsupported target language: {target_language}", err=True)
-            typer.echo("Use 'sogon list-languages' to see supported languages")
-            raise typer.Exit(1)
-    
-    # Initialize service container
-    services = ServiceContainer()
-
     # Override local model settings if CLI flags provided (FR-019)
     # Must happen BEFORE provider check
+    overrides: Dict[str, Any] = {}
     if local_model:
-        services.settings.local_model_name = local_model
+        overrides["local_model_name"] = local_model
         # Auto-switch to local provider when --local-model is used (FR-016)
-        services.settings.transcription_provider = "stable-whisper"
+        overrides["transcription_provider"] = TranscriptionProvider.STABLE_WHISPER
     if local_device:
-        services.settings.local_device = local_device
+        overrides["local_device"] = local_device
     if local_compute_type:
-        services.settings.local_compute_type = local_compute_type
+        overrides["local_compute_type"] = local_compute_type
     if local_beam_size:
-        services.settings.local_beam_size = local_beam_size
+        overrides["local_beam_size"] = local_beam_size
     if local_temperature is not None:
-        services.settings.local_temperature = local_temperature
+        overrides["local_temperature"] = local_temperature
     if local_vad_filter:
-        services.settings.local_vad_filter = local_vad_filter
+        overrides["local_vad_filter"] = local_vad_filter
     if local_max_workers:
-        services.settings.local_max_workers = local_max_workers
+        overrides["local_max_workers"] = local_max_workers
+    if overrides:
+        # Build a private container so the overrides don't leak into the shared
+        # one (whose provider and services are already bound to its settings)
+        services = ServiceContainer(get_settings().model_copy(update=overrides))
+    else:
+        services = get_container()
 
     # Task 26: Provider availability check (FR-025, FR-026)
     try:
@@ -364,19 +537,24 @@ def process(
         raise typer.Exit(1)
 
     # Log configuration
-    logger.info(f"Input: {input_path}")
-    logger.info(f"Format: {format.upper()}")
-    logger.info(f"Keep audio: {'yes' if keep_audio else 'no'}")
-    if translate:
-        logger.info(f"Translation: → {target_language}")
-    else:
-        logger.info("Translation: disabled")
-    logger.info(f"Whisper source language: {source_language or 'auto'}")
-    logger.info("-" * 60)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Input: {input_path}")
+        logger.info(f"Format: {format.upper()}")
+        logger.info(f"Keep audio: {'yes' if keep_audio else 'no'}")
+        if translate:
+            logger.info(f"Translation: → {target_language}")
+        else:
+            logger.info("Translation: disabled")
+        logger.info(f"Whisper source language: {source_language or 'auto'}")
+        logger.info("-" * 60)
     
+    loop: asyncio.AbstractEventLoop = ctx.obj
+    logger.debug("Using %s event loop", type(loop).__module__)
+    set_default_executor(loop, services.settings.max_workers)
+
     try:
         # Process input
-        success = asyncio.run(
+        success = loop.run_until_complete(
             process_input(
                 input_path=input_path,
                 services=services,
@@ -384,7 +562,7 @@ def process(
                 keep_audio=keep_audio,
                 output_dir=output_dir,
                 enable_translation=translate,
-                translation_target_language=target_language,
+                translation_target_language=target,
                 whisper_source_language=source_language,
                 whisper_model=whisper_model,
                 whisper_base_url=whisper_base_url
@@ -405,6 +583,81 @@ def process(
         raise typer.Exit(1)
 
 
+@app.command("run-batch")
+def process_batch_command(
+    ctx: typer.Context,
+    inputs_file: Annotated[Path, typer.Argument(help="Text file with one YouTube URL or local file path per line")],
+    concurrency: Annotated[int, typer.Option("--concurrency", "-c", min=1, max=16, help="Number of inputs processed concurrently")] = 4,
+    format: Annotated[Optional[OutputFormat], typer.Option("--format", "-f", help="Output subtitle format")] = None,
+    output_dir: Annotated[Optional[str], typer.Option("--output-dir", "-o", help="Output directory (default: ./result)")] = None,
+    keep_audio: Annotated[bool, typer.Option("--keep-audio", help="Keep downloaded audio files")] = False,
+    translate: Annotated[bool, typer.Option("--translate", help="Enable translation of subtitles")] = False,
+    target_language: Annotated[Optional[str], typer.Option("--target-language", "-t", help="Target language for translation (e.g., ko, en, ja, zh-cn)")] = None,
+    source_language: Annotated[Optional[str], typer.Option("--source-language", "-s", help="Source language for Whisper transcription (auto-detect if not specified)")] = None,
+    whisper_model: Annotated[Optional[str], typer.Option("--whisper-model", "-m", help="Whisper model to use (default: whisper-1)")] = None,
+    whisper_base_url: Annotated[Optional[str], typer.Option("--whisper-base-url", help="Whisper API base URL (default: OpenAI API)")] = None,
+    log_level: Annotated[LogLevel, typer.Option("--log-level", help="Logging level")] = LogLevel.INFO
+):
+    """Process multiple video/audio inputs listed in a file"""
+
+    # Apply user config defaults
+    if format is None:
+        format = get_user_config_manager().get_effective_value("default_subtitle_format")
+    else:
+        format = format.value
+    log_level = log_level.value
+
+    target = _validate_options(format, translate, target_language)
+
+    if not inputs_file.is_file():
+        typer.echo(f"Error: Inputs file not found: {inputs_file}", err=True)
+        raise typer.Exit(1)
+
+    inputs = _read_batch_inputs(inputs_file)
+    if not inputs:
+        typer.echo(f"Error: No inputs found in {inputs_file}", err=True)
+        raise typer.Exit(1)
+
+    # Setup logging
+    setup_logging(console_level=log_level, file_level=log_level)
+
+    typer.echo(f"SOGON - Batch processing {len(inputs)} inputs (concurrency: {concurrency})")
+    typer.echo("=" * 60)
+
+    services = get_container()
+
+    loop: asyncio.AbstractEventLoop = ctx.obj
+    logger.debug("Using %s event loop", type(loop).__module__)
+    set_default_executor(loop, max(services.settings.max_workers, concurrency))
+
+    try:
+        results = loop.run_until_complete(
+            process_batch(
+                inputs=inputs,
+                services=services,
+                concurrency=concurrency,
+                output_format=format,
+                keep_audio=keep_audio,
+                output_dir=output_dir,
+                enable_translation=translate,
+                translation_target_language=target,
+                whisper_source_language=source_language,
+                whisper_model=whisper_model,
+                whisper_base_url=whisper_base_url
+            )
+        )
+    except KeyboardInterrupt:
+        typer.echo("\nInterrupted by user", color=typer.colors.YELLOW)
+        raise typer.Exit(130)
+
+    failed = [input_path for input_path, success in results if not success]
+    typer.echo(f"Completed {len(results) - len(failed)}/{len(results)} inputs")
+    if failed:
+        for input_path in failed:
+            typer.echo(f"  Failed: {input_path}", err=True)
+        raise typer.Exit(1)
+
+
 @app.command("list-languages")
 def list_languages():
     """List supported translation languages"""
@@ -446,7 +699,7 @@ def config_get(
         
         for k, info in CONFIGURABLE_KEYS.items():
             user_value = manager.get(k)
-            default = info["default"]
+            default = info.default
 
             if user_value is not None:
                 display_value = str(user_value)
@@ -460,8 +713,8 @@ def config_get(
 
             # Verbose mode: show choices/range
             if verbose:
-                if "choices" in info:
-                    choices = info["choices"]
+                if info.choices is not None:
+                    choices = info.choices
                     choice_display = []
                     for c in choices:
                         if str(c).lower() == display_value.lower():
@@ -469,9 +722,9 @@ def config_get(
                         else:
                             choice_display.append(str(c))
                     typer.echo(f"    └─ {', '.join(choice_display)}")
-                elif "min" in info or "max" in info:
-                    min_val = info.get("min", "")
-                    max_val = info.get("max", "")
+                elif info.min is not None or info.max is not None:
+                    min_val = "" if info.min is None else info.min
+                    max_val = "" if info.max is None else info.max
                     typer.echo(f"    └─ Range: {min_val} ~ {max_val}")
 
         typer.echo("")
@@ -488,14 +741,14 @@ def config_get(
                 display_value = user_value
                 source = ""
             else:
-                display_value = info["default"]
+                display_value = info.default
                 source = " (default)"
             
             typer.echo(f"{key}={display_value}{source}")
             
             # Always show options for specific key lookup
-            if "choices" in info:
-                choices = info["choices"]
+            if info.choices is not None:
+                choices = info.choices
                 choice_display = []
                 for c in choices:
                     if str(c).lower() == str(display_value).lower():
@@ -503,9 +756,9 @@ def config_get(
                     else:
                         choice_display.append(str(c))
                 typer.echo(f"Options: {', '.join(choice_display)}")
-            elif "min" in info or "max" in info:
-                min_val = info.get("min", "")
-                max_val = info.get("max", "")
+            elif info.min is not None or info.max is not None:
+                min_val = "" if info.min is None else info.min
+                max_val = "" if info.max is None else info.max
                 typer.echo(f"Range: {min_val} ~ {max_val}")
                 
         except KeyError as e:
@@ -534,13 +787,13 @@ def config_set(
         typer.echo(f"Error: {e}", err=True)
         typer.echo("\nAvailable keys:", err=True)
         for k, info in CONFIGURABLE_KEYS.items():
-            typer.echo(f"  {k}: {info['description']}", err=True)
+            typer.echo(f"  {k}: {info.description}", err=True)
         raise typer.Exit(1)
     except ValueError as e:
         typer.echo(f"Error: {e}", err=True)
-        key_info = CONFIGURABLE_KEYS.get(key, {})
-        if "choices" in key_info:
-            typer.echo(f"Valid values: {', '.join(map(str, key_info['choices']))}", err=True)
+        key_info = CONFIGURABLE_KEYS.get(key)
+        if key_info is not None and key_info.choices is not None:
+            typer.echo(f"Valid values: {', '.join(map(str, key_info.choices))}", err=True)
         raise typer.Exit(1)
 
 
@@ -590,13 +843,15 @@ def config_list():
 
     for key, info in CONFIGURABLE_KEYS.items():
         typer.echo(f"\n[bold]{key}[/bold]")
-        typer.echo(f"  Description: {info['description']}")
-        typer.echo(f"  Default: {info['default']}")
-        typer.echo(f"  Type: {info['type'].__name__}")
-        if "choices" in info:
-            typer.echo(f"  Choices: {', '.join(map(str, info['choices']))}")
-        if "min" in info or "max" in info:
-            range_str = f"{info.get('min', '?')} - {info.get('max', '?')}"
+        typer.echo(f"  Description: {info.description}")
+        typer.echo(f"  Default: {info.default}")
+        typer.echo(f"  Type: {info.type.__name__}")
+        if info.choices is not None:
+            typer.echo(f"  Choices: {', '.join(map(str, info.choices))}")
+        if info.min is not None or info.max is not None:
+            min_val = "?" if info.min is None else info.min
+            max_val = "?" if info.max is None else info.max
+            range_str = f"{min_val} - {max_val}"
             typer.echo(f"  Range: {range_str}")
 
 
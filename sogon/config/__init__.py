@@ -2,20 +2,23 @@
 Configuration management module
 """
 
-from .settings import get_settings, Settings, reload_settings
+from .settings import get_settings, Settings, TranscriptionProvider, reload_settings
 from .user_config import (
     UserConfigManager,
     get_user_config_manager,
     reload_user_config,
     CONFIGURABLE_KEYS,
+    KeySpec,
 )
 
 __all__ = [
     "get_settings",
     "Settings",
+    "TranscriptionProvider",
     "reload_settings",
     "UserConfigManager",
     "get_user_config_manager",
     "reload_user_config",
     "CONFIGURABLE_KEYS",
+    "KeySpec",
 ]
\ No newline at end of file
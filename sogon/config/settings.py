@@ -2,11 +2,53 @@
 Centralized settings management using pydantic
 """
 
+import logging
+from enum import Enum
 from functools import lru_cache
-from typing import List
-from pydantic import Field, field_validator
+from pathlib import Path
+from typing import List, Literal
+from pydantic import Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+logger = logging.getLogger(__name__)
+
+# Set when reading the user config fails; cleared by reload_settings()
+_user_config_failed = False
+
+# Validator choice sets, built once at import
+_SUPPORTED_AUDIO_FORMATS = frozenset({"mp3", "m4a", "wav", "flac", "aac"})
+_SUPPORTED_VIDEO_FORMATS = frozenset({"mp4", "avi", "mov", "wmv", "flv", "mkv", "webm"})
+_SUPPORTED_MEDIA_FORMATS = {
+    "audio_formats": _SUPPORTED_AUDIO_FORMATS,
+    "video_formats": _SUPPORTED_VIDEO_FORMATS,
+}
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_SAMPLE_RATES = frozenset({8000, 16000, 22050, 44100, 48000})
+
+# String choices are checked by pydantic-core; int choices keep Python validators
+# because env values arrive as strings and int Literals do not coerce them
+TranslationLanguage = Literal[
+    "ko", "en", "ja", "zh-cn", "zh-tw", "es", "fr", "de", "it", "pt", "ru", "ar", "hi", "th", "vi"
+]
+AudioQuality = Literal["16k", "32k", "64k", "96k", "128k", "192k", "256k", "320k"]
+TranslationProviderName = Literal["openai", "azure", "anthropic"]
+LocalModelName = Literal[
+    "tiny", "base", "small", "medium", "large", "large-v2", "large-v3", "large-v3-turbo"
+]
+LocalDevice = Literal["cpu", "cuda", "mps"]
+LocalComputeType = Literal["int8", "int16", "float16", "float32"]
+
+
+class TranscriptionProvider(str, Enum):
+    """Transcription provider enumeration (compares equal to its string value)"""
+
+    OPENAI = "openai"
+    GROQ = "groq"
+    STABLE_WHISPER = "stable-whisper"
+
+    def __str__(self) -> str:
+        return self.value
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable support"""
@@ -21,7 +63,7 @@ class Settings(BaseSettings):
     openai_max_tokens: int = Field(4000, env="OPENAI_MAX_TOKENS")
 
     # Transcription Service Configuration
-    transcription_provider: str = Field("groq", env="TRANSCRIPTION_PROVIDER")
+    transcription_provider: TranscriptionProvider = Field(TranscriptionProvider.GROQ, env="TRANSCRIPTION_PROVIDER")
     transcription_api_key: str | None = Field(None, env="TRANSCRIPTION_API_KEY")
     transcription_base_url: str = Field("https://api.groq.com/openai/v1", env="TRANSCRIPTION_BASE_URL")
     transcription_model: str = Field("whisper-large-v3-turbo", env="TRANSCRIPTION_MODEL")
@@ -29,7 +71,7 @@ class Settings(BaseSettings):
     transcription_response_format: str = Field("verbose_json", env="TRANSCRIPTION_RESPONSE_FORMAT")
 
     # Translation Service Configuration
-    translation_provider: str = Field("openai", env="TRANSLATION_PROVIDER")
+    translation_provider: TranslationProviderName = Field("openai", env="TRANSLATION_PROVIDER")
     translation_api_key: str | None = Field(None, env="TRANSLATION_API_KEY")
     translation_base_url: str = Field("https://api.openai.com/v1", env="TRANSLATION_BASE_URL")
     translation_model: str = Field("gpt-4o-mini", env="TRANSLATION_MODEL")
@@ -37,26 +79,29 @@ class Settings(BaseSettings):
     translation_max_tokens: int = Field(4000, env="TRANSLATION_MAX_TOKENS")
 
     # Audio Processing Configuration
-    max_chunk_size_mb: int = Field(24, env="MAX_CHUNK_SIZE_MB")
+    max_chunk_size_mb: int = Field(24, ge=1, le=100, env="MAX_CHUNK_SIZE_MB")
     chunk_timeout_seconds: int = Field(120, env="CHUNK_TIMEOUT_SECONDS")
     audio_formats: List[str] = Field(["mp3", "m4a", "wav"], env="AUDIO_FORMATS")
     video_formats: List[str] = Field(["mp4", "avi", "mov", "wmv", "flv", "mkv", "webm"], env="VIDEO_FORMATS")
-    audio_quality: str = Field("64k", env="AUDIO_QUALITY")
+    audio_quality: AudioQuality = Field("64k", env="AUDIO_QUALITY")
     audio_sample_rate: int = Field(16000, env="AUDIO_SAMPLE_RATE")
     audio_channels: int = Field(1, env="AUDIO_CHANNELS")  # 1=mono, 2=stereo
     
     # YouTube Download Configuration
     youtube_socket_timeout: int = Field(30, env="YOUTUBE_SOCKET_TIMEOUT")
     youtube_retries: int = Field(3, env="YOUTUBE_RETRIES")
+    youtube_concurrent_fragments: int = Field(8, ge=1, le=32, env="YOUTUBE_CONCURRENT_FRAGMENTS")
     youtube_preferred_format: str = Field("m4a", env="YOUTUBE_PREFERRED_FORMAT")
+    youtube_cache_dir: Path | None = Field(None, env="YOUTUBE_CACHE_DIR")  # Reuse downloads by video ID when set
+    youtube_cache_max_size_gb: float = Field(5.0, gt=0, env="YOUTUBE_CACHE_MAX_SIZE_GB")
     
     # General Translation Configuration
     enable_translation_by_default: bool = Field(False, env="ENABLE_TRANSLATION_BY_DEFAULT")
-    default_translation_language: str = Field("ko", env="DEFAULT_TRANSLATION_LANGUAGE")
+    default_translation_language: TranslationLanguage = Field("ko", env="DEFAULT_TRANSLATION_LANGUAGE")
     
     # File Management Configuration
     keep_temp_files: bool = Field(False, env="KEEP_TEMP_FILES")
-    output_base_dir: str = Field("./result", env="OUTPUT_BASE_DIR")
+    output_base_dir: Path = Field(Path("./result"), env="OUTPUT_BASE_DIR")
     
     # Logging Configuration
     log_level: str = Field("INFO", env="LOG_LEVEL")
@@ -75,9 +120,30 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
-        env_nested_delimiter="__"
+        env_nested_delimiter="__",
+        # Shared via get_settings(); derive variants with model_copy(update=...)
+        frozen=True,
+        validate_assignment=False,
     )
-    
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls,
+        init_settings,
+        env_settings,
+        dotenv_settings,
+        file_secret_settings,
+    ):
+        # The dotenv source walks every field even when there is no .env file;
+        # drop it up front in that (common) case
+        env_files = dotenv_settings.env_file
+        if isinstance(env_files, (str, Path)):
+            env_files = [env_files]
+        if not any(Path(env_file).expanduser().is_file() for env_file in env_files or ()):
+            return init_settings, env_settings, file_secret_settings
+        return init_settings, env_settings, dotenv_settings, file_secret_settings
+
     @field_validator("openai_api_key")
     @classmethod
     def validate_openai_api_key(cls, v):
@@ -87,155 +153,74 @@ class Settings(BaseSettings):
             raise ValueError("OPENAI_API_KEY cannot be empty string")
         return v.strip()
     
-    @field_validator("max_chunk_size_mb")
+    @field_validator("audio_formats", "video_formats", mode="before")
     @classmethod
-    def validate_max_chunk_size(cls, v):
-        if v <= 0 or v > 100:
-            raise ValueError("max_chunk_size_mb must be between 1 and 100")
-        return v
-    
-    @field_validator("audio_formats")
-    @classmethod
-    def validate_audio_formats(cls, v):
+    def validate_media_formats(cls, v, info: ValidationInfo):
         if isinstance(v, str):
             # Handle comma-separated string from env var
             v = [fmt.strip() for fmt in v.split(",")]
-        supported_formats = ["mp3", "m4a", "wav", "flac", "aac"]
-        for fmt in v:
-            if fmt not in supported_formats:
-                raise ValueError(f"Unsupported audio format: {fmt}")
-        return v
-    
-    @field_validator("video_formats")
-    @classmethod
-    def validate_video_formats(cls, v):
-        if isinstance(v, str):
-            # Handle comma-separated string from env var
-            v = [fmt.strip() for fmt in v.split(",")]
-        supported_formats = ["mp4", "avi", "mov", "wmv", "flv", "mkv", "webm"]
-        for fmt in v:
-            if fmt not in supported_formats:
-                raise ValueError(f"Unsupported video format: {fmt}")
+        unsupported = set(v) - _SUPPORTED_MEDIA_FORMATS[info.field_name]
+        if unsupported:
+            kind = info.field_name.split("_")[0]
+            raise ValueError(f"Unsupported {kind} format: {', '.join(sorted(unsupported))}")
         return v
     
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v):
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f"log_level must be one of: {valid_levels}")
-        return v.upper()
+        level = v.upper()
+        if level not in _VALID_LOG_LEVELS:
+            raise ValueError(f"log_level must be one of: {sorted(_VALID_LOG_LEVELS)}")
+        return level
     
-    @field_validator("default_translation_language")
-    @classmethod
-    def validate_translation_language(cls, v):
-        valid_languages = ["ko", "en", "ja", "zh-cn", "zh-tw", "es", "fr", "de", "it", "pt", "ru", "ar", "hi", "th", "vi"]
-        if v not in valid_languages:
-            raise ValueError(f"default_translation_language must be one of: {valid_languages}")
-        return v
-
     @field_validator("audio_sample_rate")
     @classmethod
     def validate_audio_sample_rate(cls, v):
-        valid_rates = [8000, 16000, 22050, 44100, 48000]
-        if v not in valid_rates:
-            raise ValueError(f"audio_sample_rate must be one of: {valid_rates}")
+        if v not in _VALID_SAMPLE_RATES:
+            raise ValueError(f"audio_sample_rate must be one of: {sorted(_VALID_SAMPLE_RATES)}")
         return v
 
     @field_validator("audio_channels")
     @classmethod
     def validate_audio_channels(cls, v):
-        if v not in [1, 2]:
+        if v not in (1, 2):
             raise ValueError("audio_channels must be 1 (mono) or 2 (stereo)")
         return v
 
-    @field_validator("audio_quality")
-    @classmethod
-    def validate_audio_quality(cls, v):
-        valid_qualities = ["16k", "32k", "64k", "96k", "128k", "192k", "256k", "320k"]
-        if v not in valid_qualities:
-            raise ValueError(f"audio_quality must be one of: {valid_qualities}")
-        return v
-
     # Local Model Configuration (FR-018: environment variable support)
-    local_model_name: str = Field("base", env="SOGON_LOCAL_MODEL_NAME")
-    local_device: str = Field("cuda", env="SOGON_LOCAL_DEVICE")  # Default to CUDA for API performance
-    local_compute_type: str = Field("float16", env="SOGON_LOCAL_COMPUTE_TYPE")  # CUDA optimized
-    local_beam_size: int = Field(5, env="SOGON_LOCAL_BEAM_SIZE")
+    local_model_name: LocalModelName = Field("base", env="SOGON_LOCAL_MODEL_NAME")
+    local_device: LocalDevice = Field("cuda", env="SOGON_LOCAL_DEVICE")  # Default to CUDA for API performance
+    local_compute_type: LocalComputeType = Field("float16", env="SOGON_LOCAL_COMPUTE_TYPE")  # CUDA optimized
+    local_beam_size: int = Field(5, ge=1, le=10, env="SOGON_LOCAL_BEAM_SIZE")
     local_language: str | None = Field(None, env="SOGON_LOCAL_LANGUAGE")
-    local_temperature: float = Field(0.0, env="SOGON_LOCAL_TEMPERATURE")
+    local_temperature: float = Field(0.0, ge=0.0, le=1.0, env="SOGON_LOCAL_TEMPERATURE")
     local_vad_filter: bool = Field(False, env="SOGON_LOCAL_VAD_FILTER")
-    local_max_workers: int = Field(2, env="SOGON_LOCAL_MAX_WORKERS")
-    local_cache_max_size_gb: float = Field(8.0, env="SOGON_LOCAL_CACHE_MAX_SIZE_GB")
-    local_download_root: str = Field("~/.cache/sogon/models", env="SOGON_LOCAL_DOWNLOAD_ROOT")
-
-    @field_validator("transcription_provider")
-    @classmethod
-    def validate_transcription_provider(cls, v):
-        valid_providers = ["groq", "openai", "stable-whisper"]
-        if v not in valid_providers:
-            raise ValueError(f"transcription_provider must be one of: {valid_providers}")
-        return v
-
-    @field_validator("translation_provider")
-    @classmethod
-    def validate_translation_provider(cls, v):
-        valid_providers = ["openai", "azure", "anthropic"]
-        if v not in valid_providers:
-            raise ValueError(f"translation_provider must be one of: {valid_providers}")
-        return v
-
-    @field_validator("local_model_name")
-    @classmethod
-    def validate_local_model_name(cls, v):
-        valid_models = {"tiny", "base", "small", "medium", "large", "large-v2", "large-v3", "large-v3-turbo"}
-        if v not in valid_models:
-            raise ValueError(f"local_model_name must be one of: {sorted(valid_models)}")
-        return v
-
-    @field_validator("local_device")
-    @classmethod
-    def validate_local_device(cls, v):
-        valid_devices = {"cpu", "cuda", "mps"}
-        if v not in valid_devices:
-            raise ValueError(f"local_device must be one of: {sorted(valid_devices)}")
-        return v
-
-    @field_validator("local_compute_type")
-    @classmethod
-    def validate_local_compute_type(cls, v):
-        valid_types = {"int8", "int16", "float16", "float32"}
-        if v not in valid_types:
-            raise ValueError(f"local_compute_type must be one of: {sorted(valid_types)}")
-        return v
+    local_max_workers: int = Field(2, ge=1, le=10, env="SOGON_LOCAL_MAX_WORKERS")
+    local_cache_max_size_gb: float = Field(8.0, gt=0, env="SOGON_LOCAL_CACHE_MAX_SIZE_GB")
+    local_download_root: Path = Field(Path("~/.cache/sogon/models"), env="SOGON_LOCAL_DOWNLOAD_ROOT")
 
-    @field_validator("local_beam_size")
+    @field_validator("output_base_dir", "local_download_root", "youtube_cache_dir")
     @classmethod
-    def validate_local_beam_size(cls, v):
-        if not 1 <= v <= 10:
-            raise ValueError("local_beam_size must be between 1 and 10")
-        return v
+    def validate_directories(cls, v):
+        # Expand once at load so callers can use the Path as-is
+        return v.expanduser().resolve() if v is not None else v
 
-    @field_validator("local_temperature")
+    @field_validator("youtube_cache_dir", mode="before")
     @classmethod
-    def validate_local_temperature(cls, v):
-        if not 0.0 <= v <= 1.0:
-            raise ValueError("local_temperature must be between 0.0 and 1.0")
-        return v
-
-    @field_validator("local_max_workers")
-    @classmethod
-    def validate_local_max_workers(cls, v):
-        if not 1 <= v <= 10:
-            raise ValueError("local_max_workers must be between 1 and 10")
+    def validate_optional_directory(cls, v):
+        # An empty value (e.g. YOUTUBE_CACHE_DIR=) disables the cache instead of meaning cwd
+        if isinstance(v, str) and not v.strip():
+            return None
         return v
 
-    @field_validator("local_cache_max_size_gb")
+    @field_validator("transcription_provider", mode="before")
     @classmethod
-    def validate_local_cache_max_size_gb(cls, v):
-        if v <= 0:
-            raise ValueError("local_cache_max_size_gb must be greater than 0")
-        return v
+    def validate_transcription_provider(cls, v):
+        try:
+            return TranscriptionProvider(v)
+        except ValueError:
+            valid_providers = [provider.value for provider in TranscriptionProvider]
+            raise ValueError(f"transcription_provider must be one of: {valid_providers}")
 
     # Compatibility properties for backward compatibility
     @property
@@ -243,7 +228,7 @@ class Settings(BaseSettings):
         """Get effective transcription API key with fallback"""
         if self.transcription_api_key:
             return self.transcription_api_key
-        elif self.transcription_provider == "groq":
+        elif self.transcription_provider == TranscriptionProvider.GROQ:
             return self.groq_api_key
         else:
             return self.openai_api_key
@@ -259,14 +244,8 @@ class Settings(BaseSettings):
 
         Returns:
             LocalModelConfiguration: Configuration object for local models
-
-        Note:
-            Import is done locally to avoid circular dependencies
         """
-        from pathlib import Path
-        from sogon.models.local_config import LocalModelConfiguration
-
-        return LocalModelConfiguration(
+        return _local_model_config_class()(
             model_name=self.local_model_name,
             device=self.local_device,
             compute_type=self.local_compute_type,
@@ -276,10 +255,27 @@ class Settings(BaseSettings):
             vad_filter=self.local_vad_filter,
             max_workers=self.local_max_workers,
             cache_max_size_gb=self.local_cache_max_size_gb,
-            download_root=Path(self.local_download_root).expanduser(),
+            download_root=self.local_download_root,
         )
 
 
+@lru_cache(maxsize=1)
+def _local_model_config_class() -> type:
+    """Import LocalModelConfiguration on first use (deferred to avoid circular imports)."""
+    from sogon.models.local_config import LocalModelConfiguration
+
+    return LocalModelConfiguration
+
+
+@lru_cache(maxsize=1)
+def _user_config_keys() -> frozenset:
+    """Get the user config keys that map onto Settings fields (computed once)."""
+    # Import here to avoid circular imports
+    from sogon.config.user_config import CONFIGURABLE_KEYS
+
+    return frozenset(CONFIGURABLE_KEYS) & Settings.model_fields.keys()
+
+
 def _apply_user_config(settings: Settings) -> Settings:
     """
     Apply user configuration from ~/.sogon/config.yaml to settings.
@@ -299,27 +295,29 @@ def _apply_user_config(settings: Settings) -> Settings:
     Returns:
         Modified Settings instance
     """
+    global _user_config_failed
+    if _user_config_failed:
+        return settings
+
     # Import here to avoid circular imports
-    from sogon.config.user_config import get_user_config_manager, CONFIGURABLE_KEYS
+    from sogon.config.user_config import get_user_config_manager
 
     try:
-        user_config = get_user_config_manager()
-        user_values = user_config.get_all()
-
-        for key, value in user_values.items():
-            if key in CONFIGURABLE_KEYS and hasattr(settings, key):
-                # Only apply user config if env var wasn't explicitly set
-                # Check if the current value equals the default (meaning env wasn't set)
-                default_value = CONFIGURABLE_KEYS[key]["default"]
-                current_value = getattr(settings, key)
-
-                # Apply user config value
-                # Note: We apply regardless of whether env was set, because
-                # user explicitly set this via `sogon config set`
-                setattr(settings, key, value)
-    except Exception:
-        # If user config loading fails, continue with env/default settings
-        pass
+        user_values = get_user_config_manager().get_all()
+
+        # Apply user config values
+        # Note: We apply regardless of whether env was set, because
+        # user explicitly set this via `sogon config set`
+        for key in _user_config_keys() & user_values.keys():
+            # Validate like a loaded value (parses enums/paths); skip invalid entries
+            try:
+                settings.__pydantic_validator__.validate_assignment(settings, key, user_values[key])
+            except ValueError:
+                continue
+    except (OSError, KeyError, TypeError, ValueError) as e:
+        # Continue with env/default settings; don't retry until reload_settings()
+        logger.warning(f"Ignoring user config: {e}")
+        _user_config_failed = True
 
     return settings
 
@@ -353,6 +351,8 @@ def reload_settings() -> Settings:
     """
     # Also reload user config
     from sogon.config.user_config import reload_user_config
+    global _user_config_failed
+    _user_config_failed = False
     reload_user_config()
 
     get_settings.cache_clear()
@@ -5,116 +5,191 @@ Provides CLI-based configuration management via `sogon config set/get` commands.
 Configuration is stored in ~/.sogon/config.yaml
 """
 
+import os
+import tempfile
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
-import yaml
+
+@dataclass(frozen=True, slots=True)
+class KeySpec:
+    """
+    Specification of a CLI-configurable key.
+
+    Attributes:
+        description: Help text shown by `sogon config list`
+        type: Expected value type (str, bool, int or float)
+        default: Value used when the key is not set
+        choices: Allowed values, matched case-insensitively for strings
+        min: Inclusive lower bound for numeric keys
+        max: Inclusive upper bound for numeric keys
+        choices_lower_map: Lowercase choice -> canonical choice, built from
+            choices for string keys
+    """
+
+    description: str
+    type: type
+    default: Any
+    choices: tuple[Any, ...] | None = None
+    min: float | None = None
+    max: float | None = None
+    choices_lower_map: dict[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.type is str and self.choices:
+            object.__setattr__(
+                self, "choices_lower_map", {choice.lower(): choice for choice in self.choices}
+            )
 
 
 # Configuration keys that can be set via CLI
-# Maps CLI key names to their Settings field names and descriptions
-CONFIGURABLE_KEYS: dict[str, dict[str, Any]] = {
+# Maps CLI key names (which match Settings field names) to their specs
+CONFIGURABLE_KEYS: dict[str, KeySpec] = {
     # High Priority - User-facing behavior
-    "output_base_dir": {
-        "description": "Default output directory for results",
-        "default": "./result",
-        "type": str,
-    },
-    "default_subtitle_format": {
-        "description": "Default subtitle output format",
-        "default": "txt",
-        "type": str,
-        "choices": ["txt", "srt", "vtt", "json"],
-    },
-    "transcription_provider": {
-        "description": "Transcription provider (groq, openai, stable-whisper)",
-        "default": "groq",
-        "type": str,
-        "choices": ["groq", "openai", "stable-whisper"],
-    },
-    "default_translation_language": {
-        "description": "Default target language for translation",
-        "default": "ko",
-        "type": str,
-        "choices": ["ko", "en", "ja", "zh-cn", "zh-tw", "es", "fr", "de", "it", "pt", "ru", "ar", "hi", "th", "vi"],
-    },
-    "log_level": {
-        "description": "Logging level",
-        "default": "INFO",
-        "type": str,
-        "choices": ["DEBUG", "INFO", "WARNING", "ERROR"],
-    },
-    "keep_temp_files": {
-        "description": "Keep temporary audio files after processing",
-        "default": False,
-        "type": bool,
-    },
-    "enable_translation": {
-        "description": "Enable translation by default",
-        "default": False,
-        "type": bool,
-    },
-    "default_source_language": {
-        "description": "Default source language (auto for auto-detect)",
-        "default": "auto",
-        "type": str,
-        "choices": ["auto", "en", "ko", "ja", "zh", "es", "fr", "de", "it", "pt", "ru", "ar", "hi", "th", "vi"],
-    },
+    "output_base_dir": KeySpec(
+        description="Default output directory for results",
+        default="./result",
+        type=str,
+    ),
+    "default_subtitle_format": KeySpec(
+        description="Default subtitle output format",
+        default="txt",
+        type=str,
+        choices=("txt", "srt", "vtt", "json"),
+    ),
+    "transcription_provider": KeySpec(
+        description="Transcription provider (groq, openai, stable-whisper)",
+        default="groq",
+        type=str,
+        choices=("groq", "openai", "stable-whisper"),
+    ),
+    "default_translation_language": KeySpec(
+        description="Default target language for translation",
+        default="ko",
+        type=str,
+        choices=("ko", "en", "ja", "zh-cn", "zh-tw", "es", "fr", "de", "it", "pt", "ru", "ar", "hi", "th", "vi"),
+    ),
+    "log_level": KeySpec(
+        description="Logging level",
+        default="INFO",
+        type=str,
+        choices=("DEBUG", "INFO", "WARNING", "ERROR"),
+    ),
+    "keep_temp_files": KeySpec(
+        description="Keep temporary audio files after processing",
+        default=False,
+        type=bool,
+    ),
+    "enable_translation": KeySpec(
+        description="Enable translation by default",
+        default=False,
+        type=bool,
+    ),
+    "default_source_language": KeySpec(
+        description="Default source language (auto for auto-detect)",
+        default="auto",
+        type=str,
+        choices=("auto", "en", "ko", "ja", "zh", "es", "fr", "de", "it", "pt", "ru", "ar", "hi", "th", "vi"),
+    ),
     # Medium Priority - Local model configuration
-    "local_model_name": {
-        "description": "Local Whisper model name",
-        "default": "base",
-        "type": str,
-        "choices": ["tiny", "base", "small", "medium", "large", "large-v2", "large-v3", "large-v3-turbo"],
-    },
-    "local_device": {
-        "description": "Compute device for local model",
-        "default": "cuda",
-        "type": str,
-        "choices": ["cpu", "cuda", "mps"],
-    },
-    "local_compute_type": {
-        "description": "Compute type for local model inference",
-        "default": "float16",
-        "type": str,
-        "choices": ["int8", "int16", "float16", "float32"],
-    },
-    "local_beam_size": {
-        "description": "Beam size for local model inference",
-        "default": 5,
-        "type": int,
-        "min": 1,
-        "max": 10,
-    },
-    "local_temperature": {
-        "description": "Temperature for local model inference",
-        "default": 0.0,
-        "type": float,
-        "min": 0.0,
-        "max": 1.0,
-    },
-    "local_vad_filter": {
-        "description": "Enable VAD filter for local model",
-        "default": False,
-        "type": bool,
-    },
+    "local_model_name": KeySpec(
+        description="Local Whisper model name",
+        default="base",
+        type=str,
+        choices=("tiny", "base", "small", "medium", "large", "large-v2", "large-v3", "large-v3-turbo"),
+    ),
+    "local_device": KeySpec(
+        description="Compute device for local model",
+        default="cuda",
+        type=str,
+        choices=("cpu", "cuda", "mps"),
+    ),
+    "local_compute_type": KeySpec(
+        description="Compute type for local model inference",
+        default="float16",
+        type=str,
+        choices=("int8", "int16", "float16", "float32"),
+    ),
+    "local_beam_size": KeySpec(
+        description="Beam size for local model inference",
+        default=5,
+        type=int,
+        min=1,
+        max=10,
+    ),
+    "local_temperature": KeySpec(
+        description="Temperature for local model inference",
+        default=0.0,
+        type=float,
+        min=0.0,
+        max=1.0,
+    ),
+    "local_vad_filter": KeySpec(
+        description="Enable VAD filter for local model",
+        default=False,
+        type=bool,
+    ),
     # Performance tuning
-    "max_workers": {
-        "description": "Maximum concurrent workers",
-        "default": 4,
-        "type": int,
-        "min": 1,
-        "max": 16,
-    },
-    "max_chunk_size_mb": {
-        "description": "Maximum audio chunk size in MB",
-        "default": 24,
-        "type": int,
-        "min": 1,
-        "max": 100,
-    },
+    "max_workers": KeySpec(
+        description="Maximum concurrent workers",
+        default=4,
+        type=int,
+        min=1,
+        max=16,
+    ),
+    "max_chunk_size_mb": KeySpec(
+        description="Maximum audio chunk size in MB",
+        default=24,
+        type=int,
+        min=1,
+        max=100,
+    ),
 }
 
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+_FALSY = frozenset({"false", "0", "no", "off"})
+
+
+def _to_bool(value: Any) -> bool:
+    """Convert a CLI value to bool, accepting common true/false spellings."""
+    if not isinstance(value, str):
+        return bool(value)
+    lowered = value.lower()
+    if lowered in _TRUTHY:
+        return True
+    if lowered in _FALSY:
+        return False
+    raise ValueError(f"Invalid boolean value: {value}")
+
+
+# Expected type -> converter applied by UserConfigManager._validate_value
+_CONVERTERS: dict[type, Any] = {bool: _to_bool, int: int, float: float, str: str}
+
+
+@lru_cache(maxsize=1)
+def _yaml_codec():
+    """
+    Import PyYAML on first use and pick its loader/dumper.
+
+    Prefers the libyaml-backed C loader/dumper when PyYAML was built with it.
+    Deferred so processes without a config file never import yaml.
+
+    Returns:
+        Tuple of (yaml module, Loader class, Dumper class)
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as Dumper, CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeDumper as Dumper, SafeLoader as Loader
+    return yaml, Loader, Dumper
+
 
 class UserConfigManager:
     """
@@ -140,29 +215,69 @@ class UserConfigManager:
         self.config_dir = config_dir or self.DEFAULT_CONFIG_DIR
         self.config_path = self.config_dir / self.DEFAULT_CONFIG_FILE
         self._config: dict[str, Any] = {}
+        self._mtime: int | None = None
         self._load()
 
     def _ensure_config_dir(self) -> None:
         """Create config directory if it doesn't exist."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
+    def _stat_mtime(self) -> int | None:
+        """Get the config file modification time in ns, or None if it does not exist."""
+        try:
+            return self.config_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
     def _load(self) -> None:
         """Load configuration from YAML file."""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, encoding="utf-8") as f:
-                    loaded = yaml.safe_load(f)
-                    self._config = loaded if loaded else {}
-            except (yaml.YAMLError, OSError):
-                self._config = {}
-        else:
+        # A single stat decides whether there is anything to parse
+        self._mtime = self._stat_mtime()
+        if self._mtime is None:
+            self._config = {}
+            return
+
+        yaml, loader, _ = _yaml_codec()
+        try:
+            with open(self.config_path, encoding="utf-8") as f:
+                loaded = yaml.load(f, Loader=loader)
+                # Anything but a mapping (e.g. a YAML list) is ignored like an empty file
+                self._config = loaded if isinstance(loaded, dict) else {}
+        except (yaml.YAMLError, OSError):
             self._config = {}
 
+    def _maybe_reload(self) -> None:
+        """Re-read the config file only if it changed since the last load."""
+        if self._stat_mtime() != self._mtime:
+            self._load()
+
     def _save(self) -> None:
-        """Save configuration to YAML file."""
+        """
+        Save configuration to YAML file.
+
+        Writes to a temporary file in the config directory and renames it over
+        the config file, so a crash mid-write never leaves a truncated file.
+        """
+        yaml, _, dumper = _yaml_codec()
         self._ensure_config_dir()
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(self._config, f, default_flow_style=False, allow_unicode=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=self.config_dir,
+            prefix=f".{self.DEFAULT_CONFIG_FILE}.",
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            try:
+                yaml.dump(
+                    self._config, f, Dumper=dumper, default_flow_style=False, allow_unicode=True
+                )
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, self.config_path)
+        self._mtime = self._stat_mtime()
 
     def get(self, key: str) -> Any:
         """
@@ -181,14 +296,18 @@ class UserConfigManager:
             raise KeyError(f"Unknown configuration key: {key}")
         return self._config.get(key)
 
-    def get_all(self) -> dict[str, Any]:
+    def get_all(self) -> Mapping[str, Any]:
         """
         Get all user-configured values.
 
+        Picks up edits made to the file by other processes since it was loaded.
+
         Returns:
-            Dictionary of all set configuration values
+            Read-only view of all set configuration values (copy with dict()
+            before mutating or holding across set/reset calls)
         """
-        return self._config.copy()
+        self._maybe_reload()
+        return MappingProxyType(self._config)
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -206,6 +325,8 @@ class UserConfigManager:
             raise KeyError(f"Unknown configuration key: {key}")
 
         validated_value = self._validate_value(key, value)
+        if key in self._config and self._config[key] == validated_value:
+            return
         self._config[key] = validated_value
         self._save()
 
@@ -220,8 +341,9 @@ class UserConfigManager:
             KeyError: If key is not a valid configurable key
         """
         if key is None:
-            self._config = {}
-            self._save()
+            if self._config:
+                self._config = {}
+                self._save()
         else:
             if key not in CONFIGURABLE_KEYS:
                 raise KeyError(f"Unknown configuration key: {key}")
@@ -243,68 +365,46 @@ class UserConfigManager:
         Raises:
             ValueError: If value is invalid
         """
-        key_info = CONFIGURABLE_KEYS[key]
-        expected_type = key_info["type"]
+        spec = CONFIGURABLE_KEYS[key]
+        expected_type = spec.type
 
         # Type conversion
         try:
-            if expected_type == bool:
-                if isinstance(value, str):
-                    if value.lower() in ("true", "1", "yes", "on"):
-                        value = True
-                    elif value.lower() in ("false", "0", "no", "off"):
-                        value = False
-                    else:
-                        raise ValueError(f"Invalid boolean value: {value}")
-                else:
-                    value = bool(value)
-            elif expected_type == int:
-                value = int(value)
-            elif expected_type == float:
-                value = float(value)
-            elif expected_type == str:
-                value = str(value)
+            value = _CONVERTERS[expected_type](value)
         except (ValueError, TypeError) as e:
             raise ValueError(f"Cannot convert '{value}' to {expected_type.__name__}: {e}") from e
 
         # Choices validation
-        if "choices" in key_info:
-            # Case-insensitive for strings
-            if expected_type == str:
-                value_lower = value.lower()
-                choices_lower = [c.lower() for c in key_info["choices"]]
-                if value_lower not in choices_lower:
-                    raise ValueError(
-                        f"Invalid value '{value}' for {key}. "
-                        f"Must be one of: {', '.join(key_info['choices'])}"
-                    )
-                # Return the original case from choices
-                for choice in key_info["choices"]:
-                    if choice.lower() == value_lower:
-                        value = choice
-                        break
-            elif value not in key_info["choices"]:
+        if spec.choices_lower_map is not None:
+            # Case-insensitive for strings; map back to the original case
+            choice = spec.choices_lower_map.get(value.lower())
+            if choice is None:
                 raise ValueError(
                     f"Invalid value '{value}' for {key}. "
-                    f"Must be one of: {', '.join(map(str, key_info['choices']))}"
+                    f"Must be one of: {', '.join(spec.choices)}"
                 )
+            value = choice
+        elif spec.choices is not None and value not in spec.choices:
+            raise ValueError(
+                f"Invalid value '{value}' for {key}. "
+                f"Must be one of: {', '.join(map(str, spec.choices))}"
+            )
 
         # Range validation for numeric types
-        if expected_type in (int, float):
-            if "min" in key_info and value < key_info["min"]:
-                raise ValueError(f"Value {value} for {key} must be >= {key_info['min']}")
-            if "max" in key_info and value > key_info["max"]:
-                raise ValueError(f"Value {value} for {key} must be <= {key_info['max']}")
+        if spec.min is not None and value < spec.min:
+            raise ValueError(f"Value {value} for {key} must be >= {spec.min}")
+        if spec.max is not None and value > spec.max:
+            raise ValueError(f"Value {value} for {key} must be <= {spec.max}")
 
         return value
 
     @staticmethod
-    def list_keys() -> dict[str, dict[str, Any]]:
+    def list_keys() -> dict[str, KeySpec]:
         """
         List all configurable keys with their metadata.
 
         Returns:
-            Dictionary of key names to their metadata
+            Dictionary of key names to their specs
         """
         return CONFIGURABLE_KEYS.copy()
 
@@ -327,13 +427,10 @@ class UserConfigManager:
         user_value = self._config.get(key)
         if user_value is not None:
             return user_value
-        return CONFIGURABLE_KEYS[key]["default"]
-
-
-# Singleton instance for easy access
-_user_config_manager: UserConfigManager | None = None
+        return CONFIGURABLE_KEYS[key].default
 
 
+@lru_cache(maxsize=1)
 def get_user_config_manager() -> UserConfigManager:
     """
     Get the singleton UserConfigManager instance.
@@ -341,19 +438,19 @@ def get_user_config_manager() -> UserConfigManager:
     Returns:
         UserConfigManager instance
     """
-    global _user_config_manager
-    if _user_config_manager is None:
-        _user_config_manager = UserConfigManager()
-    return _user_config_manager
+    return UserConfigManager()
 
 
 def reload_user_config() -> UserConfigManager:
     """
-    Reload user configuration (clear cache and create new instance).
+    Reload user configuration from disk.
+
+    Keeps the cached instance and re-parses the file only if its mtime
+    changed since it was last loaded or saved.
 
     Returns:
-        New UserConfigManager instance
+        UserConfigManager instance with current file contents
     """
-    global _user_config_manager
-    _user_config_manager = UserConfigManager()
-    return _user_config_manager
+    manager = get_user_config_manager()
+    manager._maybe_reload()
+    return manager
@@ -38,7 +38,7 @@ def validate_environment() -> Tuple[bool, List[str]]:
     
     # Validate output directory
     try:
-        output_dir = Path(settings.output_base_dir)
+        output_dir = settings.output_base_dir
         if not output_dir.exists():
             output_dir.mkdir(parents=True, exist_ok=True)
         if not output_dir.is_dir():
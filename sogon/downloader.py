@@ -2,35 +2,46 @@
 YouTube audio download module
 """
 
+import math
 import os
+import shutil
+import sys
 import tempfile
-import re
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-import yt_dlp
-from pydub import AudioSegment
 from tqdm import tqdm
 
 logger = logging.getLogger(__name__)
 
+# Characters not allowed in output filenames
+_UNSAFE_FILENAME_CHARS = str.maketrans("", "", '<>:"/\\|?*')
 
-def download_youtube_audio(url, output_dir=None):
+
+def download_youtube_audio(url, output_dir=None, concurrent_fragments=None):
     """
     Download audio from YouTube video with optimized settings for Whisper
 
     Args:
         url (str): YouTube URL
         output_dir (str): Output directory (uses temporary directory if not provided)
+        concurrent_fragments (int): Fragments downloaded in parallel
+            (uses settings.youtube_concurrent_fragments if not provided)
 
     Returns:
         str: Downloaded audio file path
     """
+    # yt-dlp loads every extractor on import, so only pay for it when downloading
+    import yt_dlp
     from .config import get_settings
 
     if output_dir is None:
         output_dir = tempfile.mkdtemp()
 
     settings = get_settings()
+    if concurrent_fragments is None:
+        concurrent_fragments = settings.youtube_concurrent_fragments
 
     # Configure yt-dlp options with Whisper-optimized audio settings
     ydl_opts = {
@@ -41,8 +52,9 @@ def download_youtube_audio(url, output_dir=None):
         "socket_timeout": settings.youtube_socket_timeout,
         "retries": settings.youtube_retries,
         "fragment_retries": 3,  # Reduced fragment retry count
-        "http_chunk_size": 5242880,  # Set HTTP chunk size to 5MB
-        "concurrent_fragment_downloads": 4,  # 4 concurrent fragment downloads
+        "http_chunk_size": 10485760,  # Set HTTP chunk size to 10MB
+        "buffersize": 65536,  # Start with 64KiB read/write buffers
+        "concurrent_fragment_downloads": concurrent_fragments,
         "postprocessors": [
             {
                 "key": "FFmpegExtractAudio",
@@ -61,23 +73,19 @@ def download_youtube_audio(url, output_dir=None):
 
     try:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            # Get video information
-            info = ydl.extract_info(url, download=False)
-            title = info.get("title", "unknown")
-
-            # Remove special characters from filename
-            safe_title = re.sub(r'[<>:"/\\|?*]', "", title)
-            output_path = os.path.join(output_dir, f"{safe_title}.mp3")
+            # Get video information and download in a single extraction
+            info = ydl.extract_info(url, download=True)
 
-            # Download
-            ydl.download([url])
+            # The audio postprocessor replaces the source extension with m4a (or mp3)
+            base_path = os.path.splitext(ydl.prepare_filename(info))[0]
+            for ext in (".m4a", ".mp3"):
+                audio_path = base_path + ext
+                if os.path.exists(audio_path):
+                    return audio_path
 
-            # Find downloaded file (m4a or mp3)
-            for file in os.listdir(output_dir):
-                if file.endswith((".m4a", ".mp3")):
-                    return os.path.join(output_dir, file)
-
-            return output_path
+            # Remove special characters from filename
+            safe_title = info.get("title", "unknown").translate(_UNSAFE_FILENAME_CHARS)
+            return os.path.join(output_dir, f"{safe_title}.mp3")
 
     except Exception as e:
         logger.error(f"Error occurred during YouTube audio download: {e}, cause: {e.__cause__ or 'unknown'}")
@@ -87,11 +95,255 @@ def download_youtube_audio(url, output_dir=None):
         return None
 
 
+def _export_chunk(working_path, index, start_time, chunk_duration, chunk_path, settings):
+    """
+    Extract one chunk of an audio file with ffmpeg
+
+    Args:
+        working_path (str): Source audio file path
+        index (int): Zero-based chunk index (for logging)
+        start_time (float): Chunk start offset in seconds
+        chunk_duration (float): Chunk length in seconds
+        chunk_path (str): Output path for the chunk
+        settings (Settings): Settings providing the target sample rate and channels
+
+    Returns:
+        str: chunk_path if the chunk was created, otherwise None
+    """
+    import subprocess
+
+    # Use ffmpeg to extract chunk with Whisper-optimized settings
+    # Optimize parameter order: seek before input for better performance
+    cmd = [
+        'ffmpeg', '-y',
+        '-ss', str(start_time),  # Seek before input for efficiency
+        '-i', working_path,
+        '-t', str(round(chunk_duration, 2)),  # Round to avoid precision issues
+        '-ar', str(settings.audio_sample_rate),  # Resample to 16kHz for Whisper
+        '-ac', str(settings.audio_channels),     # Convert to mono
+        '-avoid_negative_ts', 'make_zero',
+        chunk_path
+    ]
+
+    try:
+        logger.debug(f"Running ffmpeg command: {' '.join(cmd)}")
+        subprocess.run(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL, check=True, timeout=120)
+
+        # Check if chunk was created successfully
+        if os.path.exists(chunk_path):
+            chunk_size_mb = os.path.getsize(chunk_path) / (1024 * 1024)
+            logger.debug(f"Created chunk {index+1}: {Path(chunk_path).name} ({chunk_size_mb:.1f} MB)")
+            return chunk_path
+        logger.warning(f"Chunk {index+1} was not created successfully")
+
+    except subprocess.TimeoutExpired:
+        logger.error(f"Chunk {index+1} ffmpeg timeout after 120s")
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Failed to create chunk {index+1}: {e}")
+        logger.debug(f"ffmpeg stderr: {e.stderr}")
+        logger.debug(f"ffmpeg stdout: {e.stdout}")
+
+    return None
+
+
+_SHM_DIR = "/dev/shm"
+# Marks directories created by split_audio_by_size so only those are removed
+_CHUNK_DIR_PREFIX = "sogon-chunks-"
+
+
+def _make_temp_dir(estimated_size_bytes):
+    """
+    Create a private temporary directory for audio files
+
+    Uses /dev/shm on Linux when both the tmpfs and available RAM have room
+    for three times the expected data, so chunk files never touch the disk.
+    Falls back to the default temp directory otherwise, or if the directory
+    cannot be created there.
+
+    Args:
+        estimated_size_bytes (int): Expected total size of the files
+
+    Returns:
+        str: Path of the new directory
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            import psutil
+
+            shm = os.statvfs(_SHM_DIR)
+            required = estimated_size_bytes * 3
+            if (shm.f_bavail * shm.f_frsize > required
+                    and psutil.virtual_memory().available > required):
+                # A per-call directory, so users never share (or fight over) one
+                return tempfile.mkdtemp(dir=_SHM_DIR, prefix=_CHUNK_DIR_PREFIX)
+        except (ImportError, OSError) as e:
+            logger.debug(f"Not using {_SHM_DIR} for temporary files: {e}")
+
+    return tempfile.mkdtemp(prefix=_CHUNK_DIR_PREFIX)
+
+
+def remove_chunk_dir(chunk_paths):
+    """
+    Remove the temporary directory holding chunks from split_audio_by_size
+
+    Chunks may live in RAM (/dev/shm), so callers should call this in a
+    finally block once they are done with the chunks, whether or not every
+    chunk was processed. Does nothing when the file was not split.
+
+    Args:
+        chunk_paths (list): Paths returned by split_audio_by_size
+    """
+    if not chunk_paths:
+        return
+    chunk_dir = Path(chunk_paths[0]).parent
+    if chunk_dir.name.startswith(_CHUNK_DIR_PREFIX):
+        shutil.rmtree(chunk_dir, ignore_errors=True)
+        logger.debug(f"Removed chunk directory: {chunk_dir}")
+
+
+@lru_cache(maxsize=64)
+def _probe(path, mtime_ns, size):
+    """
+    Run ffprobe once per file version
+
+    mtime_ns and size are part of the cache key so a rewritten file is probed again.
+    """
+    import subprocess
+    import json
+
+    cmd = [
+        'ffprobe', '-v', 'quiet', '-print_format', 'json',
+        '-show_format', '-show_streams', path
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL, check=True)
+    return json.loads(result.stdout)
+
+
+def probe_audio(path):
+    """
+    Get ffprobe format and stream metadata for an audio file
+
+    Results are cached per path, modification time and size, so repeated
+    lookups of the same file do not spawn another ffprobe process. The
+    returned dict is shared between callers and must not be modified.
+
+    Args:
+        path (str): Audio file path
+
+    Returns:
+        dict: Parsed ffprobe JSON output with "format" and "streams" keys
+    """
+    stat = os.stat(path)
+    return _probe(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _split_by_stream_copy(working_path, num_chunks, chunk_duration, temp_dir, base_name, max_chunk_size_mb):
+    """
+    Split an audio file in a single ffmpeg pass without re-encoding
+
+    Cuts at fixed offsets (i * chunk_duration) with the segment muxer, so chunk
+    start times match the equal-duration layout callers assume.
+
+    Args:
+        working_path (str): Source audio file path
+        num_chunks (int): Number of chunks to produce
+        chunk_duration (float): Chunk length in seconds
+        temp_dir (str): Directory for the chunk files
+        base_name (str): Filename stem for the chunks
+        max_chunk_size_mb (float): Maximum chunk size in MB
+
+    Returns:
+        list: Chunk paths in order, or None if the stream could not be copied
+            into num_chunks chunks within the size limit
+    """
+    import subprocess
+
+    # Keep the source container; a copied stream cannot change codec
+    suffix = Path(working_path).suffix.lower()
+    chunk_paths = [os.path.join(temp_dir, f"{base_name}_chunk_{i+1}{suffix}") for i in range(num_chunks)]
+    cut_points = ",".join(f"{i * chunk_duration:.3f}" for i in range(1, num_chunks))
+    cmd = [
+        'ffmpeg', '-y', '-v', 'error',
+        '-i', working_path,
+        '-map', '0:a',
+        '-c', 'copy',
+        '-f', 'segment',
+        '-segment_times', cut_points,
+        '-segment_start_number', '1',
+        '-reset_timestamps', '1',
+        os.path.join(temp_dir, f"{base_name}_chunk_%d{suffix}")
+    ]
+
+    try:
+        logger.debug(f"Running ffmpeg command: {' '.join(cmd)}")
+        subprocess.run(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL, check=True, timeout=600)
+    except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
+        logger.warning(f"Stream copy split failed, re-encoding chunks instead: {e}")
+        logger.debug(f"ffmpeg stderr: {getattr(e, 'stderr', None)}")
+        return None
+
+    max_chunk_bytes = max_chunk_size_mb * 1024 * 1024
+    if all(os.path.exists(path) and os.path.getsize(path) <= max_chunk_bytes for path in chunk_paths):
+        return chunk_paths
+
+    # Missing or oversized chunks (e.g. VBR peaks): discard and re-encode instead
+    logger.warning("Stream copy split did not produce usable chunks, re-encoding chunks instead")
+    for path in Path(temp_dir).glob(f"{base_name}_chunk_*"):
+        path.unlink()
+    return None
+
+
+def _split_by_reencoding(working_path, num_chunks, chunk_duration, temp_dir, base_name, settings):
+    """
+    Split an audio file by re-encoding each chunk with its own ffmpeg process
+
+    Args:
+        working_path (str): Source audio file path
+        num_chunks (int): Number of chunks to produce
+        chunk_duration (float): Chunk length in seconds
+        temp_dir (str): Directory for the chunk files
+        base_name (str): Filename stem for the chunks
+        settings (Settings): Settings providing max_workers and the target audio format
+
+    Returns:
+        list: Paths of the chunks that were created, in order
+    """
+    # Detect original file format for chunk export
+    original_ext = Path(working_path).suffix.lower()
+    chunk_format = "m4a" if original_ext == ".m4a" else "mp3"
+
+    chunk_paths = [
+        os.path.join(temp_dir, f"{base_name}_chunk_{i+1}.{chunk_format}")
+        for i in range(num_chunks)
+    ]
+    results = [None] * num_chunks
+
+    # Each chunk is an independent ffmpeg process, so run them concurrently
+    with ThreadPoolExecutor(max_workers=min(settings.max_workers, num_chunks)) as executor, \
+            tqdm(total=num_chunks, desc="Splitting audio", unit="chunk") as pbar:
+        futures = {
+            executor.submit(
+                _export_chunk, working_path, i, i * chunk_duration, chunk_duration, chunk_paths[i], settings
+            ): i
+            for i in range(num_chunks)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            results[i] = future.result()
+            pbar.update(1)
+            pbar.set_postfix(chunk=f"{i+1}/{num_chunks}")
+
+    # Keep chunk order regardless of completion order
+    return [chunk_path for chunk_path in results if chunk_path is not None]
+
+
 def split_audio_by_size(audio_path, max_chunk_size_mb=None):
     """
     Split audio file into size-based chunks to ensure API compatibility
 
-    Uses ffmpeg directly to avoid memory issues with large files.
+    Uses ffmpeg directly to avoid memory issues with large files. Chunks are
+    stream-copied in one pass when possible and re-encoded otherwise. They are
+    written to a temporary directory that callers remove with remove_chunk_dir().
     Temporarily renames files with special characters to avoid subprocess issues.
 
     Args:
@@ -101,8 +353,6 @@ def split_audio_by_size(audio_path, max_chunk_size_mb=None):
     Returns:
         list: List of split audio file paths
     """
-    import subprocess
-    import json
     import hashlib
     from .config import get_settings
 
@@ -124,19 +374,13 @@ def split_audio_by_size(audio_path, max_chunk_size_mb=None):
         
         if needs_rename:
             logger.debug(f"Renaming file for safe processing: {original_path.name} -> {safe_filename}")
-            import shutil
             shutil.copy2(audio_path, safe_path)
             working_path = str(safe_path)
         else:
             working_path = audio_path
         
         # Get audio duration using ffprobe (faster than loading entire file)
-        cmd = [
-            'ffprobe', '-v', 'quiet', '-print_format', 'json', 
-            '-show_format', '-show_streams', working_path
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL, check=True)
-        info = json.loads(result.stdout)
+        info = probe_audio(working_path)
         
         duration_seconds = float(info['format']['duration'])
         file_size_mb = os.path.getsize(working_path) / (1024 * 1024)
@@ -151,64 +395,27 @@ def split_audio_by_size(audio_path, max_chunk_size_mb=None):
                 safe_path.unlink()
             return [audio_path]
         
-        # Calculate number of chunks needed
-        num_chunks = int((file_size_mb / max_chunk_size_mb) + 0.5)
+        # Calculate number of chunks needed (round up so copied chunks stay under the limit)
+        num_chunks = math.ceil(file_size_mb / max_chunk_size_mb)
         chunk_duration = duration_seconds / num_chunks
         
         logger.info(f"Splitting into {num_chunks} chunks of ~{chunk_duration/60:.1f} minutes each")
-        
-        # Detect original file format for chunk export
-        original_ext = Path(working_path).suffix.lower()
-        chunk_format = "m4a" if original_ext == ".m4a" else "mp3"
 
-        # Create temporary directory for chunks
-        temp_dir = tempfile.mkdtemp()
+        # Create temporary directory for chunks (in RAM when it fits)
+        temp_dir = _make_temp_dir(os.path.getsize(working_path))
         # Use safe name for chunk files (avoid Korean characters)
         safe_base_name = Path(working_path).stem  # Use the already safe filename
-        chunks = []
-        
-        # Split audio using ffmpeg directly (much faster)
-        with tqdm(total=num_chunks, desc="Splitting audio", unit="chunk") as pbar:
-            for i in range(num_chunks):
-                start_time = i * chunk_duration
-                chunk_path = os.path.join(temp_dir, f"{safe_base_name}_chunk_{i+1}.{chunk_format}")
-                
-                # Use ffmpeg to extract chunk with Whisper-optimized settings
-                # Optimize parameter order: seek before input for better performance
-                cmd = [
-                    'ffmpeg', '-y',
-                    '-ss', str(start_time),  # Seek before input for efficiency
-                    '-i', working_path,
-                    '-t', str(round(chunk_duration, 2)),  # Round to avoid precision issues
-                    '-ar', str(settings.audio_sample_rate),  # Resample to 16kHz for Whisper
-                    '-ac', str(settings.audio_channels),     # Convert to mono
-                    '-avoid_negative_ts', 'make_zero',
-                    chunk_path
-                ]
-                
-                try:
-                    logger.debug(f"Running ffmpeg command: {' '.join(cmd)}")
-                    result = subprocess.run(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL, check=True, timeout=120)
-                    
-                    # Check if chunk was created successfully
-                    if os.path.exists(chunk_path):
-                        chunk_size_mb = os.path.getsize(chunk_path) / (1024 * 1024)
-                        chunks.append(chunk_path)
-                        logger.debug(f"Created chunk {i+1}: {Path(chunk_path).name} ({chunk_size_mb:.1f} MB)")
-                    else:
-                        logger.warning(f"Chunk {i+1} was not created successfully")
-                        
-                except subprocess.TimeoutExpired as e:
-                    logger.error(f"Chunk {i+1} ffmpeg timeout after 60s")
-                    continue
-                except subprocess.CalledProcessError as e:
-                    logger.error(f"Failed to create chunk {i+1}: {e}")
-                    logger.debug(f"ffmpeg stderr: {e.stderr}")
-                    logger.debug(f"ffmpeg stdout: {e.stdout}")
-                    continue
-                
-                pbar.update(1)
-                pbar.set_postfix(chunk=f"{i+1}/{num_chunks}")
+
+        chunks = _split_by_stream_copy(
+            working_path, num_chunks, chunk_duration, temp_dir, safe_base_name, max_chunk_size_mb
+        )
+        if chunks is None:
+            chunks = _split_by_reencoding(
+                working_path, num_chunks, chunk_duration, temp_dir, safe_base_name, settings
+            )
+
+        if not chunks:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
         logger.info(f"Split audio into {len(chunks)} chunks of max {max_chunk_size_mb} MB each")
         
@@ -225,6 +432,10 @@ def split_audio_by_size(audio_path, max_chunk_size_mb=None):
         if e.__cause__:
             logger.debug(f"Audio splitting root cause: {type(e).__cause__.__name__}: {str(e.__cause__)}")
         
+        # Don't leave partial chunks behind (they may be held in RAM)
+        if 'temp_dir' in locals():
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
         # Clean up temporary safe file if created
         try:
             if 'needs_rename' in locals() and needs_rename and 'safe_path' in locals() and safe_path.exists():
@@ -167,3 +167,18 @@ class TranscriptionProvider(ABC):
             [1.50s]: world
         """
         pass
+
+    async def preload(self) -> None:
+        """
+        Warm up the provider ahead of the first transcribe() call.
+
+        Callers may start this concurrently with audio download so that slow
+        setup (e.g. loading local model weights) overlaps with it. The default
+        does nothing; failures are logged, not raised, since transcribe()
+        reports them.
+
+        Example:
+            >>> preload_task = asyncio.create_task(provider.preload())
+            >>> audio = await youtube_service.download_audio(url, output_dir)
+            >>> result = await provider.transcribe(audio, config)
+        """
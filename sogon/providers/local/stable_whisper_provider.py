@@ -26,6 +26,9 @@ from sogon.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Model transcribe() currently runs with regardless of the configured one
+_TRANSCRIBE_MODEL_NAME = "large-v3-turbo"
+
 
 class StableWhisperProvider(TranscriptionProvider):
     """
@@ -150,6 +153,32 @@ class StableWhisperProvider(TranscriptionProvider):
 
         logger.info(f"Configuration validated for {self.provider_name}")
 
+    async def preload(self) -> None:
+        """
+        Load the transcription model into the cache ahead of transcribe().
+
+        A concurrent transcribe() waits on the same per-model download lock
+        and reuses the result instead of loading the weights twice.
+        """
+        # Mirror the model transcribe() runs with, without touching self.config
+        config = self.config.model_copy(update={"model_name": _TRANSCRIBE_MODEL_NAME})
+        model_key = ModelKey(
+            model_name=config.model_name,
+            device=config.device,
+            compute_type=config.compute_type,
+        )
+        try:
+            self._resource_monitor.validate_resources_for_model(
+                model_name=config.model_name,
+                device=config.device,
+                required_ram_gb=config.get_min_ram_gb(),
+                required_vram_gb=config.get_min_vram_gb(),
+            )
+            await self._model_manager.get_model(model_key)
+            logger.info(f"Preloaded model: {model_key}")
+        except Exception as e:
+            logger.warning(f"Model preload failed for {model_key}: {e}")
+
     async def transcribe(
         self,
         audio_file,  # AudioFile
@@ -172,7 +201,7 @@ class StableWhisperProvider(TranscriptionProvider):
         async with self._semaphore:  # Limit concurrent jobs (FR-022)
             
             # TODO: Need to replace input model
-            self.config.model_name = "large-v3-turbo"
+            self.config.model_name = _TRANSCRIBE_MODEL_NAME
             
             logger.info(
                 f"Starting transcription: {audio_file.path}, "
@@ -191,7 +220,7 @@ class StableWhisperProvider(TranscriptionProvider):
                 required_vram_gb=required_vram_gb,
             )
 
-            # Get model (from cache or download)
+            # Get model (from cache, preload, or download)
             model_key = ModelKey(
                 model_name=self.config.model_name,
                 device=self.config.device,
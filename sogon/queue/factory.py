@@ -31,7 +31,7 @@ def create_queue(
         >>> # In-memory queue (default)
         >>> queue = create_queue("memory", max_size=150)
 
-        >>> # Redis queue (future)
+        >>> # Redis queue (shared with standalone workers)
         >>> queue = create_queue("redis", redis_url="redis://localhost:6379/0")
 
         >>> # Celery queue (future)
@@ -39,7 +39,7 @@ def create_queue(
 
     Migration path:
         Current: memory (asyncio.Queue)
-        Future: redis (when > 1,000 jobs/day or multi-instance needed)
+        Current: redis (when > 1,000 jobs/day or multi-instance needed)
         Future: celery (when complex workflows with chaining/retries needed)
     """
     if backend == "memory":
@@ -47,12 +47,11 @@ def create_queue(
         return MemoryJobQueue(max_size=max_size)
 
     elif backend == "redis":
-        # Future implementation
-        raise NotImplementedError(
-            "Redis queue backend not yet implemented. "
-            "Use 'memory' backend for now. "
-            "Migration guide: See docs/queue_migration_guide.md"
-        )
+        validate_queue_config(backend, **kwargs)
+        from .redis_queue import RedisJobQueue
+
+        logger.info(f"Creating RedisJobQueue with max_size={max_size}")
+        return RedisJobQueue(max_size=max_size, **kwargs)
 
     elif backend == "celery":
         # Future implementation
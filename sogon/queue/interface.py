@@ -38,6 +38,19 @@ class JobQueue(Protocol):
         """
         ...
 
+    async def complete(self, job_id: str) -> None:
+        """
+        Acknowledge that a dequeued job has finished processing.
+
+        Args:
+            job_id: Job identifier returned by dequeue()
+
+        Note:
+            Durable queues keep a dequeued job until it is completed, so jobs
+            held by a crashed worker can be handed out again.
+        """
+        ...
+
     async def peek(self) -> Optional[str]:
         """
         View the next job ID without removing it from the queue.
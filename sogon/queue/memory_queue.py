@@ -114,6 +114,18 @@ class MemoryJobQueue:
                 logger.error(f"Dequeue error: {e}")
                 await asyncio.sleep(0.1)  # Brief pause before retry
 
+    async def complete(self, job_id: str) -> None:
+        """
+        Acknowledge that a dequeued job has finished processing.
+
+        Args:
+            job_id: Job identifier returned by dequeue()
+        """
+        async with self._lock:
+            # A job cancelled while running is never skipped by dequeue
+            self._cancelled_jobs.discard(job_id)
+        self.task_done()
+
     async def peek(self) -> Optional[str]:
         """
         View next job without removing it.
@@ -0,0 +1,196 @@
+"""Redis job queue implementation for multi-process workers."""
+
+import logging
+import os
+import socket
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RedisJobQueue:
+    """
+    Redis-backed FIFO job queue using a list plus a cancellation set.
+
+    Features:
+    - Shared between API processes and standalone workers (python -m sogon.workers)
+    - Non-blocking enqueue with backpressure (rejects when full)
+    - Blocking dequeue with a short poll timeout so workers can observe shutdown
+    - Reliable dequeue: jobs stay in a per-consumer processing list until
+      complete() is called, and are requeued when that consumer restarts
+    - Job cancellation support across processes
+
+    Storage structure:
+        {name}                          list of job IDs (LPUSH / BLMOVE)
+        {name}:processing:{consumer}    list of job IDs being worked on by a consumer
+        {name}:cancelled                set of job IDs to skip on dequeue
+    """
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        max_size: int = 150,
+        name: str = "sogon:queue",
+        block_timeout: float = 0.5,
+        client=None,
+        consumer: Optional[str] = None
+    ):
+        """
+        Initialize Redis queue.
+
+        Args:
+            redis_url: Redis connection URL
+            max_size: Maximum queue capacity. When full, enqueue returns False.
+            name: Redis key of the job list
+            block_timeout: Seconds dequeue blocks before returning None
+            client: Existing redis.asyncio.Redis client (overrides redis_url)
+            consumer: Name of this consumer's processing list. Jobs a crashed
+                consumer was working on are requeued when a consumer with the
+                same name next dequeues, so give each worker a stable, unique
+                name (defaults to hostname:pid, which never recovers)
+        """
+        if client is None:
+            from redis.asyncio import Redis
+            client = Redis.from_url(redis_url, decode_responses=True)
+
+        self.max_size = max_size
+        self.name = name
+        self.block_timeout = block_timeout
+        self.consumer = consumer or f"{socket.gethostname()}:{os.getpid()}"
+        self._cancelled_key = f"{name}:cancelled"
+        self._processing_key = f"{name}:processing:{self.consumer}"
+        self._recovered = False
+        self._redis = client
+
+        logger.info(f"Initialized RedisJobQueue '{name}' with max_size={max_size}")
+
+    async def enqueue(self, job_id: str) -> bool:
+        """
+        Enqueue job ID for processing.
+
+        Args:
+            job_id: Unique job identifier
+
+        Returns:
+            True if enqueued successfully, False if queue is full
+        """
+        async def push(pipe) -> bool:
+            # Runs under WATCH, so concurrent enqueues can't overfill the queue
+            if await pipe.llen(self.name) >= self.max_size:
+                return False
+            pipe.multi()
+            pipe.lpush(self.name, job_id)
+            return True
+
+        try:
+            pushed = await self._redis.transaction(push, self.name, value_from_callable=True)
+            if not pushed:
+                logger.warning(f"Queue full, rejecting job {job_id}")
+                return False
+
+            logger.debug(f"Enqueued job {job_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Enqueue error for job {job_id}: {e}")
+            return False
+
+    async def dequeue(self) -> Optional[str]:
+        """
+        Dequeue next job ID.
+
+        The job is moved to this consumer's processing list in the same
+        command, so it is not lost if the consumer dies before finishing it.
+        Call complete() once the job is done.
+
+        Returns:
+            Job ID if available, None if nothing arrived within block_timeout
+        """
+        if not self._recovered:
+            await self._requeue_processing()
+            self._recovered = True
+
+        while True:
+            job_id = await self._redis.blmove(
+                self.name, self._processing_key, self.block_timeout, "RIGHT", "LEFT"
+            )
+            if job_id is None:
+                return None
+
+            if await self._redis.sismember(self._cancelled_key, job_id):
+                logger.info(f"Skipping cancelled job: {job_id}")
+                await self.complete(job_id)
+                continue
+
+            logger.debug(f"Dequeued job {job_id}")
+            return job_id
+
+    async def complete(self, job_id: str) -> None:
+        """
+        Acknowledge that a dequeued job finished (successfully or not).
+
+        Args:
+            job_id: Job returned by dequeue()
+        """
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.lrem(self._processing_key, 1, job_id)
+            pipe.srem(self._cancelled_key, job_id)
+            await pipe.execute()
+
+    async def _requeue_processing(self) -> None:
+        """Put jobs left in this consumer's processing list back at the front of the queue."""
+        count = 0
+        while await self._redis.lmove(self._processing_key, self.name, "LEFT", "RIGHT"):
+            count += 1
+
+        if count:
+            logger.warning(f"Requeued {count} unfinished jobs from consumer {self.consumer}")
+
+    async def peek(self) -> Optional[str]:
+        """View next job without removing it."""
+        return await self._redis.lindex(self.name, -1)
+
+    async def cancel(self, job_id: str) -> bool:
+        """
+        Mark job as cancelled (will be skipped during dequeue).
+
+        Args:
+            job_id: Job to cancel
+
+        Returns:
+            True (optimistic cancellation - actual check during dequeue)
+        """
+        await self._redis.sadd(self._cancelled_key, job_id)
+        logger.info(f"Marked job {job_id} as cancelled")
+        return True
+
+    async def size(self) -> int:
+        """Get current queue size."""
+        return await self._redis.llen(self.name)
+
+    async def clear(self) -> int:
+        """
+        Clear all jobs from queue.
+
+        Returns:
+            Number of jobs removed
+        """
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.llen(self.name)
+            pipe.delete(self.name, self._cancelled_key)
+            count, _ = await pipe.execute()
+
+        logger.info(f"Cleared {count} jobs from queue")
+        return count
+
+    async def is_empty(self) -> bool:
+        """Check if queue is empty."""
+        return await self.size() == 0
+
+    async def is_full(self) -> bool:
+        """Check if queue is at capacity."""
+        return await self.size() >= self.max_size
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self._redis.aclose()
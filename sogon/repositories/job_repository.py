@@ -74,6 +74,18 @@ class FileBasedJobRepository(JobRepository):
         """Get file path for job."""
         return self.storage_dir / f"{job_id}.json"
 
+    @staticmethod
+    def _write_job_file(job_file: Path, data: dict) -> None:
+        """Write job data atomically via temp file and rename (blocking)."""
+        temp_file = job_file.with_suffix(".tmp")
+
+        # Write to temp file
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+        # Atomic rename
+        temp_file.replace(job_file)
+
     async def save_job(self, job: ProcessingJob) -> bool:
         """
         Save job with atomic write.
@@ -89,16 +101,12 @@ class FileBasedJobRepository(JobRepository):
                 # Update cache
                 self._cache[job.id] = job
 
-                # Write to file atomically
+                # Write to file atomically off the event loop
                 job_file = self._get_job_file_path(job.id)
-                temp_file = job_file.with_suffix(".tmp")
-
-                # Write to temp file
-                with open(temp_file, "w", encoding="utf-8") as f:
-                    json.dump(job.to_dict(), f, indent=2, ensure_ascii=False)
-
-                # Atomic rename
-                temp_file.replace(job_file)
+                loop = asyncio.get_event_loop()
+                await loop.run_in_executor(
+                    None, self._write_job_file, job_file, job.to_dict()
+                )
 
                 logger.debug(f"Saved job {job.id} to {job_file}")
                 return True
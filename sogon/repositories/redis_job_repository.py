@@ -0,0 +1,324 @@
+"""
+Job repository implementation with Redis persistence
+"""
+
+import json
+import logging
+from typing import Optional, List, Dict, Any
+from datetime import datetime, timedelta
+
+from .interfaces import JobRepository
+from ..models.job import ProcessingJob, JobStatus
+from ..exceptions.base import SogonConfigurationError
+
+logger = logging.getLogger(__name__)
+
+
+class RedisJobRepository(JobRepository):
+    """
+    Redis-backed job repository for multi-process deployments.
+
+    Features:
+    - Job state shared across all API workers (uvicorn --workers N)
+    - State survives API restarts
+    - O(1) status lookup per request
+
+    Storage structure:
+        job:{job_id}    hash, one field per ProcessingJob.to_dict() key (JSON-encoded);
+                        finished jobs expire after job_ttl_seconds when set
+        jobs:index      sorted set of job IDs scored by created_at timestamp
+    """
+
+    KEY_PREFIX = "job:"
+    INDEX_KEY = "jobs:index"
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        client=None,
+        job_ttl_seconds: Optional[int] = None
+    ):
+        """
+        Initialize repository.
+
+        Args:
+            redis_url: Redis connection URL
+            client: Existing redis.asyncio.Redis client (overrides redis_url)
+            job_ttl_seconds: Expire finished jobs this long after their last save
+                (None keeps them until deleted)
+        """
+        if client is None:
+            try:
+                from redis.asyncio import Redis
+            except ImportError as e:
+                raise SogonConfigurationError(
+                    "Redis job store requires the 'redis' package. "
+                    "Install it with: pip install sogon[redis]",
+                    setting_name="SOGON_JOB_STORE",
+                    setting_value="redis",
+                    cause=e
+                )
+            client = Redis.from_url(redis_url, decode_responses=True)
+
+        self.redis_url = redis_url
+        self.job_ttl_seconds = job_ttl_seconds
+        self._redis = client
+
+        logger.info(f"Initialized RedisJobRepository at {redis_url}")
+
+    def _job_key(self, job_id: str) -> str:
+        """Get hash key for job."""
+        return f"{self.KEY_PREFIX}{job_id}"
+
+    @staticmethod
+    def _encode(data: Dict[str, Any]) -> Dict[str, str]:
+        """Encode job fields as JSON strings for hash storage."""
+        return {key: json.dumps(value, ensure_ascii=False) for key, value in data.items()}
+
+    @staticmethod
+    def _decode(data: Dict[str, str]) -> Dict[str, Any]:
+        """Decode JSON-encoded hash fields."""
+        return {key: json.loads(value) for key, value in data.items()}
+
+    async def save_job(self, job: ProcessingJob) -> bool:
+        """
+        Save job to Redis.
+
+        Args:
+            job: Job to save
+
+        Returns:
+            True if saved successfully
+        """
+        try:
+            key = self._job_key(job.id)
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping=self._encode(job.to_dict()))
+                pipe.zadd(self.INDEX_KEY, {job.id: job.created_at.timestamp()})
+                if self.job_ttl_seconds and job.status.is_terminal:
+                    # Index entries of expired hashes are pruned on the next read
+                    pipe.expire(key, self.job_ttl_seconds)
+                await pipe.execute()
+
+            logger.debug(f"Saved job {job.id} to Redis")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to save job {job.id}: {e}")
+            return False
+
+    async def get_job(self, job_id: str) -> Optional[ProcessingJob]:
+        """
+        Get job by ID.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job if found, None otherwise
+        """
+        try:
+            data = await self._redis.hgetall(self._job_key(job_id))
+            if not data:
+                return None
+            return ProcessingJob.from_dict(self._decode(data))
+
+        except Exception as e:
+            logger.error(f"Failed to load job {job_id}: {e}")
+            return None
+
+    async def update_job_status(self, job_id: str, status: JobStatus) -> bool:
+        """
+        Update job status.
+
+        Args:
+            job_id: Job identifier
+            status: New status
+
+        Returns:
+            True if updated successfully
+        """
+        key = self._job_key(job_id)
+
+        async def update(pipe) -> bool:
+            # Runs under WATCH, so the job can't be deleted or expire between
+            # the existence check and the write
+            if not await pipe.exists(key):
+                return False
+            pipe.multi()
+            pipe.hset(key, "status", json.dumps(status.value))
+            if self.job_ttl_seconds and status.is_terminal:
+                pipe.expire(key, self.job_ttl_seconds)
+            return True
+
+        try:
+            updated = await self._redis.transaction(update, key, value_from_callable=True)
+            if updated:
+                logger.debug(f"Updated job {job_id} status to {status.value}")
+            return updated
+
+        except Exception as e:
+            logger.error(f"Failed to update job {job_id} status: {e}")
+            return False
+
+    async def _load_jobs(self, job_ids: List[str]) -> List[ProcessingJob]:
+        """Fetch multiple jobs in one round trip, pruning IDs whose hash is gone."""
+        if not job_ids:
+            return []
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                pipe.hgetall(self._job_key(job_id))
+            results = await pipe.execute()
+
+        jobs = []
+        stale_ids = []
+        for job_id, data in zip(job_ids, results):
+            if not data:
+                stale_ids.append(job_id)
+                continue
+            try:
+                jobs.append(ProcessingJob.from_dict(self._decode(data)))
+            except Exception as e:
+                logger.error(f"Failed to decode job {job_id}: {e}")
+
+        if stale_ids:
+            await self._redis.zrem(self.INDEX_KEY, *stale_ids)
+
+        return jobs
+
+    async def _get_statuses(self, job_ids: List[str]) -> Dict[str, str]:
+        """Fetch the status field for multiple jobs in one round trip."""
+        if not job_ids:
+            return {}
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                pipe.hget(self._job_key(job_id), "status")
+            results = await pipe.execute()
+
+        return {
+            job_id: json.loads(value)
+            for job_id, value in zip(job_ids, results)
+            if value is not None
+        }
+
+    async def _get_ids_by_status(self, status: JobStatus) -> List[str]:
+        """Get IDs of jobs with the given status, newest first."""
+        job_ids = await self._redis.zrevrange(self.INDEX_KEY, 0, -1)
+        statuses = await self._get_statuses(job_ids)
+        return [job_id for job_id in job_ids if statuses.get(job_id) == status.value]
+
+    async def get_jobs_by_status(self, status: JobStatus) -> List[ProcessingJob]:
+        """
+        Get jobs by status.
+
+        Args:
+            status: Job status to filter by
+
+        Returns:
+            List of jobs with matching status
+        """
+        return await self._load_jobs(await self._get_ids_by_status(status))
+
+    async def list_jobs(
+        self,
+        status: Optional[JobStatus] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[ProcessingJob]:
+        """
+        List jobs with filtering and pagination.
+
+        Args:
+            status: Optional status filter
+            limit: Maximum jobs to return
+            offset: Number of jobs to skip
+
+        Returns:
+            List of jobs sorted by created_at descending
+        """
+        if status is None:
+            job_ids = await self._redis.zrevrange(
+                self.INDEX_KEY, offset, offset + limit - 1
+            )
+            return await self._load_jobs(job_ids)
+
+        job_ids = await self._get_ids_by_status(status)
+        return await self._load_jobs(job_ids[offset:offset + limit])
+
+    async def delete_job(self, job_id: str) -> bool:
+        """
+        Delete job from Redis.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            True if deleted successfully
+        """
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.delete(self._job_key(job_id))
+                pipe.zrem(self.INDEX_KEY, job_id)
+                await pipe.execute()
+
+            logger.info(f"Deleted job {job_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to delete job {job_id}: {e}")
+            return False
+
+    async def cleanup_old_jobs(self, days: int = 7) -> int:
+        """
+        Clean up old completed/failed jobs.
+
+        Args:
+            days: Delete jobs older than this many days
+
+        Returns:
+            Number of jobs deleted
+        """
+        try:
+            cutoff = datetime.now() - timedelta(days=days)
+            job_ids = await self._redis.zrange(self.INDEX_KEY, 0, -1)
+
+            deleted_count = 0
+            for job in await self._load_jobs(job_ids):
+                if job.status.is_terminal and job.completed_at and job.completed_at < cutoff:
+                    if await self.delete_job(job.id):
+                        deleted_count += 1
+
+            if deleted_count > 0:
+                logger.info(f"Cleaned up {deleted_count} old jobs (>{days} days)")
+
+            return deleted_count
+
+        except Exception as e:
+            logger.error(f"Failed to cleanup old jobs: {e}")
+            return 0
+
+    async def get_stats(self) -> dict:
+        """
+        Get repository statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        job_ids = await self._redis.zrange(self.INDEX_KEY, 0, -1)
+        statuses = await self._get_statuses(job_ids)
+
+        status_counts = {}
+        for status in statuses.values():
+            status_counts[status] = status_counts.get(status, 0) + 1
+
+        return {
+            "total_jobs": len(statuses),
+            "status_counts": status_counts,
+            "backend": "redis"
+        }
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self._redis.aclose()
@@ -1,17 +1,28 @@
 """
 Services module - Business logic layer
+
+Implementations are imported on first attribute access (PEP 562) so that
+importing the package does not pull in the API clients and downloaders
+behind them.
 """
 
+from importlib import import_module
+
 from .interfaces import (
     AudioService,
     TranscriptionService,
     YouTubeService,
     FileService
 )
-from .audio_service import AudioServiceImpl
-from .transcription_service import TranscriptionServiceImpl
-from .youtube_service import YouTubeServiceImpl
-from .file_service import FileServiceImpl
+
+# Implementation name -> submodule defining it
+_LAZY_IMPORTS = {
+    "AudioServiceImpl": ".audio_service",
+    "TranscriptionServiceImpl": ".transcription_service",
+    "YouTubeServiceImpl": ".youtube_service",
+    "FileServiceImpl": ".file_service",
+    "TranslationServiceImpl": ".translation_service",
+}
 
 __all__ = [
     # Interfaces
@@ -24,4 +35,20 @@ __all__ = [
     "TranscriptionServiceImpl",
     "YouTubeServiceImpl",
     "FileServiceImpl",
-]
\ No newline at end of file
+    "TranslationServiceImpl",
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache in the module dict so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -14,7 +14,7 @@ from concurrent.futures import ThreadPoolExecutor
 from .interfaces import AudioService
 from ..models.audio import AudioFile, AudioChunk
 from ..exceptions.audio import AudioProcessingError, UnsupportedAudioFormatError
-from ..downloader import split_audio_by_size
+from ..downloader import remove_chunk_dir, split_audio_by_size
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -127,6 +127,7 @@ class AudioServiceImpl(AudioService):
                     cleaned_count += 1
             except Exception as e:
                 logger.warning(f"Failed to cleanup chunk {chunk.path}: {e}")
+        remove_chunk_dir([chunk.path for chunk in chunks])
         
         logger.info(f"Cleaned up {cleaned_count}/{len(chunks)} chunks")
         return cleaned_count
@@ -199,4 +199,9 @@ class WorkflowService(ABC):
     @abstractmethod
     async def get_job_status(self, job_id: str) -> JobStatus:
         """Get processing job status"""
+        pass
+
+    @abstractmethod
+    async def wait_for_job(self, job_id: str) -> JobStatus:
+        """Wait for a background job to finish and return its final status"""
         pass
\ No newline at end of file
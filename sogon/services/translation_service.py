@@ -4,9 +4,10 @@ Translation service implementation using LLM
 
 import asyncio
 import logging
+import random
 import time
 from typing import List
-from openai import AsyncOpenAI
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, RateLimitError
 
 from .interfaces import TranslationService
 from ..models.translation import TranslationResult, TranslationRequest, SupportedLanguage, TranslationSegment
@@ -15,6 +16,10 @@ from ..exceptions.base import SogonError
 
 logger = logging.getLogger(__name__)
 
+# Transient API failures worth retrying (429, 5xx, connection errors and timeouts);
+# anything else (bad request, auth) fails on the first attempt
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
 
 class TranslationError(SogonError):
     """Translation specific error"""
@@ -113,14 +118,25 @@ class TranslationServiceImpl(TranslationService):
         # Use default chunk size if not provided (2x concurrent requests for better throughput)
         if chunk_size is None:
             chunk_size = self.max_concurrent_requests * 2
-        
+
+        # Translate each distinct text once; repeated segments ("Thank you.", "[Music]")
+        # share the result instead of costing another LLM call
+        unique_texts = list(dict.fromkeys(texts))
+        if len(unique_texts) < len(texts):
+            logger.info(f"Translating {len(unique_texts)} unique texts for {len(texts)} segments")
+
         # Process in chunks if the batch is large
-        if len(texts) > chunk_size:
-            logger.info(f"Large batch detected ({len(texts)} texts), processing in chunks of {chunk_size}")
-            return await self._translate_large_batch(texts, target_language, source_language, chunk_size)
-        
-        # Process normal-sized batch
-        return await self._translate_chunk(texts, target_language, source_language)
+        if len(unique_texts) > chunk_size:
+            logger.info(f"Large batch detected ({len(unique_texts)} texts), processing in chunks of {chunk_size}")
+            results = await self._translate_large_batch(unique_texts, target_language, source_language, chunk_size)
+        else:
+            # Process normal-sized batch
+            results = await self._translate_chunk(unique_texts, target_language, source_language)
+
+        if len(unique_texts) == len(texts):
+            return results
+        results_by_text = dict(zip(unique_texts, results))
+        return [results_by_text[text] for text in texts]
     
     async def _translate_large_batch(
         self, 
@@ -235,11 +251,12 @@ class TranslationServiceImpl(TranslationService):
                     processing_time=processing_time
                 )
                 
-            except Exception as e:
+            except _RETRYABLE_ERRORS as e:
                 last_exception = e
                 if attempt < max_retries:
-                    wait_time = (2 ** attempt) * 0.5  # Exponential backoff: 0.5, 1, 2 seconds
-                    logger.warning(f"Translation attempt {attempt + 1} failed: {e}. Retrying in {wait_time}s...")
+                    # Exponential backoff (0.5, 1, 2s) with jitter so concurrent retries spread out
+                    wait_time = (2 ** attempt) * 0.5 * (1 + random.random())
+                    logger.warning(f"Translation attempt {attempt + 1} failed: {e}. Retrying in {wait_time:.1f}s...")
                     await asyncio.sleep(wait_time)
                 else:
                     logger.error(f"Translation failed after {max_retries + 1} attempts: {e}")
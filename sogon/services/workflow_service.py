@@ -7,7 +7,7 @@ import logging
 import uuid
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 from .interfaces import WorkflowService, AudioService, TranscriptionService, YouTubeService, FileService, TranslationService
 from ..models.job import ProcessingJob, JobStatus, JobType
@@ -40,6 +40,8 @@ class WorkflowServiceImpl(WorkflowService):
 
         # In-memory job storage (in production, use repository)
         self._jobs = {}
+        # Background workflow tasks for CLI-mode jobs, awaited by wait_for_job
+        self._tasks: Dict[str, asyncio.Task] = {}
     
     async def process_youtube_url(
         self,
@@ -82,7 +84,7 @@ class WorkflowServiceImpl(WorkflowService):
             self._jobs[job.id] = job
 
             # Start processing in background (CLI mode)
-            asyncio.create_task(self._process_youtube_workflow(job))
+            self._tasks[job.id] = asyncio.create_task(self._process_youtube_workflow(job))
         else:
             # Worker mode - process synchronously
             await self._process_youtube_workflow(job)
@@ -130,7 +132,7 @@ class WorkflowServiceImpl(WorkflowService):
             self._jobs[job.id] = job
 
             # Start processing in background (CLI mode)
-            asyncio.create_task(self._process_local_file_workflow(job))
+            self._tasks[job.id] = asyncio.create_task(self._process_local_file_workflow(job))
         else:
             # Worker mode - process synchronously
             await self._process_local_file_workflow(job)
@@ -141,6 +143,15 @@ class WorkflowServiceImpl(WorkflowService):
         """Get processing job status"""
         job = self._jobs.get(job_id)
         return job.status if job else JobStatus.NOT_FOUND
+
+    async def wait_for_job(self, job_id: str) -> JobStatus:
+        """Wait for a background job to finish and return its final status"""
+        task = self._tasks.get(job_id)
+        if task is not None:
+            # Shield so a caller-side timeout doesn't cancel the workflow itself
+            await asyncio.shield(task)
+            self._tasks.pop(job_id, None)
+        return await self.get_job_status(job_id)
     
     async def _process_youtube_workflow(self, job: ProcessingJob) -> None:
         """Internal workflow for YouTube URL processing"""
@@ -248,7 +259,7 @@ class WorkflowServiceImpl(WorkflowService):
                     import shutil
                     output_audio_path = actual_output_dir / audio_file.path.name
                     try:
-                        shutil.copy2(audio_file.path, output_audio_path)
+                        await asyncio.to_thread(shutil.copy2, audio_file.path, output_audio_path)
                         logger.info(f"Saved extracted audio to: {output_audio_path}")
                     except Exception as e:
                         logger.warning(f"Failed to save extracted audio: {e}")
@@ -273,6 +284,7 @@ class WorkflowServiceImpl(WorkflowService):
     
     async def _process_audio_file(self, job: ProcessingJob, audio_file: AudioFile, base_name: str) -> None:
         """Common audio processing logic"""
+        chunks = []
         try:
             # Step 1: Split audio if needed
             logger.info(f"Analyzing audio file: {audio_file}")
@@ -293,60 +305,72 @@ class WorkflowServiceImpl(WorkflowService):
             if not transcription.text.strip():
                 raise JobError("Transcription returned empty result")
             
-            # Step 3: Save original transcription
+            # Step 3: Save original transcription in the background so the
+            # writes overlap with translation
             output_dir = Path(job.actual_output_dir)
-            await self.file_service.save_transcription(
-                transcription, output_dir, base_name, job.subtitle_format
-            )
-            await self.file_service.save_timestamps(
-                transcription, output_dir, base_name
-            )
-            await self.file_service.save_metadata(
-                transcription.to_dict(), output_dir, base_name
-            )
-            
-            # Step 4: Apply translation if enabled
-            if job.enable_translation and job.translation_target_language and self.translation_service:
-                logger.info(f"Applying translation to {job.translation_target_language}")
-                job.status = JobStatus.TRANSLATING
-                
-                target_language = SupportedLanguage(job.translation_target_language)
-                translation_result = await self.translation_service.translate_transcription(
-                    transcription, target_language, job.whisper_source_language
-                )
-                
-                # Save translated version
-                suffix = "_translated"
-                
-                # Convert translation result to transcription format for saving
-                translated_transcription = self._translation_to_transcription(translation_result, transcription)
+            original_saves = asyncio.ensure_future(self._save_outputs(
+                transcription, transcription.to_dict(), output_dir, base_name, job.subtitle_format
+            ))
 
-                await self.file_service.save_transcription(
-                    translated_transcription, output_dir, f"{base_name}{suffix}", job.subtitle_format
-                )
-                await self.file_service.save_timestamps(
-                    translated_transcription, output_dir, f"{base_name}{suffix}"
-                )
-                await self.file_service.save_metadata(
-                    translation_result.to_dict(), output_dir, f"{base_name}{suffix}"
-                )
-            
-            # Step 5: Cleanup chunks if multiple were created
-            if len(chunks) > 1:
-                await self.audio_service.cleanup_chunks(chunks)
+            try:
+                # Step 4: Apply translation if enabled
+                if job.enable_translation and job.translation_target_language and self.translation_service:
+                    logger.info(f"Applying translation to {job.translation_target_language}")
+                    job.status = JobStatus.TRANSLATING
+
+                    target_language = SupportedLanguage(job.translation_target_language)
+                    translation_result = await self.translation_service.translate_transcription(
+                        transcription, target_language, job.whisper_source_language
+                    )
+
+                    # Save translated version
+                    suffix = "_translated"
+
+                    # Convert translation result to transcription format for saving
+                    translated_transcription = self._translation_to_transcription(translation_result, transcription)
+
+                    job.translated_files = await self._save_outputs(
+                        translated_transcription, translation_result.to_dict(),
+                        output_dir, f"{base_name}{suffix}", job.subtitle_format
+                    )
+            finally:
+                # Drain the original writes even if translation failed
+                job.original_files = await original_saves
             
             logger.info(f"Audio processing completed for {audio_file.name}")
             
         except Exception as e:
             logger.error(f"Audio processing failed: {e}")
-            # Cleanup chunks on error
-            if 'chunks' in locals() and len(chunks) > 1:
+            raise
+        finally:
+            # Step 5: Cleanup chunks if multiple were created, including after
+            # errors or cancellation (they may be held in RAM)
+            if len(chunks) > 1:
                 try:
                     await self.audio_service.cleanup_chunks(chunks)
                 except Exception as cleanup_error:
-                    logger.warning(f"Failed to cleanup chunks after error: {cleanup_error}")
-            raise
+                    logger.warning(f"Failed to cleanup chunks: {cleanup_error}")
     
+    async def _save_outputs(
+        self,
+        transcription: TranscriptionResult,
+        metadata: dict,
+        output_dir: Path,
+        base_name: str,
+        format: str
+    ) -> Dict[str, str]:
+        """Write subtitle, timestamps and metadata files concurrently"""
+        subtitle_path, timestamps_path, metadata_path = await asyncio.gather(
+            self.file_service.save_transcription(transcription, output_dir, base_name, format),
+            self.file_service.save_timestamps(transcription, output_dir, base_name),
+            self.file_service.save_metadata(metadata, output_dir, base_name)
+        )
+        return {
+            "subtitle": str(subtitle_path),
+            "timestamps": str(timestamps_path),
+            "metadata": str(metadata_path)
+        }
+
     def _translation_to_transcription(
         self, 
         translation_result: TranslationResult, 
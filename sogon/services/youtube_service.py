@@ -3,10 +3,11 @@ YouTube service implementation
 """
 
 import os
+import shutil
 import logging
 import asyncio
 from pathlib import Path
-import yt_dlp
+from typing import Optional
 from .interfaces import YouTubeService
 from ..models.audio import AudioFile
 
@@ -14,15 +15,33 @@ logger = logging.getLogger(__name__)
 
 class YouTubeServiceImpl(YouTubeService):
     """Implementation of YouTubeService interface"""
+
+    # Cached audio lives in a subdirectory the service owns, so eviction never
+    # touches other files in a shared cache_dir
+    CACHE_SUBDIR = "sogon-youtube-audio"
     
-    def __init__(self, timeout: int = 30, retries: int = 3, preferred_format: str = "m4a"):
+    def __init__(
+        self,
+        timeout: int = 30,
+        retries: int = 3,
+        preferred_format: str = "m4a",
+        concurrent_fragments: int = 8,
+        cache_dir: Optional[Path] = None,
+        cache_max_size_gb: float = 5.0
+    ):
         self.timeout = timeout
         self.retries = retries
         self.preferred_format = preferred_format
+        self.concurrent_fragments = concurrent_fragments
+        self.cache_dir = cache_dir
+        self.cache_max_size_gb = cache_max_size_gb
+        self._audio_cache_dir = cache_dir / self.CACHE_SUBDIR if cache_dir is not None else None
     
     async def get_video_info(self, url: str) -> dict:
         """Get YouTube video information"""
         def _get_info():
+            import yt_dlp
+
             ydl_opts = {
                 'quiet': True,
                 'no_warnings': True
@@ -40,16 +59,26 @@ class YouTubeServiceImpl(YouTubeService):
     async def download_audio(self, url: str, output_dir: Path) -> AudioFile:
         """Download audio from YouTube video"""
         def _download():
+            # yt-dlp loads every extractor on import, so only pay for it when downloading
+            import yt_dlp
+
+            if self._audio_cache_dir is not None:
+                # Cached files are named by video ID so later runs can find them
+                outtmpl = str(self._audio_cache_dir / "%(id)s.%(ext)s")
+            else:
+                outtmpl = str(output_dir / "%(title)s.%(ext)s")
+
             ydl_opts = {
                 "format": "bestaudio[ext=m4a]/bestaudio/best",
                 "extractaudio": True,
                 "audioformat": self.preferred_format,
-                "outtmpl": str(output_dir / "%(title)s.%(ext)s"),
+                "outtmpl": outtmpl,
                 "socket_timeout": self.timeout,
                 "retries": self.retries,
                 "fragment_retries": self.retries,
-                "http_chunk_size": 5242880,
-                "concurrent_fragment_downloads": 4,
+                "http_chunk_size": 10485760,  # 10MB
+                "buffersize": 65536,  # 64KiB
+                "concurrent_fragment_downloads": self.concurrent_fragments,
                 "postprocessors": [
                     {
                         "key": "FFmpegExtractAudio",
@@ -62,6 +91,9 @@ class YouTubeServiceImpl(YouTubeService):
             }
             
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                if self._audio_cache_dir is not None:
+                    return self._download_cached(ydl, url, output_dir)
+
                 info = ydl.extract_info(url, download=True)
                 filename = ydl.prepare_filename(info)
                 
@@ -91,6 +123,54 @@ class YouTubeServiceImpl(YouTubeService):
             format=audio_path.suffix[1:]  # Remove the dot
         )
     
+    def _download_cached(self, ydl, url: str, output_dir: Path) -> Path:
+        """Download into the cache by video ID, or reuse a cached file, and link it into output_dir"""
+        self._audio_cache_dir.mkdir(parents=True, exist_ok=True)
+        info = ydl.extract_info(url, download=False)
+        cached_path = self._audio_cache_dir / f"{info['id']}.{self.preferred_format}"
+
+        if cached_path.exists():
+            logger.info(f"Using cached audio for {info['id']}: {cached_path}")
+            os.utime(cached_path)  # Mark as recently used for eviction
+        else:
+            ydl.process_ie_result(info, download=True)
+            if not cached_path.exists():
+                raise Exception(f"Downloaded audio file not found in {self._audio_cache_dir}")
+            self._evict_cache(keep=cached_path)
+
+        title_path = ydl.prepare_filename(info, outtmpl=str(output_dir / "%(title)s.%(ext)s"))
+        audio_path = Path(title_path).with_suffix(f".{self.preferred_format}")
+        if not audio_path.exists():
+            try:
+                os.link(cached_path, audio_path)
+            except OSError:
+                # Different filesystem or no hard link support
+                shutil.copy2(cached_path, audio_path)
+        return audio_path
+
+    def _evict_cache(self, keep: Path) -> None:
+        """Delete least recently used cached files until the cache fits its size limit"""
+        # Only finished cache entries; in-flight .part/.ytdl files of other downloads don't match
+        entries = [
+            (path, path.stat())
+            for path in self._audio_cache_dir.glob(f"*.{self.preferred_format}")
+            if path.is_file()
+        ]
+        total_bytes = sum(stat.st_size for _, stat in entries)
+        max_bytes = self.cache_max_size_gb * 1024 ** 3
+
+        for path, stat in sorted(entries, key=lambda entry: entry[1].st_atime):
+            if total_bytes <= max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+                total_bytes -= stat.st_size
+                logger.info(f"Evicted cached audio: {path}")
+            except OSError as e:
+                logger.warning(f"Failed to evict cached audio {path}: {e}")
+
     def is_valid_url(self, url: str) -> bool:
         """Check if URL is a valid YouTube URL"""
         return "youtube.com" in url or "youtu.be" in url
\ No newline at end of file
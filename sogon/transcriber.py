@@ -4,13 +4,34 @@ Audio transcription module
 
 import os
 import logging
+from functools import lru_cache
 from openai import OpenAI
 from tqdm import tqdm
-from .downloader import split_audio_by_size
+from .downloader import probe_audio, remove_chunk_dir, split_audio_by_size
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _get_client(api_key, base_url=None):
+    """
+    Get a shared OpenAI client for the given credentials
+
+    Chunks transcribed with the same key and endpoint reuse one connection
+    pool instead of opening new TLS connections per call.
+
+    Args:
+        api_key (str): API key
+        base_url (str): API base URL (uses the SDK default if not provided)
+
+    Returns:
+        OpenAI: Client with a 5 minute timeout
+    """
+    if base_url:
+        return OpenAI(api_key=api_key, base_url=base_url, timeout=300.0)
+    return OpenAI(api_key=api_key, timeout=300.0)
+
+
 def _convert_to_dict(obj):
     """Convert segment/word object to dictionary safely"""
     try:
@@ -102,13 +123,9 @@ def transcribe_audio(audio_file_path, api_key=None, source_language=None, model=
     else:
         logger.debug(f"Response format provided via parameter: {response_format}")
 
-    # Initialize OpenAI client with timeout
-    logger.debug("Initializing OpenAI client")
-    if base_url:
-        client = OpenAI(api_key=api_key, base_url=base_url, timeout=300.0)  # 5 minute timeout
-    else:
-        client = OpenAI(api_key=api_key, timeout=300.0)  # 5 minute timeout
+    client = _get_client(api_key, base_url)
 
+    audio_chunks = []
     try:
         # Check file size and split if necessary
         logger.debug(f"Starting audio file splitting: {audio_file_path}")
@@ -126,7 +143,6 @@ def transcribe_audio(audio_file_path, api_key=None, source_language=None, model=
         # Load each chunk to get actual durations (not assuming equal duration)
         chunk_start_times = []
         if len(audio_chunks) > 1:
-            from pydub import AudioSegment
             current_time_seconds = 0.0
             estimated_chunk_duration = None  # Cache estimated duration for reuse
             
@@ -136,14 +152,7 @@ def transcribe_audio(audio_file_path, api_key=None, source_language=None, model=
                 # Load each chunk to get its actual duration
                 try:
                     # Use ffprobe directly to get duration (avoid pydub stdin issue)
-                    import subprocess
-                    import json
-                    cmd = [
-                        'ffprobe', '-v', 'quiet', '-print_format', 'json',
-                        '-show_format', chunk_path
-                    ]
-                    result = subprocess.run(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL, check=True)
-                    info = json.loads(result.stdout)
+                    info = probe_audio(chunk_path)
                     chunk_duration_seconds = float(info['format']['duration'])
                     current_time_seconds += chunk_duration_seconds
                     logger.debug(f"Chunk {i+1} duration: {chunk_duration_seconds:.2f}s, starts at: {chunk_start_times[i]:.2f}s")
@@ -154,12 +163,7 @@ def transcribe_audio(audio_file_path, api_key=None, source_language=None, model=
                         # Calculate estimated duration only once
                         try:
                             # Use ffprobe for fallback duration calculation too
-                            cmd = [
-                                'ffprobe', '-v', 'quiet', '-print_format', 'json',
-                                '-show_format', audio_file_path
-                            ]
-                            result = subprocess.run(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL, check=True)
-                            info = json.loads(result.stdout)
+                            info = probe_audio(audio_file_path)
                             total_duration = float(info['format']['duration'])
                             estimated_chunk_duration = total_duration / len(audio_chunks)
                             logger.debug(f"Calculated estimated chunk duration: {estimated_chunk_duration:.2f}s")
@@ -198,15 +202,16 @@ def transcribe_audio(audio_file_path, api_key=None, source_language=None, model=
                             
                         response = client.audio.transcriptions.create(**transcription_params)
 
-                    # Log response details for debugging
-                    logger.debug(f"Chunk {i+1} Whisper API call successful")
-                    logger.debug(f"Chunk {i+1} response type: {type(response)}")
-                    logger.debug(f"Chunk {i+1} response.text type: {type(getattr(response, 'text', None))}, value: {getattr(response, 'text', 'N/A')[:100] if getattr(response, 'text', None) else 'None'}")
+                    # Log response details for debugging (skip dumping the response when debug is off)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Chunk {i+1} Whisper API call successful")
+                        logger.debug(f"Chunk {i+1} response type: {type(response)}")
+                        logger.debug(f"Chunk {i+1} response.text type: {type(getattr(response, 'text', None))}, value: {getattr(response, 'text', 'N/A')[:100] if getattr(response, 'text', None) else 'None'}")
 
-                    if hasattr(response, 'model_dump'):
-                        logger.debug(f"Chunk {i+1} full response dict: {response.model_dump()}")
-                    elif hasattr(response, '__dict__'):
-                        logger.debug(f"Chunk {i+1} response attributes: {response.__dict__}")
+                        if hasattr(response, 'model_dump'):
+                            logger.debug(f"Chunk {i+1} full response dict: {response.model_dump()}")
+                        elif hasattr(response, '__dict__'):
+                            logger.debug(f"Chunk {i+1} response attributes: {response.__dict__}")
                 except Exception as api_error:
                     logger.error(f"Chunk {i+1} Whisper transcription failed: {api_error}, cause: {api_error.__cause__ or 'unknown'}")
                     logger.debug(f"Chunk {i+1} API error details: {type(api_error).__name__}: {str(api_error)}")
@@ -236,10 +241,11 @@ def transcribe_audio(audio_file_path, api_key=None, source_language=None, model=
                 words = getattr(response, "words", []) if hasattr(response, "words") else []
 
                 # Debug: Log response structure
-                logger.debug(f"Chunk {i+1} response type: {type(response)}")
-                logger.debug(f"Chunk {i+1} response attributes: {dir(response)}")
-                logger.debug(f"Chunk {i+1} segments type: {type(segments)}, value: {segments}")
-                logger.debug(f"Chunk {i+1} words type: {type(words)}, value: {words}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Chunk {i+1} response type: {type(response)}")
+                    logger.debug(f"Chunk {i+1} response attributes: {dir(response)}")
+                    logger.debug(f"Chunk {i+1} segments type: {type(segments)}, value: {segments}")
+                    logger.debug(f"Chunk {i+1} words type: {type(words)}, value: {words}")
 
                 # Safety check: Ensure segments and words are iterable
                 if segments is None:
@@ -314,3 +320,6 @@ def transcribe_audio(audio_file_path, api_key=None, source_language=None, model=
         if e.__cause__:
             logger.debug(f"Audio conversion root cause: {type(e.__cause__).__name__}: {str(e.__cause__)}")
         return None, None
+    finally:
+        # Drop chunks left behind by failed or interrupted transcriptions
+        remove_chunk_dir(audio_chunks)
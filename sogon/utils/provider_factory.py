@@ -6,11 +6,49 @@ used by both CLI and API to ensure consistent provider instantiation.
 """
 
 import logging
-from typing import Optional
+from typing import Callable, Dict
+
+from sogon.config.settings import TranscriptionProvider
 
 logger = logging.getLogger(__name__)
 
 
+def _api_provider(settings):
+    """Legacy API-based providers (OpenAI, Groq) - return None to use existing flow"""
+    logger.info(f"Using API-based provider: {settings.transcription_provider}")
+    return None
+
+
+def _stable_whisper_provider(settings):
+    """Local model provider (stable-whisper)"""
+    # Lazy import to avoid circular dependency
+    from sogon.providers.local.stable_whisper_provider import StableWhisperProvider
+    from sogon.exceptions import ProviderNotAvailableError
+
+    # Create provider instance
+    local_config = settings.get_local_model_config()
+    provider = StableWhisperProvider(local_config)
+
+    # Check availability
+    if not provider.is_available:
+        deps = provider.get_required_dependencies()
+        raise ProviderNotAvailableError(
+            provider=settings.transcription_provider,
+            missing_dependencies=deps
+        )
+
+    logger.info(f"Created local provider: {provider.provider_name}")
+    return provider
+
+
+# Provider -> factory taking the settings object
+_PROVIDER_FACTORIES: Dict[TranscriptionProvider, Callable] = {
+    TranscriptionProvider.OPENAI: _api_provider,
+    TranscriptionProvider.GROQ: _api_provider,
+    TranscriptionProvider.STABLE_WHISPER: _stable_whisper_provider,
+}
+
+
 def get_transcription_provider(settings):
     """
     Get transcription provider based on settings.
@@ -27,31 +65,8 @@ def get_transcription_provider(settings):
     """
     provider_name = settings.transcription_provider
 
-    # Legacy API-based providers (OpenAI, Groq) - return None to use existing flow
-    if provider_name in ["openai", "groq"]:
-        logger.info(f"Using API-based provider: {provider_name}")
-        return None
-
-    # Local model provider (stable-whisper)
-    if provider_name == "stable-whisper":
-        # Lazy import to avoid circular dependency
-        from sogon.providers.local.stable_whisper_provider import StableWhisperProvider
-        from sogon.exceptions import ProviderNotAvailableError
-
-        # Create provider instance
-        local_config = settings.get_local_model_config()
-        provider = StableWhisperProvider(local_config)
-
-        # Check availability
-        if not provider.is_available:
-            deps = provider.get_required_dependencies()
-            raise ProviderNotAvailableError(
-                provider=provider_name,
-                missing_dependencies=deps
-            )
-
-        logger.info(f"Created local provider: {provider.provider_name}")
-        return provider
-
-    # Unknown provider
-    raise ValueError(f"Unknown transcription provider: {provider_name}")
+    factory = _PROVIDER_FACTORIES.get(provider_name)
+    if factory is None:
+        raise ValueError(f"Unknown transcription provider: {provider_name}")
+
+    return factory(settings)
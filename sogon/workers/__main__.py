@@ -0,0 +1,42 @@
+"""
+Standalone job worker entry point.
+
+Runs a JobWorker outside the API process so transcription capacity scales
+independently of HTTP workers. Requires shared state between processes:
+
+    SOGON_JOB_STORE=redis SOGON_QUEUE_BACKEND=redis python -m sogon.workers
+
+Start the API with SOGON_API_RUN_WORKER=false to leave all processing to
+standalone workers.
+"""
+
+import asyncio
+import logging
+
+from ..api.config import config
+from ..api.main import services
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker():
+    """Run the worker until SIGTERM/SIGINT, then release connections."""
+    if config.job_store != "redis" or config.queue_backend != "redis":
+        logger.warning(
+            "Standalone worker is using a process-local job store or queue; "
+            "set SOGON_JOB_STORE=redis and SOGON_QUEUE_BACKEND=redis to share jobs with the API"
+        )
+
+    try:
+        await services.worker.start()
+    finally:
+        await services.close()
+
+
+def main():
+    """Start a standalone job worker"""
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
@@ -52,6 +52,7 @@ class JobWorker:
 
         self._running = False
         self._tasks: set = set()
+        self._dequeue_task: Optional[asyncio.Task] = None
         self._semaphore = asyncio.Semaphore(max_concurrent_jobs)
         self._shutdown_event = asyncio.Event()
 
@@ -82,11 +83,23 @@ class JobWorker:
                 try:
                     # Check if we can accept more jobs
                     if len(self._tasks) < self.max_concurrent_jobs:
-                        # Dequeue next job (blocks until available)
-                        job_id = await asyncio.wait_for(
-                            self.queue.dequeue(),
+                        # Dequeue next job (blocks until available). The dequeue is
+                        # kept in flight across timeouts rather than cancelled, which
+                        # could drop a job the queue had already handed out
+                        if self._dequeue_task is None:
+                            self._dequeue_task = asyncio.create_task(self.queue.dequeue())
+                        done, _ = await asyncio.wait(
+                            {self._dequeue_task},
                             timeout=1.0  # 1 second timeout to check shutdown
                         )
+                        if not done:
+                            # No jobs available, check shutdown
+                            if self._shutdown_event.is_set():
+                                break
+                            continue
+
+                        dequeue_task, self._dequeue_task = self._dequeue_task, None
+                        job_id = dequeue_task.result()
 
                         if job_id:
                             logger.info(f"{self.worker_id} dequeued job: {job_id}")
@@ -98,14 +111,13 @@ class JobWorker:
                             self._tasks.add(task)
                             task.add_done_callback(self._tasks.discard)
                     else:
-                        # At capacity, brief wait
-                        await asyncio.sleep(0.5)
-
-                except asyncio.TimeoutError:
-                    # No jobs available, check shutdown
-                    if self._shutdown_event.is_set():
-                        break
-                    continue
+                        # At capacity, wake as soon as a job finishes (or on timeout
+                        # to check shutdown) instead of polling
+                        await asyncio.wait(
+                            self._tasks,
+                            timeout=1.0,
+                            return_when=asyncio.FIRST_COMPLETED
+                        )
 
                 except Exception as e:
                     logger.error(f"{self.worker_id} error in main loop: {e}")
@@ -114,6 +126,10 @@ class JobWorker:
         finally:
             logger.info(f"{self.worker_id} stopping...")
 
+            if self._dequeue_task is not None:
+                self._dequeue_task.cancel()
+                self._dequeue_task = None
+
             # Wait for all tasks to complete
             if self._tasks:
                 logger.info(
@@ -146,6 +162,13 @@ class JobWorker:
         async with self._semaphore:
             await self._process_job(job_id)
 
+        # Not in a finally: a job interrupted by cancellation stays with the
+        # queue so it can be handed out again
+        try:
+            await self.queue.complete(job_id)
+        except Exception as e:
+            logger.error(f"{self.worker_id} failed to acknowledge job {job_id}: {e}")
+
     async def _process_job(self, job_id: str):
         """
         Process a single job with retry logic.
@@ -165,8 +188,10 @@ class JobWorker:
                 logger.info(f"Skipping cancelled job: {job_id}")
                 return
 
-            # Mark job as dequeued
+            # Mark job as dequeued and started in a single write
             job.mark_dequeued()
+            if job.status == JobStatus.PENDING:
+                job.update_status(JobStatus.DOWNLOADING)
             await self.job_repository.save_job(job)
 
             logger.info(
@@ -16,8 +16,11 @@ class TestAPIConfig(unittest.TestCase):
         # Store original environment variables
         self.original_env = {}
         env_vars = [
-            'API_HOST', 'API_PORT', 'API_DEBUG', 'API_LOG_LEVEL',
-            'SOGON_OUTPUT_DIR', 'SOGON_ENABLE_CORRECTION', 'SOGON_USE_AI_CORRECTION'
+            'API_HOST', 'API_PORT', 'API_DEBUG', 'API_LOG_LEVEL', 'API_WORKERS',
+            'SOGON_OUTPUT_DIR', 'SOGON_ENABLE_CORRECTION', 'SOGON_USE_AI_CORRECTION',
+            'SOGON_JOB_STORE', 'SOGON_REDIS_URL', 'SOGON_QUEUE_BACKEND',
+            'SOGON_API_RUN_WORKER', 'SOGON_JOB_TTL_HOURS', 'SOGON_JOB_SWEEP_INTERVAL',
+            'SOGON_API_THREADS', 'SOGON_ACCEL_REDIRECT_PREFIX'
         ]
         for var in env_vars:
             self.original_env[var] = os.environ.get(var)
@@ -43,7 +46,16 @@ class TestAPIConfig(unittest.TestCase):
         self.assertEqual(config.port, 8000)
         self.assertEqual(config.debug, False)
         self.assertEqual(config.log_level, "INFO")
+        self.assertEqual(config.workers, 1)
         self.assertEqual(config.base_output_dir, "./result")
+        self.assertEqual(config.job_store, "file")
+        self.assertEqual(config.redis_url, "redis://localhost:6379/0")
+        self.assertEqual(config.queue_backend, "memory")
+        self.assertEqual(config.run_worker, True)
+        self.assertEqual(config.job_ttl_hours, 168.0)
+        self.assertEqual(config.job_sweep_interval_seconds, 300)
+        self.assertEqual(config.thread_pool_size, min(32, (os.cpu_count() or 4) * 2))
+        self.assertEqual(config.accel_redirect_prefix, "")
 
     def test_environment_variable_override_host(self):
         """Test host configuration from environment variable"""
@@ -91,6 +103,30 @@ class TestAPIConfig(unittest.TestCase):
         config = APIConfig()
         self.assertEqual(config.base_output_dir, '/custom/output/path')
 
+    def test_environment_variable_override_job_store(self):
+        """Test Redis job store configuration from environment variables"""
+        os.environ['SOGON_JOB_STORE'] = 'Redis'
+        os.environ['SOGON_REDIS_URL'] = 'redis://cache:6379/2'
+        config = APIConfig()
+        self.assertEqual(config.job_store, 'redis')
+        self.assertEqual(config.redis_url, 'redis://cache:6379/2')
+
+    def test_environment_variable_override_standalone_workers(self):
+        """Test queue backend and in-process worker toggle from environment variables"""
+        os.environ['SOGON_QUEUE_BACKEND'] = 'redis'
+        os.environ['SOGON_API_RUN_WORKER'] = 'false'
+        config = APIConfig()
+        self.assertEqual(config.queue_backend, 'redis')
+        self.assertEqual(config.run_worker, False)
+
+    def test_environment_variable_override_job_ttl(self):
+        """Test job expiry configuration from environment variables"""
+        os.environ['SOGON_JOB_TTL_HOURS'] = '1.5'
+        os.environ['SOGON_JOB_SWEEP_INTERVAL'] = '60'
+        config = APIConfig()
+        self.assertEqual(config.job_ttl_hours, 1.5)
+        self.assertEqual(config.job_sweep_interval_seconds, 60)
+
     def test_invalid_port_number(self):
         """Test invalid port number handling"""
         os.environ['API_PORT'] = 'invalid'
@@ -26,6 +26,7 @@ class TestAPIServer(unittest.TestCase):
         mock_config.port = 8000
         mock_config.debug = False
         mock_config.log_level = "INFO"
+        mock_config.workers = 1
         
         # Call main function
         api_server.main()
@@ -44,6 +45,7 @@ class TestAPIServer(unittest.TestCase):
             host="127.0.0.1",
             port=8000,
             reload=False,
+            workers=1,
             log_level="info"
         )
 
@@ -57,6 +59,7 @@ class TestAPIServer(unittest.TestCase):
         mock_config.port = 9000
         mock_config.debug = True
         mock_config.log_level = "DEBUG"
+        mock_config.workers = 1
         
         # Call main function
         api_server.main()
@@ -75,6 +78,7 @@ class TestAPIServer(unittest.TestCase):
             host="0.0.0.0",
             port=9000,
             reload=True,
+            workers=1,
             log_level="debug"
         )
 
@@ -88,6 +92,7 @@ class TestAPIServer(unittest.TestCase):
         mock_config.port = 8000
         mock_config.debug = False
         mock_config.log_level = "WARNING"
+        mock_config.workers = 1
         
         # Call main function
         api_server.main()
@@ -98,9 +103,41 @@ class TestAPIServer(unittest.TestCase):
             host="127.0.0.1",
             port=8000,
             reload=False,
+            workers=1,
             log_level="warning"
         )
 
+    @patch('api_server.uvicorn.run')
+    @patch('api_server.config')
+    @patch('builtins.print')
+    def test_main_function_multiple_workers(self, mock_print, mock_config, mock_uvicorn_run):
+        """Test main function passes worker count and warns without shared job store"""
+        # Setup mock config
+        mock_config.host = "0.0.0.0"
+        mock_config.port = 8000
+        mock_config.debug = False
+        mock_config.log_level = "INFO"
+        mock_config.workers = 4
+        mock_config.job_store = "file"
+
+        # Call main function
+        api_server.main()
+
+        # Verify warning about unshared job state
+        mock_print.assert_any_call(
+            "Warning: multiple workers without SOGON_JOB_STORE=redis will not share job state"
+        )
+
+        # Verify uvicorn.run was called with worker count
+        mock_uvicorn_run.assert_called_once_with(
+            "sogon.api.main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=False,
+            workers=4,
+            log_level="info"
+        )
+
     @patch('api_server.main')
     def test_main_execution_when_run_as_script(self, mock_main):
         """Test that main() is called when script is executed directly"""
@@ -133,6 +170,7 @@ class TestAPIServer(unittest.TestCase):
         mock_config.port = 8000
         mock_config.debug = False
         mock_config.log_level = "INFO"
+        mock_config.workers = 1
         
         # Make uvicorn.run raise an exception
         mock_uvicorn_run.side_effect = Exception("Test exception")
@@ -4,7 +4,7 @@ Tests for transcriber module
 
 import pytest
 from unittest.mock import Mock, patch, mock_open
-from sogon.transcriber import transcribe_audio, _convert_to_dict, _adjust_timestamps
+from sogon.transcriber import transcribe_audio, _convert_to_dict, _adjust_timestamps, _get_client
 
 
 class MockResponse:
@@ -20,6 +20,22 @@ class MockResponse:
 class TestTranscriberResponseHandling:
     """Test response handling edge cases"""
 
+    @pytest.fixture(autouse=True)
+    def clear_client_cache(self):
+        """Make each test build its client from the patched OpenAI class"""
+        _get_client.cache_clear()
+        yield
+        _get_client.cache_clear()
+
+    @patch('sogon.transcriber.OpenAI')
+    def test_client_is_reused_per_credentials(self, mock_openai):
+        """Test that clients are shared per api_key and base_url"""
+        mock_openai.side_effect = lambda **kwargs: Mock()
+
+        assert _get_client("key", None) is _get_client("key", None)
+        assert _get_client("key", "https://example.com/v1") is not _get_client("key", None)
+        assert mock_openai.call_count == 2
+
     @patch('sogon.transcriber.OpenAI')
     @patch('sogon.transcriber.split_audio_by_size')
     def test_none_segments_handling(self, mock_split, mock_openai):
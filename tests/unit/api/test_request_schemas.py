@@ -0,0 +1,36 @@
+"""
+Tests for API request schemas.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from sogon.api.schemas.requests import CreateJobRequest
+
+
+class TestCreateJobRequest:
+    """Tests for CreateJobRequest validation."""
+
+    def test_translation_requires_target_language(self):
+        """Test that enabling translation without a target language is rejected."""
+        with pytest.raises(ValidationError, match="translation_target_language is required"):
+            CreateJobRequest(url="https://www.youtube.com/watch?v=test", enable_translation=True)
+
+    def test_language_codes_are_lowercased(self):
+        """Test that language codes are normalized to lowercase."""
+        request = CreateJobRequest(
+            url="https://www.youtube.com/watch?v=test",
+            enable_translation=True,
+            translation_target_language="ZH-CN",
+            whisper_source_language="KO"
+        )
+
+        assert request.translation_target_language == "zh-cn"
+        assert request.whisper_source_language == "ko"
+
+    def test_target_language_optional_without_translation(self):
+        """Test that translation fields may be omitted when translation is disabled."""
+        request = CreateJobRequest(url="https://www.youtube.com/watch?v=test")
+
+        assert request.enable_translation is False
+        assert request.translation_target_language is None
@@ -0,0 +1,108 @@
+"""
+Tests for RedisJobQueue - FIFO job queue shared across processes.
+"""
+
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from sogon.queue.factory import create_queue  # noqa: E402
+from sogon.queue.redis_queue import RedisJobQueue  # noqa: E402
+
+
+class TestRedisJobQueue:
+    """Tests for RedisJobQueue class."""
+
+    @pytest.fixture
+    def queue(self):
+        """Create a queue backed by an in-process fake Redis server."""
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        return RedisJobQueue(max_size=3, block_timeout=0.1, client=client)
+
+    async def test_fifo_order(self, queue):
+        """Test that jobs are dequeued in enqueue order."""
+        for job_id in ("a", "b", "c"):
+            assert await queue.enqueue(job_id) is True
+
+        assert await queue.peek() == "a"
+        assert [await queue.dequeue() for _ in range(3)] == ["a", "b", "c"]
+
+    async def test_dequeue_empty_returns_none(self, queue):
+        """Test that dequeue returns None after block_timeout on empty queue."""
+        assert await queue.dequeue() is None
+
+    async def test_rejects_when_full(self, queue):
+        """Test backpressure at max_size."""
+        for job_id in ("a", "b", "c"):
+            await queue.enqueue(job_id)
+
+        assert await queue.is_full() is True
+        assert await queue.enqueue("d") is False
+        assert await queue.size() == 3
+
+    async def test_cancelled_jobs_are_skipped(self, queue):
+        """Test that cancelled jobs are not returned by dequeue."""
+        await queue.enqueue("a")
+        await queue.enqueue("b")
+        await queue.cancel("a")
+
+        assert await queue.dequeue() == "b"
+        assert await queue.is_empty() is True
+
+    async def test_dequeued_job_is_held_until_complete(self, queue):
+        """Test that a dequeued job stays in the processing list until completed."""
+        await queue.enqueue("a")
+
+        assert await queue.dequeue() == "a"
+        assert await queue._redis.lrange(queue._processing_key, 0, -1) == ["a"]
+
+        await queue.complete("a")
+        assert await queue._redis.lrange(queue._processing_key, 0, -1) == []
+
+    async def test_unfinished_jobs_are_requeued_for_same_consumer(self, queue):
+        """Test that jobs held by a crashed consumer are handed out again on restart."""
+        client = queue._redis
+        crashed = RedisJobQueue(block_timeout=0.1, client=client, consumer="worker-1")
+        await crashed.enqueue("a")
+        await crashed.enqueue("b")
+        assert await crashed.dequeue() == "a"
+
+        restarted = RedisJobQueue(block_timeout=0.1, client=client, consumer="worker-1")
+
+        assert await restarted.dequeue() == "a"
+        assert await restarted.dequeue() == "b"
+
+    async def test_cancelled_ids_are_removed(self, queue):
+        """Test that cancelled IDs don't accumulate once jobs are skipped or completed."""
+        await queue.enqueue("a")
+        await queue.enqueue("b")
+        await queue.cancel("a")
+        assert await queue.dequeue() == "b"
+        await queue.cancel("b")
+        await queue.complete("b")
+
+        assert await queue._redis.smembers(queue._cancelled_key) == set()
+        assert await queue._redis.lrange(queue._processing_key, 0, -1) == []
+
+    async def test_concurrent_enqueues_respect_max_size(self, queue):
+        """Test that racing enqueues never push the queue past max_size."""
+        results = await asyncio.gather(*(queue.enqueue(str(i)) for i in range(10)))
+
+        assert results.count(True) == 3
+        assert await queue.size() == 3
+
+    async def test_clear(self, queue):
+        """Test that clear removes all jobs and reports the count."""
+        await queue.enqueue("a")
+        await queue.enqueue("b")
+
+        assert await queue.clear() == 2
+        assert await queue.size() == 0
+
+
+def test_factory_requires_redis_url():
+    """Test that the factory validates Redis configuration."""
+    with pytest.raises(ValueError, match="redis_url"):
+        create_queue("redis")
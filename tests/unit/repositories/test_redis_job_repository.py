@@ -0,0 +1,156 @@
+"""
+Tests for RedisJobRepository - job persistence backed by Redis hashes.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from sogon.models.job import ProcessingJob, JobStatus, JobType  # noqa: E402
+from sogon.repositories.redis_job_repository import RedisJobRepository  # noqa: E402
+
+
+def make_job(job_id: str, status: JobStatus = JobStatus.PENDING, age_minutes: int = 0) -> ProcessingJob:
+    """Create a job with a deterministic creation time."""
+    job = ProcessingJob(
+        id=job_id,
+        job_type=JobType.YOUTUBE_URL,
+        input_path="https://www.youtube.com/watch?v=test",
+        output_directory="./result",
+        status=status,
+    )
+    job.created_at = datetime.now() - timedelta(minutes=age_minutes)
+    return job
+
+
+class TestRedisJobRepository:
+    """Tests for RedisJobRepository class."""
+
+    @pytest.fixture
+    def repository(self):
+        """Create a repository backed by an in-process fake Redis server."""
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        return RedisJobRepository(client=client)
+
+    async def test_save_and_get_job_round_trip(self, repository):
+        """Test that a saved job is restored with the same fields."""
+        job = make_job("job-1")
+        job.original_files = {"subtitle": "/tmp/out.srt"}
+        job.metadata = {"title": "테스트"}
+
+        assert await repository.save_job(job) is True
+
+        loaded = await repository.get_job("job-1")
+        assert loaded is not None
+        assert loaded.id == "job-1"
+        assert loaded.job_type == JobType.YOUTUBE_URL
+        assert loaded.status == JobStatus.PENDING
+        assert loaded.created_at == job.created_at
+        assert loaded.original_files == {"subtitle": "/tmp/out.srt"}
+        assert loaded.metadata == {"title": "테스트"}
+
+    async def test_get_missing_job_returns_none(self, repository):
+        """Test that unknown job IDs return None."""
+        assert await repository.get_job("missing") is None
+
+    async def test_update_job_status(self, repository):
+        """Test status update of existing and missing jobs."""
+        await repository.save_job(make_job("job-1"))
+
+        assert await repository.update_job_status("job-1", JobStatus.TRANSCRIBING) is True
+        assert (await repository.get_job("job-1")).status == JobStatus.TRANSCRIBING
+        assert await repository.update_job_status("missing", JobStatus.FAILED) is False
+
+    async def test_list_jobs_newest_first_with_pagination(self, repository):
+        """Test that list_jobs sorts by created_at descending and paginates."""
+        for i in range(5):
+            await repository.save_job(make_job(f"job-{i}", age_minutes=i))
+
+        first_page = await repository.list_jobs(limit=2, offset=0)
+        second_page = await repository.list_jobs(limit=2, offset=2)
+
+        assert [j.id for j in first_page] == ["job-0", "job-1"]
+        assert [j.id for j in second_page] == ["job-2", "job-3"]
+
+    async def test_list_jobs_filters_by_status(self, repository):
+        """Test status filtering in list_jobs and get_jobs_by_status."""
+        await repository.save_job(make_job("done", JobStatus.COMPLETED, age_minutes=1))
+        await repository.save_job(make_job("pending", JobStatus.PENDING, age_minutes=2))
+
+        completed = await repository.list_jobs(status=JobStatus.COMPLETED)
+        pending = await repository.get_jobs_by_status(JobStatus.PENDING)
+
+        assert [j.id for j in completed] == ["done"]
+        assert [j.id for j in pending] == ["pending"]
+
+    async def test_delete_job_removes_hash_and_index(self, repository):
+        """Test that delete removes the job from lookups and listings."""
+        await repository.save_job(make_job("job-1"))
+
+        assert await repository.delete_job("job-1") is True
+        assert await repository.get_job("job-1") is None
+        assert await repository.list_jobs() == []
+
+    async def test_cleanup_old_jobs(self, repository):
+        """Test that only old terminal jobs are removed."""
+        old = make_job("old", JobStatus.COMPLETED)
+        old.completed_at = datetime.now() - timedelta(days=10)
+        recent = make_job("recent", JobStatus.COMPLETED)
+        recent.completed_at = datetime.now()
+        await repository.save_job(old)
+        await repository.save_job(recent)
+        await repository.save_job(make_job("active", JobStatus.TRANSCRIBING))
+
+        assert await repository.cleanup_old_jobs(days=7) == 1
+        assert await repository.get_job("old") is None
+        assert await repository.get_job("recent") is not None
+        assert await repository.get_job("active") is not None
+
+    async def test_finished_jobs_expire_when_ttl_set(self):
+        """Test that terminal jobs get a TTL and active jobs do not."""
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        repository = RedisJobRepository(client=client, job_ttl_seconds=3600)
+        await repository.save_job(make_job("done", JobStatus.COMPLETED))
+        await repository.save_job(make_job("active", JobStatus.TRANSCRIBING))
+
+        assert 0 < await client.ttl("job:done") <= 3600
+        assert await client.ttl("job:active") == -1
+
+    async def test_update_to_terminal_status_applies_ttl(self):
+        """Test that a status update to a terminal state sets the job TTL."""
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        repository = RedisJobRepository(client=client, job_ttl_seconds=3600)
+        await repository.save_job(make_job("job-1", JobStatus.TRANSCRIBING))
+
+        assert await repository.update_job_status("job-1", JobStatus.SAVING) is True
+        assert await client.ttl("job:job-1") == -1
+        assert await repository.update_job_status("job-1", JobStatus.FAILED) is True
+        assert 0 < await client.ttl("job:job-1") <= 3600
+
+    async def test_update_job_status_does_not_recreate_deleted_job(self, repository):
+        """Test that updating a deleted job leaves no partial hash behind."""
+        await repository.save_job(make_job("job-1"))
+        await repository.delete_job("job-1")
+
+        assert await repository.update_job_status("job-1", JobStatus.COMPLETED) is False
+        assert await repository._redis.exists("job:job-1") == 0
+
+    async def test_update_job_status_failure_returns_false(self):
+        """Test that Redis errors are logged and reported as a failed update."""
+        client = fakeredis.FakeAsyncRedis(decode_responses=True, connected=False)
+        repository = RedisJobRepository(client=client)
+
+        assert await repository.update_job_status("job-1", JobStatus.COMPLETED) is False
+
+    async def test_get_stats_counts_by_status(self, repository):
+        """Test repository statistics."""
+        await repository.save_job(make_job("a", JobStatus.COMPLETED))
+        await repository.save_job(make_job("b", JobStatus.COMPLETED))
+        await repository.save_job(make_job("c", JobStatus.FAILED))
+
+        stats = await repository.get_stats()
+
+        assert stats["total_jobs"] == 3
+        assert stats["status_counts"] == {"completed": 2, "failed": 1}
+        assert stats["backend"] == "redis"
@@ -0,0 +1,27 @@
+"""
+Unit tests for lazy service exports in sogon.services.
+"""
+
+import pytest
+
+import sogon.services as services
+from sogon.services.youtube_service import YouTubeServiceImpl
+
+
+class TestLazyExports:
+    """Tests for the PEP 562 module __getattr__."""
+
+    def test_resolves_implementation_and_caches_it(self):
+        """Test that an implementation resolves to its class and is cached in the module dict."""
+        assert services.YouTubeServiceImpl is YouTubeServiceImpl
+        assert vars(services)["YouTubeServiceImpl"] is YouTubeServiceImpl
+
+    def test_all_exports_resolve(self):
+        """Test that every name in __all__ is importable."""
+        for name in services.__all__:
+            assert getattr(services, name) is not None
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test that unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            services.MissingServiceImpl
@@ -0,0 +1,80 @@
+"""
+Unit tests for TranslationServiceImpl retries and batching.
+"""
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from openai import BadRequestError, RateLimitError
+
+from sogon.models.translation import SupportedLanguage, TranslationResult
+from sogon.services.translation_service import TranslationServiceImpl
+
+
+def _api_error(error_cls, status_code):
+    """Build an openai API error with a minimal HTTP response."""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status_code, request=request)
+    return error_cls("error", response=response, body=None)
+
+
+@pytest.fixture
+def service():
+    """Create a translation service with a mocked completions endpoint."""
+    service = TranslationServiceImpl(api_key="test-key")
+    service.client = MagicMock()
+    service.client.chat.completions.create = AsyncMock()
+    return service
+
+
+class TestTranslateSingleText:
+    """Tests for _translate_single_text retries."""
+
+    async def test_retries_rate_limit_errors(self, service):
+        """Test that a 429 is retried with backoff before succeeding."""
+        response = MagicMock()
+        response.choices[0].message.content = " annyeong "
+        service.client.chat.completions.create.side_effect = [
+            _api_error(RateLimitError, 429),
+            response,
+        ]
+
+        with patch("sogon.services.translation_service.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            result = await service._translate_single_text("hello", SupportedLanguage.KOREAN, "en")
+
+        assert result.translated_text == "annyeong"
+        assert service.client.chat.completions.create.await_count == 2
+        mock_sleep.assert_awaited_once()
+
+    async def test_does_not_retry_client_errors(self, service):
+        """Test that a 400 fails on the first attempt."""
+        service.client.chat.completions.create.side_effect = _api_error(BadRequestError, 400)
+
+        with patch("sogon.services.translation_service.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            with pytest.raises(BadRequestError):
+                await service._translate_single_text("hello", SupportedLanguage.KOREAN, "en")
+
+        assert service.client.chat.completions.create.await_count == 1
+        mock_sleep.assert_not_awaited()
+
+
+class TestTranslateBatch:
+    """Tests for translate_batch."""
+
+    async def test_duplicate_texts_are_translated_once(self, service):
+        """Test that repeated texts share one translation call."""
+        async def translate(text, target_language, source_language):
+            return TranslationResult(
+                original_text=text,
+                translated_text=text.upper(),
+                source_language=source_language,
+                target_language=target_language,
+            )
+
+        with patch.object(service, "_translate_single_text", side_effect=translate) as mock_translate:
+            results = await service.translate_batch(
+                ["hi", "bye", "hi", "hi"], SupportedLanguage.KOREAN, "en"
+            )
+
+        assert [result.translated_text for result in results] == ["HI", "BYE", "HI", "HI"]
+        assert mock_translate.call_count == 2
@@ -0,0 +1,96 @@
+"""
+Unit tests for WorkflowServiceImpl background job tracking.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from sogon.models.audio import AudioFile
+from sogon.models.job import JobStatus, JobType, ProcessingJob
+from sogon.models.transcription import TranscriptionResult, TranscriptionSegment
+from sogon.models.translation import SupportedLanguage, TranslationResult
+from sogon.repositories.file_repository import FileRepositoryImpl
+from sogon.services.file_service import FileServiceImpl
+from sogon.services.workflow_service import WorkflowServiceImpl
+
+
+@pytest.fixture
+def workflow_service():
+    """Create a workflow service with mocked collaborators."""
+    return WorkflowServiceImpl(
+        audio_service=MagicMock(),
+        transcription_service=MagicMock(),
+        youtube_service=MagicMock(),
+        file_service=MagicMock(),
+    )
+
+
+class TestProcessAudioFile:
+    """Tests for WorkflowServiceImpl output writing."""
+
+    async def test_writes_original_and_translated_outputs(self, tmp_path):
+        """Test that original and translated file sets are both written and recorded."""
+        transcription = TranscriptionResult(
+            text="hello",
+            language="en",
+            duration=1.0,
+            segments=[TranscriptionSegment(id=1, text="hello", start=0.0, end=1.0)],
+        )
+        translation = TranslationResult(
+            original_text="hello",
+            translated_text="안녕",
+            source_language="en",
+            target_language=SupportedLanguage.KOREAN,
+        )
+        audio_file = AudioFile(path=tmp_path / "a.mp3", duration_seconds=1.0, size_bytes=1, format="mp3")
+
+        audio_service = MagicMock()
+        audio_service.split_audio = AsyncMock(return_value=[audio_file])
+        transcription_service = MagicMock()
+        transcription_service.transcribe_audio = AsyncMock(return_value=transcription)
+        translation_service = MagicMock()
+        translation_service.translate_transcription = AsyncMock(return_value=translation)
+
+        service = WorkflowServiceImpl(
+            audio_service=audio_service,
+            transcription_service=transcription_service,
+            youtube_service=MagicMock(),
+            file_service=FileServiceImpl(FileRepositoryImpl(), tmp_path),
+            translation_service=translation_service,
+        )
+        job = ProcessingJob(
+            job_type=JobType.LOCAL_FILE,
+            input_path=str(audio_file.path),
+            output_directory=str(tmp_path),
+            subtitle_format="txt",
+            enable_translation=True,
+            translation_target_language="ko",
+        )
+        job.actual_output_dir = str(tmp_path)
+
+        await service._process_audio_file(job, audio_file, "a")
+
+        assert set(job.original_files) == {"subtitle", "timestamps", "metadata"}
+        assert set(job.translated_files) == {"subtitle", "timestamps", "metadata"}
+        assert (tmp_path / "a.txt").read_text(encoding="utf-8") == "hello"
+        assert (tmp_path / "a_translated.txt").read_text(encoding="utf-8") == "안녕"
+
+
+class TestWaitForJob:
+    """Tests for WorkflowServiceImpl.wait_for_job."""
+
+    async def test_returns_terminal_status_of_background_job(self, workflow_service, tmp_path):
+        """Test that waiting returns once the background workflow finishes."""
+        job = await workflow_service.process_local_file(
+            file_path=tmp_path / "missing.mp3",
+            output_dir=tmp_path,
+        )
+
+        status = await workflow_service.wait_for_job(job.id)
+
+        assert status == JobStatus.FAILED
+        assert "File not found" in job.error_message
+
+    async def test_unknown_job_returns_not_found(self, workflow_service):
+        """Test that waiting on an unknown job returns immediately."""
+        assert await workflow_service.wait_for_job("unknown") == JobStatus.NOT_FOUND
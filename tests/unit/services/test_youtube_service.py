@@ -0,0 +1,79 @@
+"""
+Unit tests for YouTubeServiceImpl download caching.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from sogon.services.youtube_service import YouTubeServiceImpl
+
+
+@pytest.fixture
+def mock_ydl(tmp_path):
+    """Patch yt-dlp so a download writes the cached file for video 'abc'."""
+    cache_dir = tmp_path / "cache" / YouTubeServiceImpl.CACHE_SUBDIR
+
+    with patch("yt_dlp.YoutubeDL") as mock_ydl_cls:
+        ydl = mock_ydl_cls.return_value.__enter__.return_value
+        ydl.extract_info.return_value = {"id": "abc", "title": "Video", "ext": "webm"}
+        ydl.process_ie_result.side_effect = lambda info, download: (cache_dir / "abc.m4a").write_bytes(b"audio")
+        ydl.prepare_filename.side_effect = lambda info, outtmpl: outtmpl.replace("%(title)s", "Video").replace("%(ext)s", "webm")
+        yield ydl
+
+
+class TestDownloadAudioCache:
+    """Tests for download_audio with a cache directory."""
+
+    async def test_cached_audio_is_reused(self, tmp_path, mock_ydl):
+        """Test that a second download of the same video skips yt-dlp's download."""
+        service = YouTubeServiceImpl(cache_dir=tmp_path / "cache")
+        first_dir = tmp_path / "first"
+        second_dir = tmp_path / "second"
+        first_dir.mkdir()
+        second_dir.mkdir()
+
+        first = await service.download_audio("https://youtu.be/abc", first_dir)
+        second = await service.download_audio("https://youtu.be/abc", second_dir)
+
+        assert first.path == first_dir / "Video.m4a"
+        assert second.path == second_dir / "Video.m4a"
+        assert second.path.read_bytes() == b"audio"
+        mock_ydl.process_ie_result.assert_called_once()
+
+    async def test_least_recently_used_files_are_evicted(self, tmp_path, mock_ydl):
+        """Test that older cached files are removed once the size limit is exceeded."""
+        cache_dir = tmp_path / "cache"
+        audio_cache_dir = cache_dir / YouTubeServiceImpl.CACHE_SUBDIR
+        audio_cache_dir.mkdir(parents=True)
+        old = audio_cache_dir / "old.m4a"
+        old.write_bytes(b"x" * 1024)
+        os.utime(old, (0, 0))
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+
+        service = YouTubeServiceImpl(cache_dir=cache_dir, cache_max_size_gb=1024 / 1024 ** 3)
+        await service.download_audio("https://youtu.be/abc", output_dir)
+
+        assert not old.exists()
+        assert (audio_cache_dir / "abc.m4a").exists()
+
+    async def test_eviction_ignores_files_that_are_not_cache_entries(self, tmp_path, mock_ydl):
+        """Test that user files and in-flight downloads are never evicted."""
+        cache_dir = tmp_path / "cache"
+        audio_cache_dir = cache_dir / YouTubeServiceImpl.CACHE_SUBDIR
+        audio_cache_dir.mkdir(parents=True)
+        user_file = cache_dir / "song.m4a"
+        partial = audio_cache_dir / "xyz.webm.part"
+        for path in (user_file, partial):
+            path.write_bytes(b"x" * 1024)
+            os.utime(path, (0, 0))
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+
+        service = YouTubeServiceImpl(cache_dir=cache_dir, cache_max_size_gb=1 / 1024 ** 3)
+        await service.download_audio("https://youtu.be/abc", output_dir)
+
+        assert user_file.exists()
+        assert partial.exists()
@@ -0,0 +1,171 @@
+"""
+Tests for CLI batch processing.
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from typer.testing import CliRunner
+
+from sogon.cli import ServiceContainer, app, get_container, process_batch, process_input
+
+
+runner = CliRunner()
+
+
+class TestProcessBatch:
+    """Tests for process_batch worker pool."""
+
+    async def test_results_keep_input_order_and_respect_concurrency(self):
+        """Test that results follow input order and at most N inputs run at once."""
+        running = 0
+        peak = 0
+
+        async def fake_process_input(input_path, services, **options):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01 if input_path != "slow" else 0.03)
+            running -= 1
+            return input_path != "bad"
+
+        with patch("sogon.cli.process_input", side_effect=fake_process_input):
+            results = await process_batch(
+                ["slow", "a", "bad", "b", "c"], MagicMock(), concurrency=2, output_format="srt"
+            )
+
+        assert results == [("slow", True), ("a", True), ("bad", False), ("b", True), ("c", True)]
+        assert peak == 2
+
+
+class TestProcessInput:
+    """Tests for process_input model preloading."""
+
+    async def test_preload_is_not_started_for_invalid_input(self, tmp_path):
+        """Test that a missing file is rejected before any model load starts."""
+        preload = AsyncMock()
+        services = MagicMock()
+        services.youtube_service.is_valid_url.return_value = False
+        services.get_transcription_provider.return_value.preload = preload
+
+        result = await process_input(str(tmp_path / "missing.mp3"), services)
+
+        assert result is False
+        preload.assert_not_called()
+
+    async def test_preload_is_cancelled_when_processing_fails(self, tmp_path):
+        """Test that the preload task does not outlive an input whose processing fails."""
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"")
+
+        async def preload():
+            await asyncio.sleep(60)
+
+        services = MagicMock()
+        services.youtube_service.is_valid_url.return_value = False
+        services.get_transcription_provider.return_value.preload = preload
+        services.workflow_service.process_local_file = AsyncMock(side_effect=RuntimeError("boom"))
+
+        result = await process_input(str(audio_path), services)
+        await asyncio.sleep(0)
+
+        assert result is False
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+    async def test_missing_file_does_not_build_services(self, tmp_path):
+        """Test that a missing file is reported before the workflow services are constructed."""
+        built = []
+
+        class Container(ServiceContainer):
+            @property
+            def workflow_service(self):
+                built.append(True)
+                return MagicMock()
+
+        with patch("sogon.cli.get_provider", return_value=None):
+            result = await process_input(str(tmp_path / "missing.mp3"), Container())
+
+        assert result is False
+        assert built == []
+
+
+class TestRunBatchCommand:
+    """Tests for 'sogon run-batch' command."""
+
+    def test_missing_inputs_file(self, tmp_path):
+        """Test that a missing inputs file is reported."""
+        result = runner.invoke(app, ["run-batch", str(tmp_path / "missing.txt")])
+
+        assert result.exit_code == 1
+        assert "Inputs file not found" in result.output
+
+    def test_empty_inputs_file(self, tmp_path):
+        """Test that a file with only comments and blank lines is rejected."""
+        inputs_file = tmp_path / "inputs.txt"
+        inputs_file.write_text("# nothing here\n\n")
+
+        result = runner.invoke(app, ["run-batch", str(inputs_file)])
+
+        assert result.exit_code == 1
+        assert "No inputs found" in result.output
+
+    def test_runs_on_shared_loop_and_closes_it(self, tmp_path):
+        """Test that inputs run on the loop created by the app callback, which is closed on exit."""
+        inputs_file = tmp_path / "inputs.txt"
+        inputs_file.write_text("a.mp3\n")
+        loops = []
+        thread_names = []
+
+        async def fake_process_input(input_path, services, **options):
+            loops.append(asyncio.get_running_loop())
+            thread_names.append(await asyncio.to_thread(lambda: threading.current_thread().name))
+            return True
+
+        with patch("sogon.cli.process_input", side_effect=fake_process_input), \
+                patch("sogon.cli.setup_logging"):
+            result = runner.invoke(app, ["run-batch", str(inputs_file)])
+
+        assert result.exit_code == 0
+        assert "Completed 1/1 inputs" in result.output
+        assert len(loops) == 1
+        assert loops[0].is_closed()
+        assert thread_names[0].startswith("sogon-io")
+
+
+class TestServiceContainer:
+    """Tests for ServiceContainer provider resolution."""
+
+    def test_provider_resolved_once_even_when_none(self):
+        """Test that an API provider (None) is not re-resolved on every call."""
+        with patch("sogon.cli.get_provider", return_value=None) as get_provider:
+            services = ServiceContainer()
+            assert services.get_transcription_provider() is None
+            assert services.get_transcription_provider() is None
+
+        get_provider.assert_called_once()
+
+
+class TestRunCommand:
+    """Tests for 'sogon run' command."""
+
+    def test_overrides_do_not_leak_into_shared_container(self):
+        """Test that CLI overrides get their own container instead of mutating the cached one."""
+        shared = get_container()
+        shared_settings = shared.settings
+        used = []
+
+        async def fake_process_input(input_path, services, **options):
+            used.append(services)
+            return True
+
+        with patch("sogon.cli.process_input", side_effect=fake_process_input), \
+                patch("sogon.cli.get_provider", return_value=None), \
+                patch("sogon.cli.setup_logging"):
+            result = runner.invoke(app, ["run", "a.mp3", "--local-device", "cpu"])
+
+        assert result.exit_code == 0
+        assert used[0] is not shared
+        assert used[0].settings.local_device == "cpu"
+        assert shared.settings is shared_settings
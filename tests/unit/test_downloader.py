@@ -0,0 +1,264 @@
+"""
+Tests for the downloader module.
+"""
+
+import json
+import subprocess
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from sogon.downloader import (
+    _make_temp_dir,
+    _probe,
+    download_youtube_audio,
+    probe_audio,
+    remove_chunk_dir,
+    split_audio_by_size,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_probe_cache():
+    """Keep cached ffprobe results from leaking between tests."""
+    _probe.cache_clear()
+    yield
+    _probe.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def disk_tempdir(tmp_path, monkeypatch):
+    """Keep chunk files out of the real /dev/shm."""
+    monkeypatch.setattr("sogon.downloader._SHM_DIR", str(tmp_path / "missing-shm"))
+
+
+def _fake_run(failing_chunk=None, copy_ok=False, copy_chunk_size=1024):
+    """Build a subprocess.run stand-in for ffprobe/ffmpeg."""
+
+    def run(cmd, **kwargs):
+        if cmd[0] == "ffprobe":
+            return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps({"format": {"duration": "100.0"}}))
+        if "segment" in cmd:
+            if not copy_ok:
+                raise subprocess.CalledProcessError(1, cmd, output="", stderr="copy failed")
+            num_chunks = len(cmd[cmd.index("-segment_times") + 1].split(",")) + 1
+            for i in range(1, num_chunks + 1):
+                Path(cmd[-1].replace("%d", str(i))).write_bytes(b"\0" * copy_chunk_size)
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+        chunk_path = cmd[-1]
+        if failing_chunk and chunk_path.endswith(f"_chunk_{failing_chunk}.mp3"):
+            raise subprocess.CalledProcessError(1, cmd, output="", stderr="boom")
+        Path(chunk_path).write_bytes(b"chunk")
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    return run
+
+
+class TestSplitAudioBySize:
+    """Tests for split_audio_by_size."""
+
+    def test_chunks_are_returned_in_order(self, tmp_path):
+        """Test that concurrently exported chunks come back in time order."""
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"\0" * 4 * 1024 * 1024)
+
+        with patch("subprocess.run", side_effect=_fake_run()) as mock_run:
+            chunks = split_audio_by_size(str(audio_path), max_chunk_size_mb=1)
+
+        assert [Path(chunk).name for chunk in chunks] == [f"audio_chunk_{i}.mp3" for i in range(1, 5)]
+        seeks = sorted(float(call.args[0][3]) for call in mock_run.call_args_list[2:])
+        assert seeks == [0.0, 25.0, 50.0, 75.0]
+
+    def test_failed_chunk_is_skipped(self, tmp_path):
+        """Test that a failing ffmpeg call drops only that chunk."""
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"\0" * 4 * 1024 * 1024)
+
+        with patch("subprocess.run", side_effect=_fake_run(failing_chunk=2)):
+            chunks = split_audio_by_size(str(audio_path), max_chunk_size_mb=1)
+
+        assert [Path(chunk).name for chunk in chunks] == ["audio_chunk_1.mp3", "audio_chunk_3.mp3", "audio_chunk_4.mp3"]
+
+    def test_stream_copy_split_in_one_pass(self, tmp_path):
+        """Test that chunks are stream-copied with one ffmpeg call at equal cut points."""
+        audio_path = tmp_path / "audio.m4a"
+        audio_path.write_bytes(b"\0" * 4 * 1024 * 1024)
+
+        with patch("subprocess.run", side_effect=_fake_run(copy_ok=True)) as mock_run:
+            chunks = split_audio_by_size(str(audio_path), max_chunk_size_mb=1)
+
+        assert [Path(chunk).name for chunk in chunks] == [f"audio_chunk_{i}.m4a" for i in range(1, 5)]
+        assert mock_run.call_count == 2
+        cmd = mock_run.call_args.args[0]
+        assert cmd[cmd.index("-c") + 1] == "copy"
+        assert cmd[cmd.index("-segment_times") + 1] == "25.000,50.000,75.000"
+
+    def test_oversized_copied_chunks_fall_back_to_reencoding(self, tmp_path):
+        """Test that copied chunks over the size limit are discarded and re-encoded."""
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"\0" * 4 * 1024 * 1024)
+
+        with patch("subprocess.run", side_effect=_fake_run(copy_ok=True, copy_chunk_size=2 * 1024 * 1024)) as mock_run:
+            chunks = split_audio_by_size(str(audio_path), max_chunk_size_mb=1)
+
+        assert [Path(chunk).read_bytes() for chunk in chunks] == [b"chunk"] * 4
+        assert mock_run.call_count == 6
+
+
+class TestRemoveChunkDir:
+    """Tests for remove_chunk_dir."""
+
+    def test_chunk_directory_is_removed(self, tmp_path):
+        """Test that the temporary directory holding split chunks is deleted."""
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"\0" * 4 * 1024 * 1024)
+
+        with patch("subprocess.run", side_effect=_fake_run()):
+            chunks = split_audio_by_size(str(audio_path), max_chunk_size_mb=1)
+
+        chunk_dir = Path(chunks[0]).parent
+        remove_chunk_dir(chunks)
+
+        assert not chunk_dir.exists()
+        assert audio_path.exists()
+
+    def test_unsplit_file_directory_is_kept(self, tmp_path):
+        """Test that the directory of an original, unsplit file is left alone."""
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"audio")
+
+        remove_chunk_dir([str(audio_path)])
+        remove_chunk_dir([])
+
+        assert audio_path.exists()
+
+
+class TestMakeTempDir:
+    """Tests for _make_temp_dir."""
+
+    @pytest.fixture(autouse=True)
+    def linux(self, monkeypatch):
+        monkeypatch.setattr("sogon.downloader.sys.platform", "linux")
+
+    def _statvfs(self, monkeypatch, free_bytes):
+        stat = SimpleNamespace(f_bavail=free_bytes // 4096, f_frsize=4096)
+        monkeypatch.setattr("sogon.downloader.os.statvfs", lambda path: stat)
+
+    def test_uses_shm_when_data_fits(self, tmp_path, monkeypatch):
+        """Test that tmpfs is chosen when it and RAM have room for the data."""
+        monkeypatch.setattr("sogon.downloader._SHM_DIR", str(tmp_path))
+        self._statvfs(monkeypatch, 10 * 1024**3)
+
+        with patch("psutil.virtual_memory", return_value=SimpleNamespace(available=10 * 1024**3)):
+            temp_dir = Path(_make_temp_dir(1024**3))
+
+        assert temp_dir.parent == tmp_path
+        assert temp_dir.name.startswith("sogon-")
+        assert temp_dir.is_dir()
+
+    def test_falls_back_when_shm_is_too_small(self, tmp_path, monkeypatch):
+        """Test that the default temp directory is used when tmpfs lacks room."""
+        monkeypatch.setattr("sogon.downloader._SHM_DIR", str(tmp_path))
+        self._statvfs(monkeypatch, 2 * 1024**3)
+
+        with patch("psutil.virtual_memory", return_value=SimpleNamespace(available=10 * 1024**3)):
+            temp_dir = Path(_make_temp_dir(1024**3))
+
+        assert str(temp_dir.parent) == tempfile.gettempdir()
+        temp_dir.rmdir()
+
+    def test_falls_back_when_shm_dir_cannot_be_created(self, tmp_path, monkeypatch):
+        """Test that a failing mkdtemp in tmpfs falls back instead of failing the split."""
+        not_a_dir = tmp_path / "shm"
+        not_a_dir.write_bytes(b"")
+        monkeypatch.setattr("sogon.downloader._SHM_DIR", str(not_a_dir))
+        self._statvfs(monkeypatch, 10 * 1024**3)
+
+        with patch("psutil.virtual_memory", return_value=SimpleNamespace(available=10 * 1024**3)):
+            temp_dir = Path(_make_temp_dir(1024**3))
+
+        assert str(temp_dir.parent) == tempfile.gettempdir()
+        temp_dir.rmdir()
+
+
+class TestProbeAudio:
+    """Tests for probe_audio."""
+
+    def test_probe_is_cached_until_file_changes(self, tmp_path):
+        """Test that ffprobe runs once per file version."""
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"abc")
+
+        with patch("subprocess.run", side_effect=_fake_run()) as mock_run:
+            first = probe_audio(str(audio_path))
+            assert probe_audio(str(audio_path)) is first
+            assert mock_run.call_count == 1
+
+            audio_path.write_bytes(b"abcdef")
+            probe_audio(str(audio_path))
+            assert mock_run.call_count == 2
+
+        assert first["format"]["duration"] == "100.0"
+
+
+class TestDownloadYoutubeAudio:
+    """Tests for download_youtube_audio."""
+
+    def test_returns_postprocessed_file_without_scanning(self, tmp_path):
+        """Test that the expected m4a path is used and metadata is fetched once."""
+        (tmp_path / "stale.m4a").write_bytes(b"old")
+        (tmp_path / "Video.m4a").write_bytes(b"new")
+
+        with patch("yt_dlp.YoutubeDL") as mock_ydl_cls:
+            ydl = mock_ydl_cls.return_value.__enter__.return_value
+            ydl.extract_info.return_value = {"title": "Video", "ext": "webm"}
+            ydl.prepare_filename.return_value = str(tmp_path / "Video.webm")
+
+            with patch("sogon.downloader.os.listdir") as mock_listdir:
+                path = download_youtube_audio("https://youtu.be/x", output_dir=str(tmp_path))
+
+        assert path == str(tmp_path / "Video.m4a")
+        ydl.extract_info.assert_called_once_with("https://youtu.be/x", download=True)
+        ydl.download.assert_not_called()
+        mock_listdir.assert_not_called()
+
+    def test_stale_files_are_not_returned(self, tmp_path):
+        """Test that leftovers from earlier downloads are never picked up."""
+        (tmp_path / "stale.m4a").write_bytes(b"old")
+        (tmp_path / "Video.mp3").write_bytes(b"new")
+
+        with patch("yt_dlp.YoutubeDL") as mock_ydl_cls:
+            ydl = mock_ydl_cls.return_value.__enter__.return_value
+            ydl.extract_info.return_value = {"title": "Video", "ext": "webm"}
+            ydl.prepare_filename.return_value = str(tmp_path / "Video.webm")
+
+            path = download_youtube_audio("https://youtu.be/x", output_dir=str(tmp_path))
+
+        assert path == str(tmp_path / "Video.mp3")
+
+    def test_missing_file_falls_back_to_safe_title(self, tmp_path):
+        """Test that unsafe characters are stripped from the fallback filename."""
+        with patch("yt_dlp.YoutubeDL") as mock_ydl_cls:
+            ydl = mock_ydl_cls.return_value.__enter__.return_value
+            ydl.extract_info.return_value = {"title": 'a<b>:"c/d\\e|f?g*', "ext": "webm"}
+            ydl.prepare_filename.return_value = str(tmp_path / "missing.webm")
+
+            path = download_youtube_audio("https://youtu.be/x", output_dir=str(tmp_path))
+
+        assert path == str(tmp_path / "abcdefg.mp3")
+
+    def test_concurrent_fragments_override(self, tmp_path):
+        """Test that the fragment concurrency is passed through to yt-dlp."""
+        with patch("yt_dlp.YoutubeDL") as mock_ydl_cls:
+            ydl = mock_ydl_cls.return_value.__enter__.return_value
+            ydl.extract_info.return_value = {"title": "Video", "ext": "m4a"}
+            ydl.prepare_filename.return_value = str(tmp_path / "Video.m4a")
+
+            download_youtube_audio("https://youtu.be/x", output_dir=str(tmp_path), concurrent_fragments=16)
+
+        ydl_opts = mock_ydl_cls.call_args.args[0]
+        assert ydl_opts["concurrent_fragment_downloads"] == 16
+        assert ydl_opts["buffersize"] == 65536
@@ -0,0 +1,149 @@
+"""
+Tests for Settings loading and user config application.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from sogon.config import settings as settings_module
+from sogon.config.settings import Settings, TranscriptionProvider, _apply_user_config
+
+
+class TestSettings:
+    """Tests for Settings field parsing."""
+
+    def test_output_base_dir_is_expanded_path(self):
+        """Test that output_base_dir is parsed once into an absolute Path."""
+        settings = Settings(output_base_dir="~/subtitles")
+
+        assert settings.output_base_dir == Path("~/subtitles").expanduser().resolve()
+
+    def test_default_directories_are_absolute(self):
+        """Test that the default directories are expanded and resolved."""
+        settings = Settings()
+
+        assert settings.output_base_dir.is_absolute()
+        assert settings.local_download_root == Path("~/.cache/sogon/models").expanduser().resolve()
+
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("translation_provider", "google"),
+            ("local_device", "tpu"),
+            ("local_compute_type", "bfloat16"),
+            ("audio_quality", "48k"),
+        ],
+    )
+    def test_literal_fields_reject_unknown_values(self, field, value):
+        """Test that string choice fields are checked by their Literal types."""
+        with pytest.raises(ValidationError, match="Input should be"):
+            Settings(**{field: value})
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("max_chunk_size_mb", 0),
+            ("local_beam_size", 11),
+            ("local_temperature", 1.5),
+            ("local_max_workers", 0),
+            ("local_cache_max_size_gb", 0),
+            ("youtube_concurrent_fragments", 0),
+        ],
+    )
+    def test_range_fields_reject_out_of_range_values(self, field, value):
+        """Test that numeric ranges are enforced by field constraints."""
+        with pytest.raises(ValidationError, match=field):
+            Settings(**{field: value})
+
+    def test_int_choices_accept_env_strings(self, monkeypatch):
+        """Test that int choice fields still coerce string values from the environment."""
+        monkeypatch.setenv("AUDIO_SAMPLE_RATE", "8000")
+
+        assert Settings().audio_sample_rate == 8000
+
+    @pytest.mark.parametrize("value", ["", "  "])
+    def test_empty_cache_dir_disables_cache(self, monkeypatch, value):
+        """Test that an empty YOUTUBE_CACHE_DIR leaves the cache off instead of using cwd."""
+        monkeypatch.setenv("YOUTUBE_CACHE_DIR", value)
+
+        assert Settings().youtube_cache_dir is None
+
+    def test_settings_are_frozen(self):
+        """Test that the shared settings instance cannot be mutated in place."""
+        settings = Settings()
+
+        with pytest.raises(ValidationError):
+            settings.log_level = "DEBUG"
+        assert settings.model_copy(update={"log_level": "DEBUG"}).log_level == "DEBUG"
+
+
+class TestApplyUserConfig:
+    """Tests for _apply_user_config."""
+
+    def _apply(self, values):
+        manager = MagicMock()
+        manager.get_all.return_value = values
+        with patch("sogon.config.user_config.get_user_config_manager", return_value=manager):
+            return _apply_user_config(Settings())
+
+    def test_user_values_are_validated(self):
+        """Test that user config values are parsed like loaded values."""
+        settings = self._apply({"output_base_dir": "./custom", "transcription_provider": "openai"})
+
+        assert settings.output_base_dir == Path("./custom").resolve()
+        assert settings.transcription_provider is TranscriptionProvider.OPENAI
+
+    def test_invalid_user_value_is_skipped(self):
+        """Test that an invalid entry keeps the default without dropping later keys."""
+        settings = self._apply({"log_level": "VERBOSE", "output_base_dir": "./custom"})
+
+        assert settings.log_level == "INFO"
+        assert settings.output_base_dir == Path("./custom").resolve()
+
+    def test_read_failure_is_not_retried(self, monkeypatch):
+        """Test that a failed user config read is cached until reload_settings."""
+        monkeypatch.setattr(settings_module, "_user_config_failed", False)
+        factory = MagicMock(side_effect=OSError("permission denied"))
+
+        with patch("sogon.config.user_config.get_user_config_manager", factory):
+            _apply_user_config(Settings())
+            _apply_user_config(Settings())
+
+        assert factory.call_count == 1
+        assert settings_module._user_config_failed is True
+
+
+class TestSettingsSources:
+    """Tests for settings source selection."""
+
+    def test_dotenv_file_is_read_when_present(self, tmp_path, monkeypatch):
+        """Test that values from an existing .env file are still applied."""
+        monkeypatch.delenv("OPENAI_MODEL", raising=False)
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".env").write_text("OPENAI_MODEL=gpt-test\n")
+
+        assert Settings().openai_model == "gpt-test"
+
+    def test_missing_dotenv_file_uses_defaults(self, tmp_path, monkeypatch):
+        """Test that settings load without a .env file."""
+        monkeypatch.delenv("OPENAI_MODEL", raising=False)
+        monkeypatch.chdir(tmp_path)
+
+        assert Settings().openai_model == "gpt-4o-mini"
+
+
+class TestMediaFormats:
+    """Tests for the shared audio/video format validator."""
+
+    def test_comma_separated_string_is_split(self):
+        """Test that a comma-separated string is split into a list."""
+        assert Settings(audio_formats="mp3, wav").audio_formats == ["mp3", "wav"]
+
+    def test_unsupported_formats_are_reported(self):
+        """Test that all unsupported formats are named in the error."""
+        with pytest.raises(ValueError, match="Unsupported video format: abc, xyz"):
+            Settings(video_formats=["mp4", "xyz", "abc"])
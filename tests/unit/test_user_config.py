@@ -2,6 +2,7 @@
 Tests for UserConfigManager - user configuration management with YAML persistence.
 """
 
+import os
 import pytest
 from pathlib import Path
 from unittest.mock import patch
@@ -11,6 +12,7 @@ import shutil
 from sogon.config.user_config import (
     UserConfigManager,
     CONFIGURABLE_KEYS,
+    KeySpec,
     get_user_config_manager,
     reload_user_config,
 )
@@ -121,6 +123,23 @@ class TestUserConfigManager:
         manager.reset()
         assert manager.get_all() == {}
 
+    def test_set_same_value_skips_write(self, manager):
+        """Test that setting an unchanged value does not rewrite the file."""
+        manager.set("log_level", "DEBUG")
+
+        with patch.object(manager, "_save") as mock_save:
+            manager.set("log_level", "debug")
+            manager.reset("output_base_dir")
+        mock_save.assert_not_called()
+
+    def test_save_leaves_no_temp_files(self, manager, temp_config_dir):
+        """Test that the atomic write replaces the config file in place."""
+        manager.set("log_level", "DEBUG")
+        manager.set("log_level", "ERROR")
+
+        assert [p.name for p in temp_config_dir.iterdir()] == ["config.yaml"]
+        assert UserConfigManager(config_dir=temp_config_dir).get("log_level") == "ERROR"
+
     def test_reset_unknown_key_raises_error(self, manager):
         """Test that resetting unknown key raises KeyError."""
         with pytest.raises(KeyError, match="Unknown configuration key"):
@@ -137,6 +156,14 @@ class TestUserConfigManager:
             "log_level": "DEBUG",
         }
 
+    def test_get_all_is_read_only(self, manager):
+        """Test that get_all returns a view that cannot modify the config."""
+        manager.set("log_level", "DEBUG")
+
+        with pytest.raises(TypeError):
+            manager.get_all()["log_level"] = "ERROR"
+        assert manager.get("log_level") == "DEBUG"
+
     def test_get_effective_value_returns_user_config(self, manager):
         """Test get_effective_value returns user config when set."""
         manager.set("output_base_dir", "/custom")
@@ -187,40 +214,42 @@ class TestUserConfigManager:
 class TestConfigurableKeys:
     """Tests for CONFIGURABLE_KEYS definition."""
 
-    def test_all_keys_have_required_fields(self):
-        """Test that all configurable keys have required fields."""
-        for key, info in CONFIGURABLE_KEYS.items():
-            assert "description" in info, f"{key} missing description"
-            assert "default" in info, f"{key} missing default"
-            assert "type" in info, f"{key} missing type"
+    def test_all_keys_are_specs(self):
+        """Test that all configurable keys are KeySpec entries."""
+        for key, spec in CONFIGURABLE_KEYS.items():
+            assert isinstance(spec, KeySpec), f"{key} is not a KeySpec"
+            assert spec.description, f"{key} missing description"
 
     def test_all_defaults_match_type(self):
         """Test that all defaults match their declared type."""
-        for key, info in CONFIGURABLE_KEYS.items():
-            default = info["default"]
-            expected_type = info["type"]
-            assert isinstance(default, expected_type), (
-                f"{key} default {default} is not {expected_type.__name__}"
+        for key, spec in CONFIGURABLE_KEYS.items():
+            assert isinstance(spec.default, spec.type), (
+                f"{key} default {spec.default} is not {spec.type.__name__}"
             )
 
     def test_choices_match_type(self):
         """Test that all choices match their declared type."""
-        for key, info in CONFIGURABLE_KEYS.items():
-            if "choices" in info:
-                expected_type = info["type"]
-                for choice in info["choices"]:
-                    assert isinstance(choice, expected_type), (
-                        f"{key} choice {choice} is not {expected_type.__name__}"
-                    )
+        for key, spec in CONFIGURABLE_KEYS.items():
+            for choice in spec.choices or ():
+                assert isinstance(choice, spec.type), (
+                    f"{key} choice {choice} is not {spec.type.__name__}"
+                )
 
     def test_min_max_only_for_numeric(self):
         """Test that min/max are only defined for numeric types."""
-        for key, info in CONFIGURABLE_KEYS.items():
-            if "min" in info or "max" in info:
-                assert info["type"] in (int, float), (
+        for key, spec in CONFIGURABLE_KEYS.items():
+            if spec.min is not None or spec.max is not None:
+                assert spec.type in (int, float), (
                     f"{key} has min/max but is not numeric type"
                 )
 
+    def test_string_choices_have_lower_map(self):
+        """Test that string choices get a precomputed case-insensitive map."""
+        spec = CONFIGURABLE_KEYS["log_level"]
+
+        assert spec.choices_lower_map["debug"] == "DEBUG"
+        assert CONFIGURABLE_KEYS["max_workers"].choices_lower_map is None
+
 
 class TestSingletonFunctions:
     """Tests for singleton accessor functions."""
@@ -233,13 +262,23 @@ class TestSingletonFunctions:
             manager2 = get_user_config_manager()
             assert manager1 is manager2
 
-    def test_reload_user_config_creates_new_instance(self):
-        """Test that reload_user_config creates new instance."""
-        with patch.object(UserConfigManager, '__init__', return_value=None):
-            manager1 = get_user_config_manager()
-            manager2 = reload_user_config()
-            # After reload, should be different instance
-            assert manager1 is not manager2
+    def test_reload_user_config_skips_unchanged_file(self, tmp_path):
+        """Test that reload_user_config only re-parses a file that changed."""
+        get_user_config_manager.cache_clear()
+        try:
+            with patch.object(UserConfigManager, "DEFAULT_CONFIG_DIR", tmp_path):
+                manager = get_user_config_manager()
+                manager.set("log_level", "DEBUG")
+
+                with patch.object(manager, "_load") as mock_load:
+                    assert reload_user_config() is manager
+                mock_load.assert_not_called()
+
+                (tmp_path / "config.yaml").write_text("log_level: ERROR\n")
+                os.utime(tmp_path / "config.yaml", (0, 0))
+                assert reload_user_config().get("log_level") == "ERROR"
+        finally:
+            get_user_config_manager.cache_clear()
 
 
 class TestEdgeCases:
@@ -270,6 +309,14 @@ class TestEdgeCases:
         manager = UserConfigManager(config_dir=temp_config_dir)
         assert manager.get_all() == {}
 
+    def test_load_non_mapping_yaml(self, temp_config_dir):
+        """Test that a YAML file that is not a mapping is ignored."""
+        config_path = temp_config_dir / "config.yaml"
+        config_path.write_text("- a\n- b\n")
+
+        manager = UserConfigManager(config_dir=temp_config_dir)
+        assert manager.get_all() == {}
+
     def test_invalid_bool_string_raises_error(self, temp_config_dir):
         """Test that invalid boolean string raises ValueError."""
         manager = UserConfigManager(config_dir=temp_config_dir)
@@ -281,3 +328,22 @@ class TestEdgeCases:
         manager = UserConfigManager(config_dir=temp_config_dir)
         with pytest.raises(ValueError, match="Cannot convert"):
             manager.set("max_workers", "not_a_number")
+
+    def test_missing_file_skips_parsing(self, temp_config_dir):
+        """Test that a missing config file is never opened."""
+        with patch("builtins.open") as mock_open:
+            manager = UserConfigManager(config_dir=temp_config_dir)
+            assert manager.get_all() == {}
+        mock_open.assert_not_called()
+
+    def test_get_all_picks_up_external_changes(self, temp_config_dir):
+        """Test that get_all re-reads the file only after it changes on disk."""
+        manager = UserConfigManager(config_dir=temp_config_dir)
+        manager.set("log_level", "DEBUG")
+
+        other = UserConfigManager(config_dir=temp_config_dir)
+        other.set("max_workers", 8)
+        # Make sure the mtime differs even on coarse-grained filesystems
+        os.utime(other.config_path, (0, 0))
+
+        assert manager.get_all() == {"log_level": "DEBUG", "max_workers": 8}
@@ -0,0 +1,39 @@
+"""
+Tests for transcription provider dispatch.
+"""
+
+import pytest
+
+from sogon.config import Settings, TranscriptionProvider
+from sogon.utils.provider_factory import get_transcription_provider
+
+
+class TestTranscriptionProvider:
+    """Tests for TranscriptionProvider parsing and dispatch."""
+
+    def test_settings_parse_provider_to_enum(self):
+        """Test that the provider string is parsed once into the enum."""
+        settings = Settings(transcription_provider="openai")
+
+        assert settings.transcription_provider is TranscriptionProvider.OPENAI
+        assert settings.transcription_provider == "openai"
+        assert str(settings.transcription_provider) == "openai"
+
+    def test_settings_reject_unknown_provider(self):
+        """Test that unknown providers are rejected at load time."""
+        with pytest.raises(ValueError, match="transcription_provider must be one of"):
+            Settings(transcription_provider="whisper-cpp")
+
+    @pytest.mark.parametrize("provider", ["groq", TranscriptionProvider.OPENAI])
+    def test_api_providers_use_legacy_flow(self, provider):
+        """Test that API providers dispatch to None, including unvalidated strings."""
+        settings = Settings().model_copy(update={"transcription_provider": provider})
+
+        assert get_transcription_provider(settings) is None
+
+    def test_unknown_provider_raises(self):
+        """Test that an unknown provider assigned after load raises ValueError."""
+        settings = Settings().model_copy(update={"transcription_provider": "whisper-cpp"})
+
+        with pytest.raises(ValueError, match="Unknown transcription provider"):
+            get_transcription_provider(settings)
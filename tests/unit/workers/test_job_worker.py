@@ -0,0 +1,57 @@
+"""
+Tests for JobWorker - background processing of queued jobs.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from sogon.queue.memory_queue import MemoryJobQueue
+from sogon.workers.job_worker import JobWorker
+
+
+class TestJobWorker:
+    """Tests for JobWorker class."""
+
+    async def test_processed_job_is_acknowledged(self):
+        """Test that the worker completes each job it dequeues."""
+        queue = MemoryJobQueue()
+        await queue.enqueue("job-1")
+        repository = AsyncMock()
+        repository.get_job.return_value = None
+        worker = JobWorker(queue=queue, job_repository=repository, workflow_service=None)
+
+        with patch.object(queue, "complete", wraps=queue.complete) as complete:
+            run = asyncio.create_task(worker.start())
+            await asyncio.wait_for(queue.join(), timeout=1.0)
+            await worker.stop()
+            await run
+
+        complete.assert_awaited_once_with("job-1")
+
+    async def test_slow_dequeue_is_not_cancelled(self):
+        """Test that a dequeue outlasting the shutdown poll interval still delivers its job."""
+        queue = AsyncMock()
+        delays = iter([1.2, 60])
+
+        async def slow_dequeue():
+            await asyncio.sleep(next(delays))
+            return "job-1"
+
+        queue.dequeue.side_effect = slow_dequeue
+        repository = AsyncMock()
+        repository.get_job.return_value = None
+        worker = JobWorker(queue=queue, job_repository=repository, workflow_service=None)
+
+        async def wait_for_completion():
+            while not queue.complete.await_count:
+                await asyncio.sleep(0.05)
+
+        run = asyncio.create_task(worker.start())
+        try:
+            await asyncio.wait_for(wait_for_completion(), timeout=3.0)
+        finally:
+            await worker.stop()
+            await run
+
+        queue.complete.assert_awaited_once_with("job-1")
+        assert queue.dequeue.call_count == 2